@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**bytecode.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines the Components modules bytecode compilation objects.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import py_compile
+
+import foundations.verbose
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "compile_file"]
+
+LOGGER = foundations.verbose.install_logger()
+
+
+def compile_file(files):
+    """
+    | Compiles given source file to bytecode.
+    | This definition is executed in :mod:`multiprocessing` module worker processes and thus reports errors
+        instead of raising them.
+
+    Usage::
+
+        >>> compile_file(("tests_component_a.py", None))
+        >>> compile_file(("tests_component_a.py", "/tmp/tests_component_a.pyc"))
+
+    :param files: Source file, bytecode file, defaults to the source file with a *.pyc* extension if None.
+    :type files: tuple
+    :return: Error message if compilation failed.
+    :rtype: unicode
+    """
+
+    source, target = files
+
+    LOGGER.debug("> Compiling '{0}' file.".format(source))
+
+    try:
+        py_compile.compile(source, cfile=target, doraise=True)
+    except (py_compile.PyCompileError, IOError, OSError) as error:
+        return "{0}: {1}".format(source, error)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**compiler.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines the Components modules bytecode compilation command line tool.
+
+**Others:**
+    Usage: manager_compile [-e rc] [-w 8] [-o bytecode] path [path ...]
+"""
+
+from __future__ import unicode_literals
+
+import argparse
+import sys
+
+import foundations.verbose
+import manager.exceptions
+from manager.components_manager import Manager
+from manager.globals.constants import Constants
+from manager.index import register_components
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "compile_components", "get_command_line_arguments", "main"]
+
+LOGGER = foundations.verbose.install_logger()
+
+
+def compile_components(paths,
+                       directory=None,
+                       extension="rc",
+                       ignored_directories=Constants.ignored_directories,
+                       maximum_depth=None,
+                       workers=None):
+    """
+    | Registers the Components from given paths and compiles their modules to bytecode.
+    | No module is compiled if any Component fails to register.
+
+    Usage::
+
+        >>> compile_components(("./manager/tests/tests_manager/resources/components/core",), workers=8)
+        True
+
+    :param paths: Paths to walk.
+    :type paths: tuple or list
+    :param directory: Bytecode files directory, the Components modules directories are used if None.
+    :type directory: unicode
+    :param extension: Components file extension.
+    :type extension: unicode
+    :param ignored_directories: Directories names or glob patterns not walked for Components files.
+    :type ignored_directories: tuple or list
+    :param maximum_depth: Maximum depth walked below each path, no limit if None.
+    :type maximum_depth: int
+    :param workers: Components modules are compiled concurrently using given processes count.
+    :type workers: int
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    components_manager = Manager(paths,
+                                 extension=extension,
+                                 ignored_directories=ignored_directories,
+                                 maximum_depth=maximum_depth)
+    if not register_components(components_manager):
+        return False
+
+    LOGGER.info("{0} | Compiling '{1}' Components modules.".format(compile_components.__name__,
+                                                                  len(components_manager)))
+
+    return components_manager.compile_components(workers, directory)
+
+
+def get_command_line_arguments():
+    """
+    Retrieves command line arguments.
+
+    :return: Namespace.
+    :rtype: Namespace
+    """
+
+    parser = argparse.ArgumentParser(add_help=False)
+
+    parser.add_argument("-h",
+                        "--help",
+                        action="help",
+                        help="'Displays this help message and exit.'")
+
+    parser.add_argument("paths",
+                        nargs="+",
+                        help="'Paths to walk.'")
+
+    parser.add_argument("-o",
+                        "--output",
+                        dest="output",
+                        help="'Bytecode files directory.'")
+
+    parser.add_argument("-e",
+                        "--extension",
+                        dest="extension",
+                        default="rc",
+                        help="'Components file extension.'")
+
+    parser.add_argument("-d",
+                        "--maximum_depth",
+                        type=int,
+                        dest="maximum_depth",
+                        help="'Maximum depth walked below each path.'")
+
+    parser.add_argument("-w",
+                        "--workers",
+                        type=int,
+                        dest="workers",
+                        help="'Components modules compilation processes count.'")
+
+    return parser.parse_args([argument.decode(sys.getfilesystemencoding() or Constants.default_codec)
+                              if isinstance(argument, str) else argument for argument in sys.argv[1:]])
+
+
+def main():
+    """
+    Starts the Components modules compilation.
+
+    :return: Exit status.
+    :rtype: int
+    """
+
+    args = get_command_line_arguments()
+
+    try:
+        success = compile_components(args.paths,
+                                     args.output,
+                                     extension=args.extension,
+                                     maximum_depth=args.maximum_depth,
+                                     workers=args.workers)
+    except manager.exceptions.ComponentModuleError as error:
+        LOGGER.critical("!> {0} | {1}".format(main.__name__, error))
+        success = False
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
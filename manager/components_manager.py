@@ -16,21 +16,48 @@
 
 from __future__ import unicode_literals
 
+import Queue
+import codecs
+import imp
 import inspect
 import itertools
+import json
+import multiprocessing
 import os
 import sys
 import re
+import threading
+import time
+import weakref
+from multiprocessing.pool import ThreadPool
+from PyQt4.QtCore import QObject
 
 import foundations.common
 import foundations.data_structures
 import foundations.exceptions
 import foundations.strings
 import foundations.verbose
-import foundations.walkers
+import manager.bytecode
 import manager.exceptions
-from foundations.parsers import SectionsFileParser
+import manager.parsers
+import manager.queries
+import manager.walkers
 from manager.component import Component
+from manager.dependency_graph import DependencyGraph
+from manager.globals.constants import Constants
+from manager.importers import ComponentsImporter
+from manager.indexes import ProfilesIndexes
+from manager.profiles_cache import ProfilesCache
+from manager.proxies import InterfaceProxy
+from manager.proxies import is_resolved
+from manager.proxies import resolve_interface
+from manager.profiles_cache import get_file_signature
+from manager.scheduler import DependenciesScheduler
+from manager.timings import CLOCKS
+from manager.timings import format_report
+from manager.timings import get_critical_path
+from manager.timings import get_total_time
+from manager.timings import timer
 from manager.QObject_component import QObjectComponent
 from manager.QWidget_component import QWidgetComponentFactory
 
@@ -41,11 +68,140 @@ __maintainer__ = "Thomas Mansencal"
 __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
-__all__ = ["LOGGER", "Components", "Profile", "Manager"]
+__all__ = ["LOGGER", "StringsTable", "Components", "Profile", "Manager"]
 
 LOGGER = foundations.verbose.install_logger()
 
 
+class StringsTable(object):
+    """
+    | Defines a reference counted strings table, equal strings interned into the table are stored once.
+    | Unlike :func:`intern` definition, unicode strings are supported and strings are removed from the table
+        once released by all their owners.
+    """
+
+    def __init__(self):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> strings_table = StringsTable()
+            >>> strings_table.intern(u"Thomas Mansencal") is strings_table.intern(u"Thomas Mansencal")
+            True
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__strings = {}
+
+    @property
+    def strings(self):
+        """
+        Property for **self.__strings** attribute.
+
+        :return: self.__strings.
+        :rtype: dict
+        """
+
+        return self.__strings
+
+    @strings.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def strings(self, value):
+        """
+        Setter for **self.__strings** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "strings"))
+
+    @strings.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def strings(self):
+        """
+        Deleter for **self.__strings** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "strings"))
+
+    def __contains__(self, value):
+        """
+        Reimplements the :meth:`object.__contains__` method.
+
+        :param value: String.
+        :type value: unicode
+        :return: String existence in the table.
+        :rtype: bool
+        """
+
+        return value in self.__strings
+
+    def __len__(self):
+        """
+        Reimplements the :meth:`object.__len__` method.
+
+        :return: Strings count.
+        :rtype: int
+        """
+
+        return len(self.__strings)
+
+    def intern(self, value):
+        """
+        Returns given string shared instance and increments its references count.
+
+        :param value: String.
+        :type value: unicode
+        :return: Shared string.
+        :rtype: unicode
+        """
+
+        if value is None:
+            return
+
+        entry = self.__strings.get(value)
+        if entry is None:
+            entry = self.__strings[value] = [value, 0]
+        entry[1] += 1
+        return entry[0]
+
+    def release(self, value):
+        """
+        Decrements given string references count, the string is removed from the table once unreferenced.
+
+        :param value: String.
+        :type value: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        entry = self.__strings.get(value)
+        if entry is None:
+            return False
+
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del (self.__strings[value])
+        return True
+
+    def clear(self):
+        """
+        Clears the table.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        self.__strings.clear()
+        return True
+
+
 class Components(foundations.data_structures.Structure):
     """
     Defines a storage object for :class:`Manager` class Components.
@@ -66,9 +222,35 @@ class Components(foundations.data_structures.Structure):
 
 class Profile(object):
     """
-    Stores :class:`Manager` class Components informations and objects.
+    | Stores :class:`Manager` class Components informations and objects.
+    | Attributes are stored in slots and the **category**, **version**, **author**, **email** and **url**
+        attributes strings are interned into the Profile strings table when set, so that large registries
+        share their repeated values.
     """
 
+    __slots__ = ("__name",
+                 "__file",
+                 "__directory",
+                 "__attribute",
+                 "__require",
+                 "__module",
+                 "__interface",
+                 "__category",
+                 "__title",
+                 "__package",
+                 "__version",
+                 "__author",
+                 "__email",
+                 "__url",
+                 "__description",
+                 "__informations_loaded",
+                 "__signature",
+                 "__timings",
+                 "__strings_table",
+                 "__indexes",
+                 "__dict__",
+                 "__weakref__")
+
     def __init__(self, name=None, file=None):
         """
         Initializes the class.
@@ -101,6 +283,12 @@ class Profile(object):
         self.__email = None
         self.__url = None
         self.__description = None
+        self.__informations_loaded = True
+
+        self.__signature = None
+        self.__timings = None
+        self.__strings_table = None
+        self.__indexes = None
 
     @property
     def name(self):
@@ -373,7 +561,8 @@ class Profile(object):
         if value is not None:
             assert type(value) is unicode, "'{0}' attribute: '{1}' type is not 'unicode'!".format(
                 "category", value)
-        self.__category = value
+        self.__category = self.__swap_string(self.__category, value)
+        self.__indexes is not None and self.__indexes.update(self, "category")
 
     @category.deleter
     @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
@@ -446,6 +635,7 @@ class Profile(object):
             assert type(value) is unicode, "'{0}' attribute: '{1}' type is not 'unicode'!".format(
                 "package", value)
         self.__package = value
+        self.__indexes is not None and self.__indexes.update(self, "package")
 
     @package.deleter
     @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
@@ -481,7 +671,8 @@ class Profile(object):
         if value is not None:
             assert type(value) is unicode, "'{0}' attribute: '{1}' type is not 'unicode'!".format(
                 "version", value)
-        self.__version = value
+        self.__version = self.__swap_string(self.__version, value)
+        self.__indexes is not None and self.__indexes.update(self, "version")
 
     @version.deleter
     @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
@@ -502,6 +693,8 @@ class Profile(object):
         :rtype: unicode
         """
 
+        self.__informations_loaded or self.__load_informations()
+
         return self.__author
 
     @author.setter
@@ -517,7 +710,11 @@ class Profile(object):
         if value is not None:
             assert type(value) is unicode, "'{0}' attribute: '{1}' type is not 'unicode'!".format(
                 "author", value)
-        self.__author = value
+
+        self.__informations_loaded or self.__load_informations()
+
+        self.__author = self.__swap_string(self.__author, value)
+        self.__indexes is not None and self.__indexes.update(self, "author")
 
     @author.deleter
     @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
@@ -538,6 +735,8 @@ class Profile(object):
         :rtype: unicode
         """
 
+        self.__informations_loaded or self.__load_informations()
+
         return self.__email
 
     @email.setter
@@ -553,7 +752,10 @@ class Profile(object):
         if value is not None:
             assert type(value) is unicode, "'{0}' attribute: '{1}' type is not 'unicode'!".format(
                 "email", value)
-        self.__email = value
+
+        self.__informations_loaded or self.__load_informations()
+
+        self.__email = self.__swap_string(self.__email, value)
 
     @email.deleter
     @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
@@ -574,6 +776,8 @@ class Profile(object):
         :rtype: unicode
         """
 
+        self.__informations_loaded or self.__load_informations()
+
         return self.__url
 
     @url.setter
@@ -589,7 +793,10 @@ class Profile(object):
         if value is not None:
             assert type(value) is unicode, "'{0}' attribute: '{1}' type is not 'unicode'!".format(
                 "url", value)
-        self.__url = value
+
+        self.__informations_loaded or self.__load_informations()
+
+        self.__url = self.__swap_string(self.__url, value)
 
     @url.deleter
     @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
@@ -610,6 +817,8 @@ class Profile(object):
         :rtype: unicode
         """
 
+        self.__informations_loaded or self.__load_informations()
+
         return self.__description
 
     @description.setter
@@ -625,6 +834,9 @@ class Profile(object):
         if value is not None:
             assert type(value) is unicode, "'{0}' attribute: '{1}' type is not 'unicode'!".format(
                 "description", value)
+
+        self.__informations_loaded or self.__load_informations()
+
         self.__description = value
 
     @description.deleter
@@ -637,56 +849,306 @@ class Profile(object):
         raise foundations.exceptions.ProgrammingError(
             "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "description"))
 
+    @property
+    def signature(self):
+        """
+        Property for **self.__signature** attribute.
+
+        :return: self.__signature.
+        :rtype: list
+        """
+
+        return self.__signature
+
+    @signature.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def signature(self, value):
+        """
+        Setter for **self.__signature** attribute.
+
+        :param value: Attribute value.
+        :type value: list
+        """
+
+        if value is not None:
+            assert type(value) in (tuple, list), "'{0}' attribute: '{1}' type is not 'tuple' or 'list'!".format(
+                "signature", value)
+        self.__signature = value
+
+    @signature.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def signature(self):
+        """
+        Deleter for **self.__signature** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "signature"))
+
+    @property
+    def timings(self):
+        """
+        Property for **self.__timings** attribute, the dictionary is created on first access.
+
+        :return: self.__timings.
+        :rtype: dict
+        """
+
+        if self.__timings is None:
+            self.__timings = {}
+        return self.__timings
+
+    @timings.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def timings(self, value):
+        """
+        Setter for **self.__timings** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        if value is not None:
+            assert type(value) is dict, "'{0}' attribute: '{1}' type is not 'dict'!".format("timings", value)
+        self.__timings = value
+
+    @timings.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def timings(self):
+        """
+        Deleter for **self.__timings** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "timings"))
+
+    @property
+    def informations_loaded(self):
+        """
+        Property for **self.__informations_loaded** attribute.
+
+        :return: self.__informations_loaded.
+        :rtype: bool
+        """
+
+        return self.__informations_loaded
+
+    @informations_loaded.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def informations_loaded(self, value):
+        """
+        Setter for **self.__informations_loaded** attribute.
+
+        :param value: Attribute value.
+        :type value: bool
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "informations_loaded"))
+
+    @informations_loaded.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def informations_loaded(self):
+        """
+        Deleter for **self.__informations_loaded** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "informations_loaded"))
+
+    @property
+    def strings_table(self):
+        """
+        Property for **self.__strings_table** attribute.
+
+        :return: self.__strings_table.
+        :rtype: StringsTable
+        """
+
+        return self.__strings_table
+
+    @strings_table.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def strings_table(self, value):
+        """
+        Setter for **self.__strings_table** attribute.
+        The Profile strings are released from the previous table and interned into given table.
+
+        :param value: Attribute value.
+        :type value: StringsTable
+        """
+
+        if value is not None:
+            assert type(value) is StringsTable, "'{0}' attribute: '{1}' type is not 'StringsTable'!".format(
+                "strings_table", value)
+
+        if value is self.__strings_table:
+            return
+
+        if self.__strings_table is not None:
+            self.__strings_table.release(self.__category)
+            self.__strings_table.release(self.__version)
+            self.__strings_table.release(self.__author)
+            self.__strings_table.release(self.__email)
+            self.__strings_table.release(self.__url)
+
+        if value is not None:
+            self.__category = value.intern(self.__category)
+            self.__version = value.intern(self.__version)
+            self.__author = value.intern(self.__author)
+            self.__email = value.intern(self.__email)
+            self.__url = value.intern(self.__url)
+        self.__strings_table = value
+
+    @strings_table.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def strings_table(self):
+        """
+        Deleter for **self.__strings_table** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "strings_table"))
+
+    @property
+    def indexes(self):
+        """
+        Property for **self.__indexes** attribute.
+
+        :return: self.__indexes.
+        :rtype: ProfilesIndexes
+        """
+
+        return self.__indexes
+
+    @indexes.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def indexes(self, value):
+        """
+        Setter for **self.__indexes** attribute.
+        The indexes are updated when the **category**, **package**, **version** and **author** attributes are set.
+
+        :param value: Attribute value.
+        :type value: ProfilesIndexes
+        """
+
+        if value is not None:
+            assert type(value) is ProfilesIndexes, "'{0}' attribute: '{1}' type is not 'ProfilesIndexes'!".format(
+                "indexes", value)
+        self.__indexes = value
+
+    @indexes.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def indexes(self):
+        """
+        Deleter for **self.__indexes** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "indexes"))
+
+    def __swap_string(self, current, value):
+        """
+        Returns given string interned into the Profile strings table, releasing given current string.
+
+        :param current: Current string.
+        :type current: unicode
+        :param value: String.
+        :type value: unicode
+        :return: Shared string.
+        :rtype: unicode
+        """
+
+        if self.__strings_table is None:
+            return value
+
+        self.__strings_table.release(current)
+        return self.__strings_table.intern(value)
+
+    def __load_informations(self):
+        """
+        Loads the Component Profile **[Informations]** section attributes from the Component file.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        self.__informations_loaded = True
+
+        LOGGER.debug("> Loading '{0}' profile informations.".format(self.__file))
+
+        try:
+            informations = manager.parsers.read_manifest(self.__file, ("Informations",)).get("Informations", {})
+        except foundations.exceptions.FileStructureParsingError as error:
+            LOGGER.warning("!> {0} | '{1}' profile informations cannot be loaded: '{2}'".format(
+                self.__class__.__name__, self.__file, error))
+            return False
+
+        self.__author = self.__swap_string(self.__author, informations.get("Author"))
+        self.__email = self.__swap_string(self.__email, informations.get("Email"))
+        self.__url = self.__swap_string(self.__url, informations.get("Url"))
+        self.__description = informations.get("Description")
+        return True
+
     @foundations.exceptions.handle_exceptions(foundations.exceptions.FileStructureParsingError)
-    def initializeProfile(self):
+    def initializeProfile(self, lazy=False):
         """
-        Initializes the Component Profile.
+        | Initializes the Component Profile.
+        | In lazy mode, only the **[Component]** section attributes are retained, the **[Informations]** section
+            attributes are loaded on first access.
 
+        :param lazy: Lazy mode.
+        :type lazy: bool
         :return: Method success.
         :rtype: bool
         """
 
         LOGGER.debug("> Building '{0}' profile.".format(self.__file))
 
-        sections_file_parser = SectionsFileParser(self.__file)
-        sections_file_parser.parse()
+        sections = manager.parsers.read_manifest(self.__file,
+                                                 ("Component",) if lazy else manager.parsers.MANIFEST_SECTIONS)
 
-        if sections_file_parser.sections:
+        if sections:
             fileStructureParsingError = lambda attribute: foundations.exceptions.FileStructureParsingError(
                 "{0} | No '{1}' attribute found, '{2}' file structure seems invalid!".format(
                     self.__class__.__name__, attribute, self.__file))
 
+            component = sections.get("Component", {})
+            informations = sections.get("Informations", {})
+
             self.__directory = os.path.dirname(self.__file)
-            self.__name = sections_file_parser.get_value("Name", "Component", default=None)
+            self.__name = component.get("Name")
             if self.__name is None:
                 raise fileStructureParsingError("Name")
 
-            self.__title = sections_file_parser.get_value("Title", "Component", default=None)
+            self.__title = component.get("Title")
             if self.__title is None:
                 self.__title = self.__name
 
-            self.__package = sections_file_parser.get_value("Module", "Component", default=None)
+            self.__package = component.get("Module")
             if self.__package is None:
                 raise fileStructureParsingError("Module")
 
-            self.__attribute = sections_file_parser.get_value("Object", "Component", default=None)
+            self.__attribute = component.get("Object")
             if self.__attribute is None:
                 raise fileStructureParsingError("Object")
 
-            self.__require = sections_file_parser.get_value("Require", "Component", default=None)
+            self.__require = component.get("Require")
             self.__require = list() if self.__require is None else self.__require.split("|")
 
-            self.__version = sections_file_parser.get_value("Version", "Component", default=None)
+            self.__version = self.__swap_string(self.__version, component.get("Version"))
             if self.__version is None:
                 raise fileStructureParsingError("Version")
 
-            self.__author = sections_file_parser.get_value("Author", "Informations", default=None)
+            self.__author = self.__swap_string(self.__author, informations.get("Author"))
 
-            self.__email = sections_file_parser.get_value("Email", "Informations", default=None)
+            self.__email = self.__swap_string(self.__email, informations.get("Email"))
 
-            self.__url = sections_file_parser.get_value("Url", "Informations", default=None)
+            self.__url = self.__swap_string(self.__url, informations.get("Url"))
 
-            self.__description = sections_file_parser.get_value("Description", "Informations", default=None)
+            self.__description = informations.get("Description")
+
+            self.__informations_loaded = not lazy
 
             return True
         else:
@@ -694,6 +1156,77 @@ class Profile(object):
                 "{0} | No sections found, '{1}' file structure seems invalid!".format(self.__class__.__name__,
                                                                                       self.__file))
 
+    def serialize_profile(self):
+        """
+        | Serializes the Component Profile description attributes.
+        | The **[Informations]** section attributes are only serialized once loaded.
+
+        Usage::
+
+            >>> profile = Profile(file="tests_component_a.rc")
+            >>> profile.initializeProfile()
+            True
+            >>> profile.serialize_profile()["name"]
+            u'core.tests_component_a'
+
+        :return: Profile data.
+        :rtype: dict
+        """
+
+        data = {"name": self.__name,
+                "file": self.__file,
+                "directory": self.__directory,
+                "title": self.__title,
+                "package": self.__package,
+                "attribute": self.__attribute,
+                "require": list(self.__require or ()),
+                "version": self.__version}
+        if self.__informations_loaded:
+            data.update({"author": self.__author,
+                         "email": self.__email,
+                         "url": self.__url,
+                         "description": self.__description})
+        return data
+
+    def deserialize_profile(self, data):
+        """
+        | Initializes the Component Profile from given data as returned by :meth:`Profile.serialize_profile` method.
+        | The **[Informations]** section attributes are loaded on first access if not provided.
+
+        Usage::
+
+            >>> profile = Profile(file="tests_component_a.rc")
+            >>> profile.initializeProfile()
+            True
+            >>> copy = Profile()
+            >>> copy.deserialize_profile(profile.serialize_profile())
+            True
+            >>> copy.name
+            u'core.tests_component_a'
+
+        :param data: Profile data.
+        :type data: dict
+        :return: Method success.
+        :rtype: bool
+        """
+
+        LOGGER.debug("> Restoring '{0}' profile.".format(data.get("file")))
+
+        self.__name = data.get("name")
+        self.__file = data.get("file")
+        self.__directory = data.get("directory")
+        self.__title = data.get("title")
+        self.__package = data.get("package")
+        self.__attribute = data.get("attribute")
+        self.__require = list(data.get("require") or ())
+        self.__version = self.__swap_string(self.__version, data.get("version"))
+        self.__author = self.__swap_string(self.__author, data.get("author"))
+        self.__email = self.__swap_string(self.__email, data.get("email"))
+        self.__url = self.__swap_string(self.__url, data.get("url"))
+        self.__description = data.get("description")
+        self.__informations_loaded = "author" in data
+        return True
+
 
 class Manager(object):
     """
@@ -708,7 +1241,12 @@ class Manager(object):
     def __init__(self,
                  paths=None,
                  extension="rc",
-                 categories={"Default": Component, "QWidget": QWidgetComponentFactory(), "QObject": QObjectComponent}):
+                 categories={"Default": Component, "QWidget": QWidgetComponentFactory(), "QObject": QObjectComponent},
+                 profiles_cache=None,
+                 ignored_directories=Constants.ignored_directories,
+                 maximum_depth=None,
+                 lazy_profiles=False,
+                 bytecode_directory=None):
         """
         Initializes the class.
 
@@ -730,6 +1268,16 @@ class Manager(object):
         :type extension: unicode
         :param categories: Components categories.
         :type categories: dict
+        :param profiles_cache: Profiles cache used to skip unchanged Components files parsing.
+        :type profiles_cache: ProfilesCache
+        :param ignored_directories: Directories names or glob patterns not walked for Components files.
+        :type ignored_directories: tuple or list
+        :param maximum_depth: Maximum depth walked below each path, no limit if None.
+        :type maximum_depth: int
+        :param lazy_profiles: Profiles **[Informations]** section attributes are loaded on first access.
+        :type lazy_profiles: bool
+        :param bytecode_directory: Directory the Components modules bytecode files are compiled into and loaded from.
+        :type bytecode_directory: unicode
         """
 
         LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
@@ -741,7 +1289,25 @@ class Manager(object):
         self.extension = extension
         self.__categories = None
         self.categories = categories
+        self.__profiles_cache = None
+        self.profiles_cache = profiles_cache
+        self.__ignored_directories = None
+        self.ignored_directories = ignored_directories
+        self.__maximum_depth = None
+        self.maximum_depth = maximum_depth
+        self.__lazy_profiles = None
+        self.lazy_profiles = lazy_profiles
         self.__components = Components()
+        self.__strings_table = StringsTable()
+        self.__indexes = ProfilesIndexes()
+        self.__dependency_graph = DependencyGraph()
+        self.__importer = ComponentsImporter()
+        self.__bytecode_directory = None
+        self.bytecode_directory = bytecode_directory
+        self.__directories_listings = {}
+        self.__walked_directories = []
+        self.__walked_files = []
+        self.__unregistered_files = []
 
     @property
     def paths(self):
@@ -846,6 +1412,7 @@ class Manager(object):
                 assert type(key) is unicode, "'{0}' attribute: '{1}' type is not 'unicode'!".format(
                     "categories", key)
         self.__categories = value
+        self.__categories_cache = weakref.WeakKeyDictionary()
 
     @categories.deleter
     @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
@@ -858,21 +1425,204 @@ class Manager(object):
             "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "categories"))
 
     @property
-    def components(self):
+    def profiles_cache(self):
         """
-        Property for **self.__components** attribute.
+        Property for **self.__profiles_cache** attribute.
 
-        :return: self.__components.
-        :rtype: dict
+        :return: self.__profiles_cache.
+        :rtype: ProfilesCache
         """
 
-        return self.__components
+        return self.__profiles_cache
 
-    @components.setter
-    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
-    def components(self, value):
+    @profiles_cache.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def profiles_cache(self, value):
         """
-        Setter for **self.__components** attribute.
+        Setter for **self.__profiles_cache** attribute.
+
+        :param value: Attribute value.
+        :type value: ProfilesCache
+        """
+
+        if value is not None:
+            assert type(value) is ProfilesCache, "'{0}' attribute: '{1}' type is not 'ProfilesCache'!".format(
+                "profiles_cache", value)
+        self.__profiles_cache = value
+
+    @profiles_cache.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def profiles_cache(self):
+        """
+        Deleter for **self.__profiles_cache** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "profiles_cache"))
+
+    @property
+    def ignored_directories(self):
+        """
+        Property for **self.__ignored_directories** attribute.
+
+        :return: self.__ignored_directories.
+        :rtype: tuple or list
+        """
+
+        return self.__ignored_directories
+
+    @ignored_directories.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def ignored_directories(self, value):
+        """
+        Setter for **self.__ignored_directories** attribute.
+
+        :param value: Attribute value.
+        :type value: tuple or list
+        """
+
+        if value is not None:
+            assert type(value) in (tuple, list), "'{0}' attribute: '{1}' type is not 'tuple' or 'list'!".format(
+                "ignored_directories", value)
+            for directory in value:
+                assert type(directory) is unicode, "'{0}' attribute: '{1}' type is not 'unicode'!".format(
+                    "ignored_directories", directory)
+        self.__ignored_directories = value
+
+    @ignored_directories.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def ignored_directories(self):
+        """
+        Deleter for **self.__ignored_directories** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "ignored_directories"))
+
+    @property
+    def maximum_depth(self):
+        """
+        Property for **self.__maximum_depth** attribute.
+
+        :return: self.__maximum_depth.
+        :rtype: int
+        """
+
+        return self.__maximum_depth
+
+    @maximum_depth.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def maximum_depth(self, value):
+        """
+        Setter for **self.__maximum_depth** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) is int, "'{0}' attribute: '{1}' type is not 'int'!".format("maximum_depth", value)
+            assert value >= 0, "'{0}' attribute: '{1}' need to be positive!".format("maximum_depth", value)
+        self.__maximum_depth = value
+
+    @maximum_depth.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def maximum_depth(self):
+        """
+        Deleter for **self.__maximum_depth** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "maximum_depth"))
+
+    @property
+    def lazy_profiles(self):
+        """
+        Property for **self.__lazy_profiles** attribute.
+
+        :return: self.__lazy_profiles.
+        :rtype: bool
+        """
+
+        return self.__lazy_profiles
+
+    @lazy_profiles.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def lazy_profiles(self, value):
+        """
+        Setter for **self.__lazy_profiles** attribute.
+
+        :param value: Attribute value.
+        :type value: bool
+        """
+
+        if value is not None:
+            assert type(value) is bool, "'{0}' attribute: '{1}' type is not 'bool'!".format("lazy_profiles", value)
+        self.__lazy_profiles = value
+
+    @lazy_profiles.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def lazy_profiles(self):
+        """
+        Deleter for **self.__lazy_profiles** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "lazy_profiles"))
+
+    @property
+    def bytecode_directory(self):
+        """
+        Property for **self.__bytecode_directory** attribute.
+
+        :return: self.__bytecode_directory.
+        :rtype: unicode
+        """
+
+        return self.__bytecode_directory
+
+    @bytecode_directory.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def bytecode_directory(self, value):
+        """
+        Setter for **self.__bytecode_directory** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        if value is not None:
+            assert type(value) is unicode, "'{0}' attribute: '{1}' type is not 'unicode'!".format(
+                "bytecode_directory", value)
+        self.__bytecode_directory = value
+        self.__importer.bytecode_directory = value
+
+    @bytecode_directory.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def bytecode_directory(self):
+        """
+        Deleter for **self.__bytecode_directory** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "bytecode_directory"))
+
+    @property
+    def components(self):
+        """
+        Property for **self.__components** attribute.
+
+        :return: self.__components.
+        :rtype: dict
+        """
+
+        return self.__components
+
+    @components.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def components(self, value):
+        """
+        Setter for **self.__components** attribute.
 
         :param value: Attribute value.
         :type value: dict
@@ -891,6 +1641,210 @@ class Manager(object):
         raise foundations.exceptions.ProgrammingError(
             "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "components"))
 
+    @property
+    def importer(self):
+        """
+        Property for **self.__importer** attribute.
+
+        :return: self.__importer.
+        :rtype: ComponentsImporter
+        """
+
+        return self.__importer
+
+    @importer.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def importer(self, value):
+        """
+        Setter for **self.__importer** attribute.
+
+        :param value: Attribute value.
+        :type value: ComponentsImporter
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "importer"))
+
+    @importer.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def importer(self):
+        """
+        Deleter for **self.__importer** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "importer"))
+
+    @property
+    def dependency_graph(self):
+        """
+        Property for **self.__dependency_graph** attribute.
+
+        :return: self.__dependency_graph.
+        :rtype: DependencyGraph
+        """
+
+        return self.__dependency_graph
+
+    @dependency_graph.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def dependency_graph(self, value):
+        """
+        Setter for **self.__dependency_graph** attribute.
+
+        :param value: Attribute value.
+        :type value: DependencyGraph
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "dependency_graph"))
+
+    @dependency_graph.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def dependency_graph(self):
+        """
+        Deleter for **self.__dependency_graph** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "dependency_graph"))
+
+    @property
+    def strings_table(self):
+        """
+        Property for **self.__strings_table** attribute.
+
+        :return: self.__strings_table.
+        :rtype: StringsTable
+        """
+
+        return self.__strings_table
+
+    @strings_table.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def strings_table(self, value):
+        """
+        Setter for **self.__strings_table** attribute.
+
+        :param value: Attribute value.
+        :type value: StringsTable
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "strings_table"))
+
+    @strings_table.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def strings_table(self):
+        """
+        Deleter for **self.__strings_table** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "strings_table"))
+
+    @property
+    def walked_directories(self):
+        """
+        Property for **self.__walked_directories** attribute.
+
+        :return: self.__walked_directories.
+        :rtype: list
+        """
+
+        return self.__walked_directories
+
+    @walked_directories.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def walked_directories(self, value):
+        """
+        Setter for **self.__walked_directories** attribute.
+
+        :param value: Attribute value.
+        :type value: list
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "walked_directories"))
+
+    @walked_directories.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def walked_directories(self):
+        """
+        Deleter for **self.__walked_directories** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "walked_directories"))
+
+    @property
+    def walked_files(self):
+        """
+        Property for **self.__walked_files** attribute.
+
+        :return: self.__walked_files.
+        :rtype: list
+        """
+
+        return self.__walked_files
+
+    @walked_files.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def walked_files(self, value):
+        """
+        Setter for **self.__walked_files** attribute.
+
+        :param value: Attribute value.
+        :type value: list
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "walked_files"))
+
+    @walked_files.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def walked_files(self):
+        """
+        Deleter for **self.__walked_files** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "walked_files"))
+
+    @property
+    def unregistered_files(self):
+        """
+        Property for **self.__unregistered_files** attribute.
+
+        :return: self.__unregistered_files.
+        :rtype: list
+        """
+
+        return self.__unregistered_files
+
+    @unregistered_files.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def unregistered_files(self, value):
+        """
+        Setter for **self.__unregistered_files** attribute.
+
+        :param value: Attribute value.
+        :type value: list
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "unregistered_files"))
+
+    @unregistered_files.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def unregistered_files(self):
+        """
+        Deleter for **self.__unregistered_files** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "unregistered_files"))
+
     def __getitem__(self, component):
         """
         Reimplements the :meth:`object.__getitem__` method.
@@ -930,247 +1884,1280 @@ class Manager(object):
         :rtype: object
         """
 
-        return self.__components.iteritems()
+        return self.__components.iteritems()
+
+    def __contains__(self, component):
+        """
+        Reimplements the :meth:`object.__contains__` method.
+
+        Usage::
+
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
+            >>> manager.register_components()
+            True
+            >>> tests_component_a in manager
+            True
+            >>> "core.nemoComponent" in manager
+            False
+
+        :param component: Component name.
+        :type component: unicode
+        :return: Component existence.
+        :rtype: bool
+        """
+
+        return component in self.__components.keys()
+
+    def __len__(self):
+        """
+        Reimplements the :meth:`object.__len__` method.
+
+        Usage::
+
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
+            >>> manager.register_components()
+            True
+            >>> len(manager)
+            2
+
+        :return: Components count.
+        :rtype: int
+        """
+
+        return len(self.__components.keys())
+
+    def __get_signature(self, path):
+        """
+        Returns given Component file signature.
+
+        :param path: Component path.
+        :type path: unicode
+        :return: Component file signature.
+        :rtype: list
+        """
+
+        return get_file_signature(path, self.__profiles_cache is not None and self.__profiles_cache.hash_content)
+
+    def __walk_components_files(self):
+        """
+        Walks the paths for Components files.
+
+        :return: Components files.
+        :rtype: list
+        """
+
+        self.__directories_listings = {}
+        self.__walked_directories = []
+        return [file
+                for path in self.paths
+                for file in manager.walkers.components_walker(path,
+                                                              self.__extension,
+                                                              self.__ignored_directories,
+                                                              self.__maximum_depth,
+                                                              self.__directories_listings,
+                                                              self.__walked_directories)]
+
+    def __get_module_path(self, profile):
+        """
+        | Returns the path given Component profile module is importable from.
+        | The directories listings gathered while walking the paths during the current registration pass are used
+            when available, the filesystem is queried otherwise or when the listing does not contain the module.
+
+        :param profile: Component profile.
+        :type profile: Profile
+        :return: Module path.
+        :rtype: unicode
+        """
+
+        listing = self.__directories_listings.get(os.path.normpath(profile.directory))
+        exists = listing is not None and \
+                 (listing.get("{0}.py".format(profile.package)) is False or listing.get(profile.package) is True)
+        if not exists:
+            exists = os.path.isfile(os.path.join(profile.directory, profile.package) + ".py") or \
+                     os.path.isdir(os.path.join(profile.directory, profile.package))
+
+        if exists:
+            return profile.directory
+        elif os.path.basename(profile.directory) == profile.package:
+            return os.path.join(profile.directory, "..")
+
+    def __get_module_files(self, profile):
+        """
+        Returns given Component profile module source files.
+
+        :param profile: Component profile.
+        :type profile: Profile
+        :return: Module path, Module source files.
+        :rtype: tuple
+        """
+
+        path = self.__get_module_path(profile)
+        if path is None:
+            return None, []
+
+        module = os.path.join(path, profile.package)
+        if os.path.isfile("{0}.py".format(module)):
+            return path, ["{0}.py".format(module)]
+
+        files = []
+        for parent_directory, directories, files_names in os.walk(module):
+            files.extend(os.path.join(parent_directory, file) for file in files_names if file.endswith(".py"))
+        return path, sorted(files)
+
+    def __get_category(self, object):
+        """
+        | Returns given Component Interface class category.
+        | The class method resolution order is walked for the nearest class named after a category type, classes
+            are matched by name as :class:`manager.QWidget_component.QWidgetComponentFactory` definition creates a
+            distinct class per call. Results are cached per class.
+
+        :param object: Component Interface class.
+        :type object: object
+        :return: Category.
+        :rtype: unicode
+        """
+
+        try:
+            return self.__categories_cache[object]
+        except KeyError:
+            pass
+
+        categories = dict((type.__name__, category) for category, type in self.__categories.iteritems())
+        category = None
+        for base in inspect.getmro(object)[1:]:
+            if base.__name__ in categories:
+                category = categories[base.__name__]
+                break
+
+        self.__categories_cache[object] = category
+        return category
+
+    def __store_profile(self, profile):
+        """
+        Stores given Component profile in the Components.
+
+        :param profile: Component profile.
+        :type profile: Profile
+        :return: Method success.
+        :rtype: bool
+        """
+
+        current_profile = self.__components.get(profile.name)
+        if current_profile is not None and current_profile is not profile:
+            current_profile.strings_table = None
+            current_profile.indexes = None
+        profile.strings_table = self.__strings_table
+        profile.indexes = self.__indexes
+
+        self.__components[profile.name] = profile
+        self.__indexes.add(profile)
+        self.__dependency_graph.add(profile.name, profile.require)
+        return True
+
+    def __discard_profile(self, component):
+        """
+        Discards given Component profile from the Components.
+
+        :param component: Component name.
+        :type component: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        profile = self.__components.pop(component)
+        profile.strings_table = None
+        profile.indexes = None
+        self.__indexes.remove(component)
+        self.__dependency_graph.remove(component)
+        return True
+
+    def __initialize_profile(self, profile):
+        """
+        Initializes given Component profile, using the profiles cache when available.
+
+        :param profile: Component profile.
+        :type profile: Profile
+        :return: Method success.
+        :rtype: bool
+        """
+
+        profile.signature = signature = self.__get_signature(profile.file)
+
+        if self.__profiles_cache is None:
+            return profile.initializeProfile(bool(self.__lazy_profiles))
+
+        data = self.__profiles_cache.get_content(profile.file, signature)
+        if data is not None:
+            return profile.deserialize_profile(data)
+
+        if profile.initializeProfile(bool(self.__lazy_profiles)):
+            return self.__profiles_cache.set_content(profile.file, profile.serialize_profile(), signature)
+
+    @foundations.exceptions.handle_exceptions(manager.exceptions.ComponentModuleError,
+                                              manager.exceptions.ComponentProfileError)
+    def __get_profile(self, path):
+        """
+        Builds given Component file profile and checks its associated module existence.
+
+        :param path: Component path.
+        :type path: unicode
+        :return: Component profile.
+        :rtype: Profile
+        """
+
+        component = foundations.strings.get_splitext_basename(path)
+        LOGGER.debug("> Current Component: '{0}'.".format(component))
+        profile = Profile(file=path)
+        with timer(profile.timings, "parse"):
+            initialized = self.__initialize_profile(profile)
+        if initialized:
+            if self.__get_module_path(profile) is not None:
+                return profile
+            else:
+                raise manager.exceptions.ComponentModuleError(
+                    "{0} | '{1}' has no associated module and has been rejected!".format(self.__class__.__name__,
+                                                                                         component))
+        else:
+            raise manager.exceptions.ComponentProfileError(
+                "{0} | '{1}' is not a valid Component and has been rejected!".format(self.__class__.__name__,
+                                                                                     component))
+
+    def register_component(self, path):
+        """
+        Registers a Component using given path.
+
+        Usage::
+
+            >>> manager = Manager()
+            >>> manager.register_component("tests_component_a.rc")
+            True
+            >>> manager.components
+            {u'core.tests_component_a': <manager.components_manager.Profile object at 0x11c9eb0>}
+
+        :param path: Component path.
+        :type path: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        profile = self.__get_profile(path)
+        if profile is None:
+            return False
+
+        return self.__store_profile(profile)
+
+    def unregister_component(self, component):
+        """
+        Unregisters given Component.
+
+        .. warning::
+
+            The :class:`Manager` class is not responsible of any deactivation / cleanup actions
+            and will not trigger anything while unregistering a Component.
+
+        Usage::
+
+            >>> manager = Manager()
+            >>> manager.register_component("tests_component_a.rc")
+            True
+            >>> manager.unregister_component("core.tests_component_a")
+            True
+            >>> manager.components
+            {}
+
+        :param component: Component to remove.
+        :type component: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        profile = self.__components.get(component)
+        if profile is not None and self.__profiles_cache is not None and not os.path.isfile(profile.file):
+            self.__profiles_cache.remove_content(profile.file)
+
+        return self.__discard_profile(component)
+
+    @foundations.exceptions.handle_exceptions(manager.exceptions.ComponentRegistrationError)
+    def register_components(self, workers=None):
+        """
+        | Registers the Components.
+        | The walked Components files and the ones that failed to register are stored into
+            the :attr:`Manager.walked_files` and :attr:`Manager.unregistered_files` attributes.
+
+        Usage::
+
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
+            >>> manager.register_components()
+            True
+            >>> manager.components.keys()
+            [u'core.tests_component_a', u'core.tests_component_b']
+            >>> manager.unregister_components()
+            True
+            >>> manager.register_components(workers=8)
+            True
+
+        :param workers: Components files are parsed concurrently using given threads count.
+        :type workers: int
+        :return: Method success.
+        :rtype: bool
+        """
+
+        self.__walked_files = files = self.__walk_components_files()
+        try:
+            if workers > 1 and len(files) > 1:
+                LOGGER.debug("> Parsing '{0}' Components files using '{1}' workers.".format(len(files), workers))
+                pool = ThreadPool(min(workers, len(files)))
+                try:
+                    profiles = pool.map(self.__get_profile, files)
+                finally:
+                    pool.close()
+                    pool.join()
+            else:
+                profiles = list(itertools.imap(self.__get_profile, files))
+        finally:
+            self.__directories_listings = {}
+
+        self.__unregistered_files = []
+        for file, profile in itertools.izip(files, profiles):
+            if profile is None:
+                self.__unregistered_files.append(file)
+                continue
+
+            self.__store_profile(profile)
+
+        if self.__profiles_cache is not None:
+            self.__profiles_cache.prune_content(files, self.paths)
+            self.__profiles_cache.save()
+
+        if not self.__unregistered_files:
+            return True
+        else:
+            raise manager.exceptions.ComponentRegistrationError(
+                "{0} | '{1}' Components failed to register!".format(self.__class__.__name__,
+                                                                    ", ".join(self.__unregistered_files)))
+
+    def unregister_components(self):
+        """
+        Unregisters the Components.
+
+        .. warning::
+
+            The :class:`Manager` class is not responsible of any deactivation / cleanup actions
+            and will not trigger anything while unregistering a Component.
+
+        Usage::
+
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
+            >>> manager.register_components()
+            True
+            >>> manager.unregister_components()
+            True
+            >>> manager.components
+            {}
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        for profile in self.__components.itervalues():
+            profile.strings_table = None
+            profile.indexes = None
+        self.__components.clear()
+        self.__strings_table.clear()
+        self.__indexes.clear()
+        self.__dependency_graph.clear()
+        self.__importer.clear()
+        return True
+
+    def rescan(self, files=None):
+        """
+        | Updates the Components using the current paths content, only added, removed and modified
+            Components files are touched.
+        | A modified Component keeps its module, interface and category if its module and object are unchanged.
+
+        Usage::
+
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
+            >>> manager.register_components()
+            True
+            >>> manager.rescan()
+            {u'added': [], u'removed': [], u'modified': []}
+
+        :param files: Components files to check, the paths are walked if not provided.
+        :type files: tuple or list
+        :return: Added, removed and modified Components.
+        :rtype: Structure
+        """
+
+        walked = files is None
+        if walked:
+            files = self.__walk_components_files()
+
+        registered_files = dict((profile.file, name) for name, profile in self)
+        added, removed, modified = [], [], []
+        for file in files:
+            component = registered_files.get(file)
+            if component is None:
+                profile = os.path.isfile(file) and self.__get_profile(file) or None
+                if profile is not None:
+                    self.__store_profile(profile)
+                    added.append(profile.name)
+                continue
+
+            if not os.path.isfile(file):
+                self.__discard_profile(component)
+                self.__profiles_cache is not None and self.__profiles_cache.remove_content(file)
+                removed.append(component)
+                continue
+
+            profile = self.__components[component]
+            if self.__get_signature(file) == profile.signature:
+                continue
+
+            LOGGER.debug("> '{0}' Component file has been modified.".format(file))
+            new_profile = self.__get_profile(file)
+            if new_profile is None:
+                self.__discard_profile(component)
+                removed.append(component)
+                continue
+
+            if new_profile.package == profile.package and new_profile.attribute == profile.attribute:
+                new_profile.module = profile.module
+                new_profile.interface = profile.interface
+                new_profile.category = profile.category
+
+            if new_profile.name == component:
+                self.__store_profile(new_profile)
+                modified.append(component)
+            else:
+                self.__discard_profile(component)
+                removed.append(component)
+                self.__store_profile(new_profile)
+                added.append(new_profile.name)
+        self.__directories_listings = {}
+
+        if walked:
+            files = set(files)
+            paths = tuple("{0}/".format(foundations.strings.to_forward_slashes(path).rstrip("/"))
+                          for path in self.paths)
+            for file, component in registered_files.iteritems():
+                if file in files or not file.startswith(paths):
+                    continue
+
+                profile = self.__components.get(component)
+                if profile is not None and profile.file == file:
+                    self.__discard_profile(component)
+                    removed.append(component)
+
+            self.__profiles_cache is not None and self.__profiles_cache.prune_content(files, self.paths)
+
+        self.__profiles_cache is not None and self.__profiles_cache.save()
+
+        LOGGER.debug("> Added Components: '{0}', removed Components: '{1}', modified Components: '{2}'.".format(
+            ", ".join(added), ", ".join(removed), ", ".join(modified)))
+
+        return foundations.data_structures.Structure(added=added, removed=removed, modified=modified)
+
+    def save_index(self, file):
+        """
+        | Saves the Components profiles into given index file.
+        | Components files and directories are stored relatively to the index file directory.
+
+        Usage::
+
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
+            >>> manager.register_components()
+            True
+            >>> manager.save_index("components.index")
+            True
+
+        :param file: Index file.
+        :type file: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        LOGGER.debug("> Saving Components index to '{0}' file.".format(file))
+
+        root = os.path.dirname(os.path.abspath(file))
+        profiles = []
+        for name, profile in sorted(self, key=lambda x: x[0]):
+            data = profile.serialize_profile()
+            data["file"] = foundations.strings.to_forward_slashes(
+                os.path.relpath(os.path.abspath(profile.file), root))
+            data["directory"] = foundations.strings.to_forward_slashes(
+                os.path.relpath(os.path.abspath(profile.directory), root))
+            data["signature"] = profile.signature
+            profiles.append(data)
+
+        with codecs.open(file, "w", encoding=Constants.default_codec) as file_object:
+            file_object.write(json.dumps({"format": Constants.index_format,
+                                          "extension": self.__extension,
+                                          "profiles": profiles}, ensure_ascii=False))
+        return True
+
+    def load_index(self, file):
+        """
+        | Registers the Components from given index file as saved by :meth:`Manager.save_index` method.
+        | Neither the paths are walked nor the Components files parsed.
+
+        Usage::
+
+            >>> manager = Manager()
+            >>> manager.load_index("components.index")
+            True
+            >>> manager.components.keys()
+            [u'core.tests_component_a', u'core.tests_component_b']
+
+        :param file: Index file.
+        :type file: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        LOGGER.debug("> Loading Components index from '{0}' file.".format(file))
+
+        try:
+            with codecs.open(file, "r", encoding=Constants.default_codec) as file_object:
+                data = json.load(file_object)
+        except (IOError, ValueError) as error:
+            raise manager.exceptions.ComponentsIndexError(
+                "{0} | '{1}' index file cannot be read: '{2}'".format(self.__class__.__name__, file, error))
+
+        if not isinstance(data, dict) or data.get("format") != Constants.index_format:
+            raise manager.exceptions.ComponentsIndexError(
+                "{0} | '{1}' index file format is not supported!".format(self.__class__.__name__, file))
+
+        root = os.path.dirname(os.path.abspath(file))
+        for data in data.get("profiles", ()):
+            data["file"] = foundations.strings.to_forward_slashes(
+                os.path.normpath(os.path.join(root, data["file"])))
+            data["directory"] = foundations.strings.to_forward_slashes(
+                os.path.normpath(os.path.join(root, data["directory"])))
+            profile = Profile()
+            profile.deserialize_profile(data)
+            profile.signature = data.get("signature")
+            self.__store_profile(profile)
+        return True
+
+    def __get_walking_settings(self):
+        """
+        Returns the paths walking settings as stored in registry snapshot files.
+
+        :return: Walking settings.
+        :rtype: dict
+        """
+
+        return {"paths": list(self.__paths or ()),
+                "extension": self.__extension,
+                "ignored_directories": list(self.__ignored_directories or ()),
+                "maximum_depth": self.__maximum_depth}
+
+    def save_snapshot(self, file):
+        """
+        | Saves the Components registry into given snapshot file.
+        | The snapshot stores the Components profiles, categories and dependency order along the paths walking
+            settings and the walked directories and Components files signatures validating its freshness.
+
+        Usage::
+
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
+            >>> manager.register_components()
+            True
+            >>> manager.save_snapshot("components.snapshot")
+            True
+
+        :param file: Snapshot file.
+        :type file: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        LOGGER.debug("> Saving Components registry snapshot to '{0}' file.".format(file))
+
+        profiles = []
+        for name, profile in sorted(self, key=lambda x: x[0]):
+            data = profile.serialize_profile()
+            data["signature"] = profile.signature
+            data["category"] = profile.category
+            profiles.append(data)
+
+        try:
+            order = self.__dependency_graph.get_order()
+        except manager.exceptions.ComponentDependenciesError:
+            order = None
+
+        data = self.__get_walking_settings()
+        data.update({"format": Constants.snapshot_format,
+                     "directories": [(directory, get_file_signature(directory))
+                                     for directory in self.__walked_directories
+                                     if os.path.isdir(directory)],
+                     "profiles": profiles,
+                     "order": order})
+
+        with codecs.open(file, "w", encoding=Constants.default_codec) as file_object:
+            file_object.write(json.dumps(data, ensure_ascii=False))
+        return True
+
+    def load_snapshot(self, file):
+        """
+        | Restores the Components registry from given snapshot file as saved by :meth:`Manager.save_snapshot` method,
+            replacing the registered Components.
+        | Neither the paths are walked nor the Components files parsed, the snapshot is only restored if it matches
+            the paths walking settings and neither the walked directories nor the Components files signatures
+            changed, the Components need to be registered with :meth:`Manager.register_components` method otherwise.
+
+        Usage::
+
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
+            >>> manager.load_snapshot("components.snapshot") or manager.register_components()
+            True
+            >>> manager.components.keys()
+            [u'core.tests_component_a', u'core.tests_component_b']
+
+        :param file: Snapshot file.
+        :type file: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        LOGGER.debug("> Loading Components registry snapshot from '{0}' file.".format(file))
+
+        try:
+            with codecs.open(file, "r", encoding=Constants.default_codec) as file_object:
+                data = json.load(file_object)
+        except (IOError, ValueError) as error:
+            LOGGER.warning("!> {0} | '{1}' snapshot file cannot be read: '{2}'".format(
+                self.__class__.__name__, file, error))
+            return False
+
+        if not isinstance(data, dict) or data.get("format") != Constants.snapshot_format:
+            LOGGER.warning("!> {0} | '{1}' snapshot file format is not supported!".format(
+                self.__class__.__name__, file))
+            return False
+
+        if any(data.get(key) != value for key, value in self.__get_walking_settings().iteritems()):
+            LOGGER.debug("> '{0}' snapshot file paths walking settings are different.".format(file))
+            return False
+
+        for directory, signature in data.get("directories", ()):
+            if not os.path.isdir(directory) or get_file_signature(directory) != signature:
+                LOGGER.debug("> '{0}' snapshot file is outdated: '{1}' directory changed.".format(file, directory))
+                return False
+
+        for profile_data in data.get("profiles", ()):
+            path = profile_data["file"]
+            if not os.path.isfile(path) or self.__get_signature(path) != profile_data.get("signature"):
+                LOGGER.debug("> '{0}' snapshot file is outdated: '{1}' file changed.".format(file, path))
+                return False
+
+        self.unregister_components()
+        for profile_data in data.get("profiles", ()):
+            profile = Profile()
+            profile.deserialize_profile(profile_data)
+            profile.signature = profile_data.get("signature")
+            profile.category = profile_data.get("category")
+            self.__store_profile(profile)
+
+        self.__walked_directories = [directory for directory, signature in data.get("directories", ())]
+        data.get("order") is not None and self.__dependency_graph.set_order(data["order"])
+        return True
+
+    def __prepare_component(self, component, callback=None):
+        """
+        Prepares given Component instantiation.
+
+        :param component: Component to prepare.
+        :type component: unicode
+        :param callback: Callback object.
+        :type callback: object
+        :return: Component profile.
+        :rtype: Profile
+        """
+
+        profile = self.__components[component]
+        callback and callback(profile)
+
+        LOGGER.debug("> Current Component: '{0}'.".format(component))
+
+        path = self.__get_module_path(profile)
+        if path is not None:
+            self.__importer.register(profile.package, path)
+            self.__importer.install()
+        return profile
+
+    def __import_component(self, profile, threaded=False):
+        """
+        | Imports given Component module and instantiates its Interface.
+        | :class:`PyQt4.QtCore.QObject` class based Interfaces are not instantiated when threaded as they need to be
+            instantiated in the main thread.
+
+        :param profile: Component profile.
+        :type profile: Profile
+        :param threaded: Component is imported from a worker thread.
+        :type threaded: bool
+        :return: Component Interface class, Component Interface.
+        :rtype: tuple
+        """
+
+        with timer(profile.timings, "import"):
+            profile.module = __import__(profile.package)
+        object = profile.attribute in profile.module.__dict__ and getattr(profile.module, profile.attribute) or None
+        if object and inspect.isclass(object) and not (threaded and issubclass(object, QObject)):
+            with timer(profile.timings, "construct"):
+                return object, object(name=profile.name)
+        return object, None
+
+    @foundations.exceptions.handle_exceptions(manager.exceptions.ComponentInterfaceError)
+    def __set_component_interface(self, profile, object, instance=None):
+        """
+        Sets given Component Interface.
+
+        :param profile: Component profile.
+        :type profile: Profile
+        :param object: Component Interface class.
+        :type object: object
+        :param instance: Component Interface, instantiated from the Interface class if not given.
+        :type instance: object
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if object and inspect.isclass(object):
+            if instance is None:
+                with timer(profile.timings, "construct"):
+                    instance = object(name=profile.name)
+            category = self.__get_category(object)
+            if category is not None:
+                profile.category = category
+                profile.interface = instance
+                LOGGER.info("{0} | '{1}' Component has been instantiated!".format(
+                    self.__class__.__name__, profile.name))
+                return True
+        else:
+            self.__discard_profile(profile.name)
+            raise manager.exceptions.ComponentInterfaceError(
+                "{0} | '{1}' Component has no Interface and has been rejected!".format(self.__class__.__name__,
+                                                                                       profile.name))
+
+    def compile_components(self, workers=None, directory=None):
+        """
+        | Compiles the Components modules to bytecode.
+        | Given directory, defaulting to the bytecode directory, receives the bytecode files instead of the
+            Components modules directories, mirroring the Components packages hierarchies, for deployments where the
+            Components modules directories are read-only. Managers using that directory as their bytecode directory
+            load the Components modules from it.
+
+        Usage::
+
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
+            >>> manager.register_components()
+            True
+            >>> manager.compile_components(workers=8)
+            True
+
+        :param workers: Modules are compiled concurrently using given processes count.
+        :type workers: int
+        :param directory: Bytecode files directory.
+        :type directory: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        directory = directory if directory is not None else self.__bytecode_directory
+
+        files = {}
+        for name, profile in self:
+            path, sources = self.__get_module_files(profile)
+            for source in sources:
+                files[source] = None if directory is None else \
+                    "{0}c".format(os.path.join(directory, os.path.relpath(source, path)))
+
+        if directory is not None:
+            for target in set(os.path.dirname(target) for target in files.itervalues()):
+                os.path.isdir(target) or os.makedirs(target)
+
+        files = sorted(files.iteritems())
+        if workers > 1 and len(files) > 1:
+            LOGGER.debug("> Compiling '{0}' Components modules using '{1}' workers.".format(len(files), workers))
+            pool = multiprocessing.Pool(min(workers, len(files)))
+            try:
+                errors = pool.map(manager.bytecode.compile_file, files)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            errors = map(manager.bytecode.compile_file, files)
+
+        errors = [error for error in errors if error is not None]
+        if not errors:
+            return True
+        else:
+            raise manager.exceptions.ComponentModuleError(
+                "{0} | Components modules failed to compile:\n{1}".format(self.__class__.__name__,
+                                                                          "\n".join(errors)))
+
+    @foundations.exceptions.handle_exceptions(manager.exceptions.ComponentInterfaceError)
+    def instantiate_component(self, component, callback=None):
+        """
+        Instantiates given Component.
+
+        Usage::
+
+            >>> manager = Manager()
+            >>> manager.register_component("tests_component_a.rc")
+            True
+            >>> manager.instantiate_component("core.tests_component_a")
+            True
+            >>> manager.get_interface("core.tests_component_a")
+            <tests_component_a.TestsComponentA object at 0x17a5b90>
+
+        :param component: Component to instantiate.
+        :type component: unicode
+        :param callback: Callback object.
+        :type callback: object
+        """
+
+        profile = self.__prepare_component(component, callback)
+        return self.__set_component_interface(profile, *self.__import_component(profile))
+
+    def instantiate_components(self, callback=None, workers=None, lazy=False, targets=None):
+        """
+        | Instantiates the Components.
+        | Using workers, each Component is imported and instantiated in a threads pool as soon as its dependencies
+            are instantiated, :class:`PyQt4.QtCore.QObject` class based Interfaces and given callback are
+            still processed in the calling thread.
+        | The Components are instantiated serially when called while a module import is in progress: the
+            workers would wait for the import lock held by the calling thread.
+        | Lazily instantiated Components Interfaces are :class:`manager.proxies.InterfaceProxy` class instances
+            importing and instantiating the Component and its dependencies on first use, :func:`isinstance`
+            definition checks resolve them but :func:`type` definition returns the proxy class.
+        | Given targets restrict the instantiation to the targets and their transitive dependencies, already
+            instantiated Components are skipped.
+
+        Usage::
+
+            >>> manager = Manager((tests_manager,))
+            >>> manager.register_components()
+            True
+            >>> manager.instantiate_components()
+            True
+            >>> manager.get_interface("core.tests_component_a")
+            <tests_component_a.TestsComponentA object at 0x17a5bb0>
+            >>> manager.instantiate_components(workers=8)
+            True
+            >>> manager.instantiate_components(targets=["core.tests_component_b"])
+            True
+
+        :param callback: Callback object.
+        :type callback: object
+        :param workers: Components are instantiated concurrently using given threads count.
+        :type workers: int
+        :param lazy: Components instantiation is deferred until their Interfaces are used.
+        :type lazy: bool
+        :param targets: Components to instantiate along their dependencies.
+        :type targets: tuple or list
+        """
+
+        if targets is None:
+            components = self.list_components()
+        else:
+            components = set(targets)
+            for target in targets:
+                components.update(self.__dependency_graph.get_dependencies(target))
+
+            missing_components = sorted(component for component in components if component not in self.__components)
+            if missing_components:
+                raise manager.exceptions.ComponentExistsError(
+                    "{0} | '{1}' Components are not registered!".format(self.__class__.__name__,
+                                                                        ", ".join(missing_components)))
+
+            components = sorted((component for component in components
+                                 if self.__components[component].module is None),
+                                key=self.__dependency_graph.get_ranks().get)
+
+        if lazy:
+            for component in components:
+                profile = self.__components.get(component)
+                if profile is not None and profile.module is None and profile.interface is None:
+                    profile.interface = InterfaceProxy(self, component, callback)
+            return True
+
+        if workers > 1 and len(components) > 1 and imp.lock_held():
+            LOGGER.debug("> Import lock is held, Components are instantiated without workers.")
+            workers = None
+
+        if workers > 1 and len(components) > 1:
+            LOGGER.debug("> Instantiating '{0}' Components using '{1}' workers.".format(len(components), workers))
+            requires = self.__dependency_graph.requires
+            scheduler = DependenciesScheduler(dict((component, requires.get(component, ()))
+                                                   for component in components), workers)
+            results = scheduler.execute(
+                lambda x: self.__import_component(self.__components[x], threaded=True),
+                initializer=lambda x: self.__prepare_component(x, callback),
+                finalizer=lambda x, y: self.__set_component_interface(self.__components[x], *y))
+            uninstantiated_components = [component for component in components if not results.get(component)]
+        else:
+            uninstantiated_components = [component
+                                         for component in components
+                                         if not self.instantiate_component(component, callback)]
+        if not uninstantiated_components:
+            return True
+        else:
+            raise manager.exceptions.ComponentInstantiationError(
+                "{0} | '{1}' Components failed to instantiate!".format(self.__class__.__name__,
+                                                                       ", ".join(uninstantiated_components)))
+
+    def __get_interface(self, component):
+        """
+        Returns given Component resolved Interface.
+
+        :param component: Component name.
+        :type component: unicode
+        :return: Component Interface.
+        :rtype: object
+        """
+
+        profile = self.__components[component]
+        if profile.interface is None:
+            raise manager.exceptions.ComponentInterfaceError(
+                "{0} | '{1}' Component is not instantiated!".format(self.__class__.__name__, component))
 
-    def __contains__(self, component):
+        return resolve_interface(profile.interface)
+
+    def initialize_component(self, component, *args, **kwargs):
         """
-        Reimplements the :meth:`object.__contains__` method.
+        | Initializes given Component, timing its Interface initialization.
+        | :class:`manager.QWidget_component.QWidgetComponentFactory` definition Components are initialized with
+            their **initialize_ui** method.
 
         Usage::
 
             >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
             >>> manager.register_components()
             True
-            >>> tests_component_a in manager
+            >>> manager.instantiate_components()
+            True
+            >>> manager.initialize_component("core.tests_component_a")
             True
-            >>> "core.nemoComponent" in manager
-            False
 
-        :param component: Component name.
+        :param component: Component to initialize.
         :type component: unicode
-        :return: Component existence.
-        :rtype: bool
+        :param \*args: Arguments.
+        :type \*args: \*
+        :param \*\*kwargs: Keywords arguments.
+        :type \*\*kwargs: \*\*
+        :return: Interface initialization result.
+        :rtype: object
         """
 
-        return component in self.__components.keys()
+        interface = self.__get_interface(component)
+        initialize = interface.initialize if hasattr(interface, "initialize") else interface.initialize_ui
+        with timer(self.__components[component].timings, "initialize"):
+            return initialize(*args, **kwargs)
 
-    def __len__(self):
+    def activate_component(self, component, *args, **kwargs):
         """
-        Reimplements the :meth:`object.__len__` method.
+        Activates given Component, timing its Interface activation.
 
         Usage::
 
             >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
             >>> manager.register_components()
             True
-            >>> len(manager)
-            2
-
-        :return: Components count.
-        :rtype: int
-        """
-
-        return len(self.__components.keys())
-
-    @foundations.exceptions.handle_exceptions(manager.exceptions.ComponentModuleError,
-                                              manager.exceptions.ComponentProfileError)
-    def register_component(self, path):
-        """
-        Registers a Component using given path.
-
-        Usage::
-
-            >>> manager = Manager()
-            >>> manager.register_component("tests_component_a.rc")
+            >>> manager.instantiate_components()
+            True
+            >>> manager.activate_component("core.tests_component_a", container)
             True
-            >>> manager.components
-            {u'core.tests_component_a': <manager.components_manager.Profile object at 0x11c9eb0>}
 
-        :param path: Component path.
-        :type path: unicode
-        :return: Method success.
-        :rtype: bool
+        :param component: Component to activate.
+        :type component: unicode
+        :param \*args: Arguments.
+        :type \*args: \*
+        :param \*\*kwargs: Keywords arguments.
+        :type \*\*kwargs: \*\*
+        :return: Interface activation result.
+        :rtype: object
         """
 
-        component = foundations.strings.get_splitext_basename(path)
-        LOGGER.debug("> Current Component: '{0}'.".format(component))
-        profile = Profile(file=path)
-        if profile.initializeProfile():
-            if os.path.isfile(os.path.join(profile.directory, profile.package) + ".py") or \
-                    os.path.isdir(os.path.join(profile.directory, profile.package)) or \
-                            os.path.basename(profile.directory) == profile.package:
-                self.__components[profile.name] = profile
-                return True
-            else:
-                raise manager.exceptions.ComponentModuleError(
-                    "{0} | '{1}' has no associated module and has been rejected!".format(self.__class__.__name__,
-                                                                                         component))
-        else:
-            raise manager.exceptions.ComponentProfileError(
-                "{0} | '{1}' is not a valid Component and has been rejected!".format(self.__class__.__name__,
-                                                                                     component))
-
-    def unregister_component(self, component):
+        interface = self.__get_interface(component)
+        with timer(self.__components[component].timings, "activate"):
+            return interface.activate(*args, **kwargs)
+
+    def __execute_lifecycle(self, components, dependencies, action, error, workers=None):
+        """
+        | Executes given lifecycle action on given Components.
+        | Using workers, each Component action is executed in a threads pool as soon as its dependencies actions are
+            done, :class:`PyQt4.QtCore.QObject` class based Interfaces actions are still executed in the calling
+            thread.
+        | Failures are reported per Component without aborting the others, Components whose dependencies failed
+            are skipped.
+
+        :param components: Components in execution order.
+        :type components: list
+        :param dependencies: Components executed before each Component.
+        :type dependencies: dict
+        :param action: Action called with the Component name and its Interface.
+        :type action: object
+        :param error: Exception class reporting the failures.
+        :type error: type
+        :param workers: Components actions are executed concurrently using given threads count.
+        :type workers: int
+        :return: Components failures.
+        :rtype: dict
         """
-        Unregisters given Component.
-
-        .. warning::
-
-            The :class:`Manager` class is not responsible of any deactivation / cleanup actions
-            and will not trigger anything while unregistering a Component.
 
-        Usage::
+        failures, interfaces = {}, {}
+
+        def prepare(component):
+            failed_dependencies = sorted(dependency for dependency in dependencies.get(component, ())
+                                         if dependency in failures)
+            if failed_dependencies:
+                failures[component] = error("{0} | '{1}' Component is skipped, '{2}' Components failed!".format(
+                    self.__class__.__name__, component, ", ".join(failed_dependencies)))
+                return
+
+            try:
+                interfaces[component] = self.__get_interface(component)
+            except Exception as exception:
+                failures[component] = error("{0} | '{1}' Component failed: '{2}'".format(
+                    self.__class__.__name__, component, exception))
+
+        def execute(component):
+            if component not in interfaces:
+                return
+
+            try:
+                action(component, interfaces.pop(component))
+            except Exception as exception:
+                failures[component] = error("{0} | '{1}' Component failed: '{2}'".format(
+                    self.__class__.__name__, component, exception))
+
+        def initializer(component):
+            prepare(component)
+            if isinstance(interfaces.get(component), QObject):
+                execute(component)
+
+        if workers > 1 and len(components) > 1:
+            LOGGER.debug("> Executing '{0}' Components lifecycle using '{1}' workers.".format(len(components),
+                                                                                           workers))
+            scheduler = DependenciesScheduler(dict((component, dependencies.get(component, ()))
+                                                   for component in components), workers)
+            scheduler.execute(execute, initializer=initializer)
+        else:
+            for component in components:
+                prepare(component)
+                execute(component)
 
-            >>> manager = Manager()
-            >>> manager.register_component("tests_component_a.rc")
-            True
-            >>> manager.unregister_component("core.tests_component_a")
-            True
-            >>> manager.components
-            {}
+        for component, failure in sorted(failures.iteritems()):
+            LOGGER.warning("!> {0}".format(failure))
+        return failures
 
-        :param component: Component to remove.
-        :type component: unicode
-        :return: Method success.
-        :rtype: bool
+    def __list_deactivable_components(self):
         """
+        Lists the instantiated Components in reverse dependency order, lazily instantiated Components that were never
+        used are skipped.
 
-        del (self.__components[component])
-        return True
-
-    @foundations.exceptions.handle_exceptions(manager.exceptions.ComponentRegistrationError)
-    def register_components(self):
+        :return: Components.
+        :rtype: list
         """
-        Registers the Components.
 
-        Usage::
+        return [component for component in reversed(self.list_components(dependency_order=True))
+                if self.__components[component].interface is not None and
+                is_resolved(self.__components[component].interface)]
 
-            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
-            >>> manager.register_components()
-            True
-            >>> manager.components.keys()
-            [u'core.tests_component_a', u'core.tests_component_b']
+    @staticmethod
+    def __deactivate_interface(interface):
+        """
+        Deactivates and uninitializes given Interface, non deactivatable Interfaces are skipped.
 
-        :return: Method success.
-        :rtype: bool
+        :param interface: Interface.
+        :type interface: object
         """
 
-        unregistered_components = []
-        for path in self.paths:
-            for file in foundations.walkers.files_walker(path, ("\.{0}$".format(self.__extension),), ("\._",)):
-                if not self.register_component(file):
-                    unregistered_components.append(file)
+        if not interface.deactivatable:
+            return
 
-        if not unregistered_components:
-            return True
+        if interface.activated:
+            interface.deactivate()
+        if hasattr(interface, "initialized"):
+            interface.initialized and interface.uninitialize()
         else:
-            raise manager.exceptions.ComponentRegistrationError(
-                "{0} | '{1}' Components failed to register!".format(self.__class__.__name__,
-                                                                    ", ".join(unregistered_components)))
+            interface.initialized_ui and interface.uninitialize_ui()
 
-    def unregister_components(self):
+    def activate_components(self, arguments=(), workers=None):
         """
-        Unregisters the Components.
-
-        .. warning::
-
-            The :class:`Manager` class is not responsible of any deactivation / cleanup actions
-            and will not trigger anything while unregistering a Component.
+        | Initializes and activates the instantiated Components in dependency order.
+        | Already initialized or activated Components are not initialized or activated again.
 
         Usage::
 
             >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
             >>> manager.register_components()
             True
-            >>> manager.unregister_components()
+            >>> manager.instantiate_components()
             True
-            >>> manager.components
+            >>> manager.activate_components((container,), workers=8)
             {}
 
-        :return: Method success.
-        :rtype: bool
+        :param arguments: Interfaces activation arguments.
+        :type arguments: tuple
+        :param workers: Components are activated concurrently using given threads count.
+        :type workers: int
+        :return: Components failures.
+        :rtype: dict
         """
 
-        self.__components.clear()
-        return True
+        def activate(component, interface):
+            if not (interface.initialized if hasattr(interface, "initialized") else interface.initialized_ui):
+                self.initialize_component(component)
+            if not interface.activated:
+                self.activate_component(component, *arguments)
 
-    @foundations.exceptions.handle_exceptions(manager.exceptions.ComponentInterfaceError)
-    def instantiate_component(self, component, callback=None):
+        components = [component for component in self.list_components(dependency_order=True)
+                      if self.__components[component].interface is not None]
+        requires = self.__dependency_graph.requires
+        return self.__execute_lifecycle(components,
+                                        dict((component, requires.get(component, ())) for component in components),
+                                        activate,
+                                        manager.exceptions.ComponentActivationError,
+                                        workers)
+
+    def deactivate_components(self, workers=None):
         """
-        Instantiates given Component.
+        | Deactivates and uninitializes the activated Components in reverse dependency order.
+        | Non deactivatable Components and lazily instantiated Components that were never used are skipped.
 
         Usage::
 
-            >>> manager = Manager()
-            >>> manager.register_component("tests_component_a.rc")
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
+            >>> manager.register_components()
             True
-            >>> manager.instantiate_component("core.tests_component_a")
+            >>> manager.instantiate_components()
             True
-            >>> manager.get_interface("core.tests_component_a")
-            <tests_component_a.TestsComponentA object at 0x17a5b90>
+            >>> manager.activate_components((container,))
+            {}
+            >>> manager.deactivate_components(workers=8)
+            {}
 
-        :param component: Component to instantiate.
-        :type component: unicode
-        :param callback: Callback object.
-        :type callback: object
+        :param workers: Components are deactivated concurrently using given threads count.
+        :type workers: int
+        :return: Components failures.
+        :rtype: dict
         """
 
-        profile = self.__components[component]
-        callback and callback(profile)
-
-        LOGGER.debug("> Current Component: '{0}'.".format(component))
-
-        if os.path.isfile(os.path.join(profile.directory, profile.package) + ".py") or \
-                os.path.isdir(os.path.join(profile.directory, profile.package)):
-            path = profile.directory
-        elif os.path.basename(profile.directory) == profile.package:
-            path = os.path.join(profile.directory, "..")
-        not path in sys.path and sys.path.append(path)
-
-        profile.module = __import__(profile.package)
-        object = profile.attribute in profile.module.__dict__ and getattr(profile.module, profile.attribute) or None
-        if object and inspect.isclass(object):
-            instance = object(name=profile.name)
-            for category, type in self.__categories.iteritems():
-                if type.__name__ in (base.__name__ for base in object.__bases__):
-                    profile.category = category
-                    profile.interface = instance
-                    LOGGER.info("{0} | '{1}' Component has been instantiated!".format(
-                        self.__class__.__name__, profile.name))
-                    return True
-        else:
-            del (self.__components[component])
-            raise manager.exceptions.ComponentInterfaceError(
-                "{0} | '{1}' Component has no Interface and has been rejected!".format(self.__class__.__name__,
-                                                                                       profile.name))
+        components = self.__list_deactivable_components()
+        dependents = self.__dependency_graph.dependents
+        return self.__execute_lifecycle(components,
+                                        dict((component, dependents.get(component, ()))
+                                             for component in components),
+                                        lambda x, y: self.__deactivate_interface(y),
+                                        manager.exceptions.ComponentDeactivationError,
+                                        workers)
 
-    def instantiate_components(self, callback=None):
+    def shutdown_components(self, timeout=None, workers=4):
         """
-        Instantiates the Components.
+        | Deactivates and uninitializes the activated Components in reverse dependency level batches.
+        | Each batch Components are deactivated concurrently in daemon threads, Components exceeding given time
+            budget are reported and left running so that they do not block the shutdown nor the process exit.
+        | :class:`PyQt4.QtCore.QObject` class based Interfaces are deactivated in the calling thread and cannot be
+            interrupted, they are reported if they exceeded their time budget.
+        | Failures do not prevent the next batches from being deactivated.
 
         Usage::
 
-            >>> manager = Manager((tests_manager,))
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
             >>> manager.register_components()
             True
             >>> manager.instantiate_components()
             True
-            >>> manager.get_interface("core.tests_component_a")
-            <tests_component_a.TestsComponentA object at 0x17a5bb0>
+            >>> manager.activate_components((container,))
+            {}
+            >>> manager.shutdown_components(timeout=2.5, workers=8)
+            {}
 
-        :param callback: Callback object.
-        :type callback: object
+        :param timeout: Time budget in seconds of each Component deactivation, unlimited if None.
+        :type timeout: float
+        :param workers: Components deactivated concurrently count.
+        :type workers: int
+        :return: Components failures, overruns are reported with
+            :class:`manager.exceptions.ComponentTimeoutError` class instances.
+        :rtype: dict
         """
 
-        uninstantiated_components = [component
-                                     for component in self.list_components()
-                                     if not self.instantiate_component(component, callback)]
-        if not uninstantiated_components:
-            return True
-        else:
-            raise manager.exceptions.ComponentInstantiationError(
-                "{0} | '{1}' Components failed to instantiate!".format(self.__class__.__name__,
-                                                                       ", ".join(uninstantiated_components)))
+        batches = {}
+        for component in self.__list_deactivable_components():
+            batches.setdefault(self.__dependency_graph.get_level(component), []).append(component)
+
+        failures, queue = {}, Queue.Queue()
+
+        def deactivate(component, interface):
+            try:
+                self.__deactivate_interface(interface)
+                queue.put((component, None))
+            except Exception as error:
+                queue.put((component, error))
+
+        def report_failure(component, error):
+            failures[component] = manager.exceptions.ComponentDeactivationError(
+                "{0} | '{1}' Component failed: '{2}'".format(self.__class__.__name__, component, error))
+
+        def report_overrun(component, elapsed):
+            failures[component] = manager.exceptions.ComponentTimeoutError(
+                "{0} | '{1}' Component deactivation exceeded '{2}' seconds budget: '{3:.3f}' seconds!".format(
+                    self.__class__.__name__, component, timeout, elapsed))
+
+        for level in sorted(batches, reverse=True):
+            LOGGER.debug("> Shutting down '{0}' Components of '{1}' level.".format(len(batches[level]), level))
+
+            pending, running = list(batches[level]), {}
+            while pending or running:
+                while pending and len(running) < max(1, workers):
+                    component = pending.pop(0)
+                    try:
+                        interface = self.__get_interface(component)
+                    except Exception as error:
+                        report_failure(component, error)
+                        continue
+
+                    start = time.time()
+                    if isinstance(interface, QObject):
+                        try:
+                            self.__deactivate_interface(interface)
+                        except Exception as error:
+                            report_failure(component, error)
+                            continue
+
+                        elapsed = time.time() - start
+                        timeout is not None and elapsed > timeout and report_overrun(component, elapsed)
+                        continue
+
+                    thread = threading.Thread(target=deactivate, args=(component, interface))
+                    thread.daemon = True
+                    thread.start()
+                    running[component] = start
+
+                if not running:
+                    continue
+
+                try:
+                    wait = None if timeout is None else max(0, min(running.itervalues()) + timeout - time.time())
+                    component, error = queue.get(timeout=wait)
+                except Queue.Empty:
+                    now = time.time()
+                    for component, start in running.items():
+                        if now - start >= timeout:
+                            del running[component]
+                            report_overrun(component, now - start)
+                    continue
+
+                running.pop(component, None)
+                if error is not None and component not in failures:
+                    report_failure(component, error)
+
+        for component, failure in sorted(failures.iteritems()):
+            LOGGER.warning("!> {0}".format(failure))
+        return failures
 
     def reload_component(self, component):
         """
@@ -1201,22 +3188,25 @@ class Manager(object):
 
         for dependent in dependents:
             profile = self.__components[dependent]
+            if dependent != component and profile.module is None:
+                continue
+
             module = __import__(profile.package)
             reload(module)
             object = profile.attribute in dir(module) and getattr(module, profile.attribute) or None
-            if object and inspect.isclass(object):
-                for type in self.__categories.itervalues():
-                    if type.__name__ in (base.__name__ for base in object.__bases__):
-                        instance = object(name=profile.name)
-                        profile.module = module
-                        profile.interface = instance
-                        LOGGER.info("{0} | '{1}' Component has been reloaded!".format(
-                            self.__class__.__name__, profile.name))
+            if object and inspect.isclass(object) and self.__get_category(object) is not None:
+                instance = object(name=profile.name)
+                profile.module = module
+                profile.interface = instance
+                LOGGER.info("{0} | '{1}' Component has been reloaded!".format(
+                    self.__class__.__name__, profile.name))
         return True
 
     def list_components(self, dependency_order=True):
         """
-        Lists the Components by dependency resolving.
+        | Lists the Components by dependency resolving.
+        | The dependency order is cached by the Components dependency graph and only resolved again for the
+            Components affected by registrations changes since last call.
 
         Usage::
 
@@ -1228,18 +3218,20 @@ class Manager(object):
 
         :param dependency_order: Components are returned by dependency order.
         :type dependency_order: bool
+        :return: Components.
+        :rtype: list
         """
 
         if dependency_order:
-            return list(itertools.chain.from_iterable([sorted(list(batch)) for batch in
-                                                       foundations.common.dependency_resolver(
-                                                           dict((key, value.require) for (key, value) in self))]))
+            return list(self.__dependency_graph.get_order())
         else:
             return [key for (key, value) in self]
 
     def list_dependents(self, component, dependents=None):
         """
-        Lists given Component dependents Components.
+        | Lists given Component dependents Components.
+        | Dependents are traversed from the Components dependency graph reverse dependencies edges and ordered
+            using its cached dependency ranks.
 
         Usage::
 
@@ -1258,18 +3250,125 @@ class Manager(object):
         """
 
         dependents = set() if dependents is None else dependents
-        for name, profile in self:
-            if not component in profile.require:
-                continue
+        dependents.update(self.__dependency_graph.get_dependents(component))
+
+        return sorted(dependents, key=self.__dependency_graph.get_ranks().get)
+
+    def list_dependencies(self, component):
+        """
+        | Lists given Component dependencies Components, including missing ones.
+        | Dependencies are traversed from the Components dependency graph and ordered using its cached dependency
+            ranks.
+
+        Usage::
+
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
+            >>> manager.register_components()
+            True
+            >>> manager.list_dependencies("core.tests_component_b")
+            [u'core.tests_component_a']
+
+        :param component: Component to retrieve the dependencies Components.
+        :type component: unicode
+        :return: Dependencies Components.
+        :rtype: list
+        """
+
+        return sorted(self.__dependency_graph.get_dependencies(component),
+                      key=self.__dependency_graph.get_ranks().get)
+
+    def get_critical_path(self, clock="wall"):
+        """
+        | Returns the Components startup critical path from their recorded timings.
+        | The critical path is the dependencies chain with the highest cumulated time, bounding the startup time
+            achievable by instantiating and activating independent Components concurrently.
+
+        Usage::
+
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
+            >>> manager.register_components()
+            True
+            >>> manager.instantiate_components()
+            True
+            >>> manager.get_critical_path()
+            ([u'core.tests_component_a', u'core.tests_component_b'], 0.00123)
+
+        :param clock: Clock, **wall** or **cpu**.
+        :type clock: unicode
+        :return: Critical path Components, critical path time.
+        :rtype: tuple
+        """
+
+        return get_critical_path(self.__dependency_graph.get_order(),
+                                 self.__dependency_graph.requires,
+                                 dict((name, get_total_time(profile.timings, clock)) for name, profile in self))
+
+    def get_timings_report(self, clock="wall"):
+        """
+        Returns the Components timings report, sorted by descending total time and including the critical path.
+
+        Usage::
+
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
+            >>> manager.register_components()
+            True
+            >>> manager.instantiate_components()
+            True
+            >>> print(manager.get_timings_report())
+            Component                    Total       parse      import   construct
+            core.tests_component_b        1.02        0.61        0.38        0.03
+            core.tests_component_a        0.91        0.52        0.36        0.03
+            <BLANKLINE>
+            Critical path: 1.93ms
+                core.tests_component_a
+                core.tests_component_b
+
+        :param clock: Reported clock, **wall** or **cpu**.
+        :type clock: unicode
+        :return: Report, times are in milliseconds.
+        :rtype: unicode
+        """
+
+        return format_report(dict((name, profile.timings) for name, profile in self),
+                             self.get_critical_path(clock),
+                             clock)
+
+    def save_timings(self, file):
+        """
+        Saves the Components timings and critical paths into given JSON file, times are in seconds.
+
+        Usage::
+
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
+            >>> manager.register_components()
+            True
+            >>> manager.save_timings("timings.json")
+            True
+
+        :param file: Timings file.
+        :type file: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        LOGGER.debug("> Saving Components timings to '{0}' file.".format(file))
 
-            dependents.add(name)
-            self.list_dependents(name, dependents)
+        critical_paths = {}
+        for clock in CLOCKS:
+            components, total = self.get_critical_path(clock)
+            critical_paths[clock] = {"components": components, "total": total}
 
-        return sorted(list(dependents), key=(self.list_components()).index)
+        with codecs.open(file, "w", encoding=Constants.default_codec) as file_object:
+            file_object.write(json.dumps({"components": dict((name, profile.timings) for name, profile in self),
+                                          "critical_path": critical_paths}, ensure_ascii=False, indent=4))
+        return True
 
-    def filter_components(self, pattern, category=None):
+    def filter_components(self, pattern=None, category=None, package=None, version=None, author=None, glob=None):
         """
-        Filters the Components using given regex pattern.
+        | Filters the Components using given regex or glob pattern and attributes values.
+        | Attributes filters are resolved from the Components secondary indexes before any pattern matching.
+        | Patterns literal prefixes are resolved from the sorted Components names, anchored literal regex patterns
+            such as `^addons\.` and glob patterns such as `addons.*` do not require any pattern matching.
 
         Usage::
 
@@ -1278,23 +3377,72 @@ class Manager(object):
             True
             >>> manager.filter_components("\w+A$")
             [u'core.tests_component_a']
+            >>> manager.filter_components(package="tests_component_b")
+            [u'core.tests_component_b']
+            >>> manager.filter_components(glob="core.*")
+            [u'core.tests_component_a', u'core.tests_component_b']
 
         :param pattern: Regex filtering pattern.
         :type pattern: unicode
         :param category: Category filter.
         :type category: unicode
+        :param package: Package filter.
+        :type package: unicode
+        :param version: Version filter.
+        :type version: unicode
+        :param author: Author filter.
+        :type author: unicode
+        :param glob: Glob filtering pattern.
+        :type glob: unicode
         :return: Matching Components.
         :rtype: list
         """
 
-        filtered_components = []
-        for component, profile in self:
-            if category:
-                if profile.category != category:
-                    continue
+        components = None
+        for attribute, value in (("category", category or None),
+                                 ("package", package),
+                                 ("version", version),
+                                 ("author", author)):
+            if value is None:
+                continue
+
+            matches = self.__indexes.get(attribute, value)
+            components = set(matches) if components is None else components.intersection(matches)
+            if not components:
+                return []
+
+        queries = []
+        if pattern is not None:
+            if isinstance(pattern, basestring):
+                prefix, query = manager.queries.parse_pattern(pattern)
+                queries.append((prefix, query, manager.queries.compile_pattern(pattern).search))
+            else:
+                queries.append(("", manager.queries.QUERY_PATTERN, pattern.search))
+        if glob is not None:
+            prefix, query = manager.queries.parse_glob(glob)
+            queries.append((prefix, query, manager.queries.translate_glob(glob).match))
+        queries.sort(key=lambda x: (x[1] != manager.queries.QUERY_EXACT, -len(x[0])))
+
+        prefix, query, matcher = queries[0] if queries else ("", manager.queries.QUERY_PREFIX, None)
+        if query == manager.queries.QUERY_EXACT:
+            filtered_components = [prefix] if prefix in self.__components and \
+                                              (components is None or prefix in components) else []
+        elif components is not None:
+            filtered_components = sorted(component for component in components if component.startswith(prefix))
+        else:
+            filtered_components = self.__indexes.get_prefixed(prefix)
+
+        for i, (prefix, query, matcher) in enumerate(queries):
+            if i == 0 and query != manager.queries.QUERY_PATTERN:
+                continue
 
-            if re.search(pattern, component):
-                filtered_components.append(component)
+            if query == manager.queries.QUERY_EXACT:
+                filtered_components = [component for component in filtered_components if component == prefix]
+            elif query == manager.queries.QUERY_PREFIX:
+                filtered_components = [component for component in filtered_components
+                                       if component.startswith(prefix)]
+            else:
+                filtered_components = [component for component in filtered_components if matcher(component)]
         return filtered_components
 
     def get_profile(self, component):
@@ -1315,7 +3463,27 @@ class Manager(object):
         :rtype: Profile
         """
 
-        components = self.filter_components(r"^{0}$".format(component))
+        return self.__components.get(component)
+
+    def match_profile(self, pattern):
+        """
+        Gets the first Component profile matching given regex pattern.
+
+        Usage::
+
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
+            >>> manager.register_components()
+            True
+            >>> manager.match_profile(r"\w+_a$")
+            <manager.components_manager.Profile object at 0x10258ef10>
+
+        :param pattern: Regex filtering pattern.
+        :type pattern: unicode
+        :return: Component profile.
+        :rtype: Profile
+        """
+
+        components = self.filter_components(pattern)
         if components != []:
             return self.__components[foundations.common.get_first_item(components)]
 
@@ -0,0 +1,373 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**dependency_graph.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines the :class:`DependencyGraph` class.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import foundations.exceptions
+import foundations.verbose
+import manager.exceptions
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "DependencyGraph"]
+
+LOGGER = foundations.verbose.install_logger()
+
+
+class DependencyGraph(object):
+    """
+    | Defines an incrementally updated Components dependency graph.
+    | Each Component level is one more than the highest level of its dependencies, Components without
+        dependencies and missing dependencies are at level 0. The dependency order sorts the Components by level
+        then name, matching :func:`foundations.common.dependency_resolver` definition batches.
+    | Levels and dependency order are cached, adding or removing a Component only invalidates its dependents
+        levels.
+    """
+
+    def __init__(self):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> dependency_graph = DependencyGraph()
+            >>> dependency_graph.add("core.tests_component_b", ["core.tests_component_a"])
+            True
+            >>> dependency_graph.add("core.tests_component_a", [])
+            True
+            >>> dependency_graph.get_order()
+            [u'core.tests_component_a', u'core.tests_component_b']
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__requires = {}
+        self.__dependents = {}
+        self.__levels = {}
+        self.__order = None
+        self.__ranks = None
+
+    @property
+    def requires(self):
+        """
+        Property for **self.__requires** attribute.
+
+        :return: self.__requires.
+        :rtype: dict
+        """
+
+        return self.__requires
+
+    @requires.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def requires(self, value):
+        """
+        Setter for **self.__requires** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "requires"))
+
+    @requires.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def requires(self):
+        """
+        Deleter for **self.__requires** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "requires"))
+
+    @property
+    def dependents(self):
+        """
+        Property for **self.__dependents** attribute.
+
+        :return: self.__dependents.
+        :rtype: dict
+        """
+
+        return self.__dependents
+
+    @dependents.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def dependents(self, value):
+        """
+        Setter for **self.__dependents** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "dependents"))
+
+    @dependents.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def dependents(self):
+        """
+        Deleter for **self.__dependents** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "dependents"))
+
+    def __contains__(self, component):
+        """
+        Reimplements the :meth:`object.__contains__` method.
+
+        :param component: Component name.
+        :type component: unicode
+        :return: Component existence in the graph.
+        :rtype: bool
+        """
+
+        return component in self.__requires
+
+    def __len__(self):
+        """
+        Reimplements the :meth:`object.__len__` method.
+
+        :return: Components count.
+        :rtype: int
+        """
+
+        return len(self.__requires)
+
+    def __invalidate(self, component):
+        """
+        Invalidates given Component and its dependents cached levels.
+
+        :param component: Component name.
+        :type component: unicode
+        """
+
+        self.__order = self.__ranks = None
+
+        stack = [component]
+        while stack:
+            node = stack.pop()
+            if self.__levels.pop(node, None) is None and node != component:
+                continue
+
+            stack.extend(self.__dependents.get(node, ()))
+
+    def __unlink(self, component):
+        """
+        Removes given Component dependencies edges.
+
+        :param component: Component name.
+        :type component: unicode
+        """
+
+        for dependency in self.__requires.get(component, ()):
+            dependents = self.__dependents.get(dependency)
+            if dependents is None:
+                continue
+
+            dependents.discard(component)
+            if not dependents and dependency not in self.__requires:
+                del (self.__dependents[dependency])
+                self.__levels.pop(dependency, None)
+
+    def add(self, component, requires):
+        """
+        Adds given Component to the graph, replacing its previous dependencies.
+
+        :param component: Component name.
+        :type component: unicode
+        :param requires: Component dependencies.
+        :type requires: tuple or list
+        :return: Method success.
+        :rtype: bool
+        """
+
+        requires = tuple(requires or ())
+        if self.__requires.get(component) == requires:
+            return True
+
+        self.__invalidate(component)
+        self.__unlink(component)
+        self.__requires[component] = requires
+        self.__dependents.setdefault(component, set())
+        for dependency in requires:
+            self.__dependents.setdefault(dependency, set()).add(component)
+        return True
+
+    def remove(self, component):
+        """
+        Removes given Component from the graph.
+
+        :param component: Component name.
+        :type component: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if component not in self.__requires:
+            return False
+
+        self.__invalidate(component)
+        self.__unlink(component)
+        del (self.__requires[component])
+        if not self.__dependents.get(component):
+            self.__dependents.pop(component, None)
+        return True
+
+    def clear(self):
+        """
+        Clears the graph.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        self.__requires.clear()
+        self.__dependents.clear()
+        self.__levels.clear()
+        self.__order = self.__ranks = None
+        return True
+
+    def get_level(self, component):
+        """
+        Returns given Component level.
+
+        :param component: Component name.
+        :type component: unicode
+        :return: Component level.
+        :rtype: int
+        """
+
+        level = self.__levels.get(component)
+        if level is not None:
+            return level
+
+        stack, visiting = [component], set()
+        while stack:
+            node = stack[-1]
+            if node in self.__levels:
+                stack.pop()
+                continue
+
+            requires = self.__requires.get(node, ())
+            pending = [dependency for dependency in requires if dependency not in self.__levels]
+            if not pending:
+                self.__levels[node] = max(self.__levels[dependency] for dependency in requires) + 1 \
+                    if requires else 0
+                visiting.discard(node)
+                stack.pop()
+                continue
+
+            visiting.add(node)
+            for dependency in pending:
+                if dependency in visiting:
+                    raise manager.exceptions.ComponentDependenciesError(
+                        "{0} | '{1}' Component has circular dependencies through '{2}' Component!".format(
+                            self.__class__.__name__, node, dependency))
+                stack.append(dependency)
+        return self.__levels[component]
+
+    def get_dependencies(self, component):
+        """
+        Returns given Component transitive dependencies, including missing ones.
+
+        :param component: Component name.
+        :type component: unicode
+        :return: Dependencies Components.
+        :rtype: set
+        """
+
+        dependencies, stack = set(), [component]
+        while stack:
+            for dependency in self.__requires.get(stack.pop(), ()):
+                if dependency in dependencies:
+                    continue
+
+                dependencies.add(dependency)
+                stack.append(dependency)
+        return dependencies
+
+    def get_dependents(self, component):
+        """
+        Returns given Component transitive dependents by traversing the reverse dependencies edges.
+
+        :param component: Component name.
+        :type component: unicode
+        :return: Dependent Components.
+        :rtype: set
+        """
+
+        dependents, stack = set(), [component]
+        while stack:
+            for dependent in self.__dependents.get(stack.pop(), ()):
+                if dependent in dependents:
+                    continue
+
+                dependents.add(dependent)
+                stack.append(dependent)
+        return dependents
+
+    def get_order(self):
+        """
+        | Returns the Components and their missing dependencies in dependency order.
+        | The returned list is cached and should not be modified.
+
+        :return: Components.
+        :rtype: list
+        """
+
+        if self.__order is None:
+            self.__order = sorted(self.__dependents, key=lambda x: (self.get_level(x), x))
+        return self.__order
+
+    def set_order(self, order):
+        """
+        | Sets the cached dependency order, sparing its computation, e.g. when restoring a registry snapshot.
+        | Given order is ignored if it does not cover exactly the graph Components and missing dependencies.
+
+        :param order: Components in dependency order as returned by :meth:`DependencyGraph.get_order` method.
+        :type order: list
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if sorted(order) != sorted(self.__dependents):
+            return False
+
+        self.__order, self.__ranks = list(order), None
+        return True
+
+    def get_ranks(self):
+        """
+        | Returns the Components ranks in dependency order.
+        | The returned dictionary is cached and should not be modified.
+
+        :return: Components ranks.
+        :rtype: dict
+        """
+
+        if self.__ranks is None:
+            self.__ranks = dict((component, rank) for rank, component in enumerate(self.get_order()))
+        return self.__ranks
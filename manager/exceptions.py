@@ -34,7 +34,10 @@ __all__ = ["AbstractComponentsManagerError",
            "ComponentActivationError",
            "ComponentDeactivationError",
            "ComponentReloadError",
-           "ComponentExistsError"]
+           "ComponentExistsError",
+           "ComponentsIndexError",
+           "ComponentDependenciesError",
+           "ComponentTimeoutError"]
 
 
 class AbstractComponentsManagerError(foundations.exceptions.AbstractError):
@@ -115,3 +118,27 @@ class ComponentExistsError(AbstractComponentsManagerError):
     """
 
     pass
+
+
+class ComponentsIndexError(AbstractComponentsManagerError):
+    """
+    Defines Components index exception.
+    """
+
+    pass
+
+
+class ComponentDependenciesError(AbstractComponentsManagerError):
+    """
+    Defines Component dependencies exception.
+    """
+
+    pass
+
+
+class ComponentTimeoutError(AbstractComponentsManagerError):
+    """
+    Defines Component timeout exception.
+    """
+
+    pass
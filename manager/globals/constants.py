@@ -122,3 +122,27 @@ class Constants():
     :param null_object: Default null object string.
     :type null_object: unicode
     """
+
+    ignored_directories = (".git", ".hg", ".svn", "__pycache__")
+    """
+    :param ignored_directories: Directories names ignored while walking Components paths.
+    :type ignored_directories: tuple
+    """
+
+    profiles_cache_format = 1
+    """
+    :param profiles_cache_format: Profiles cache file format revision.
+    :type profiles_cache_format: int
+    """
+
+    index_format = 1
+    """
+    :param index_format: Components index file format revision.
+    :type index_format: int
+    """
+
+    snapshot_format = 1
+    """
+    :param snapshot_format: Components registry snapshot file format revision.
+    :type snapshot_format: int
+    """
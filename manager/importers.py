@@ -0,0 +1,369 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**importers.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines the :class:`ComponentsImporter` class.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import imp
+import marshal
+import os
+import struct
+import sys
+import threading
+
+import foundations.exceptions
+import foundations.verbose
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "ComponentsImporter"]
+
+LOGGER = foundations.verbose.install_logger()
+
+
+class ComponentsImporter(object):
+    """
+    | Defines a :pep:`302` meta path importer loading the Components packages from their registered directories.
+    | Components packages are resolved with a single lookup instead of appending their directories to
+        :data:`sys.path`, which would be searched by every subsequent import in the process.
+    | Given a bytecode directory, as written by :meth:`manager.components_manager.Manager.compile_components`
+        method, Components modules and their submodules are loaded from their bytecode files in it when they are
+        up to date with their sources.
+    """
+
+    def __init__(self, bytecode_directory=None):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> importer = ComponentsImporter()
+            >>> importer.register("tests_component_a", "./resources/components/core/tests_component_a")
+            True
+            >>> importer.install()
+            True
+            >>> import tests_component_a
+            >>> tests_component_a.__loader__
+            <manager.importers.ComponentsImporter object at 0x10c4f6d50>
+
+        :param bytecode_directory: Bytecode files directory.
+        :type bytecode_directory: unicode
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__paths = {}
+        self.__bytecode_directory = None
+        self.bytecode_directory = bytecode_directory
+        self.__lock = threading.RLock()
+
+    @property
+    def paths(self):
+        """
+        Property for **self.__paths** attribute.
+
+        :return: self.__paths.
+        :rtype: dict
+        """
+
+        return self.__paths
+
+    @paths.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def paths(self, value):
+        """
+        Setter for **self.__paths** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "paths"))
+
+    @paths.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def paths(self):
+        """
+        Deleter for **self.__paths** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "paths"))
+
+    @property
+    def bytecode_directory(self):
+        """
+        Property for **self.__bytecode_directory** attribute.
+
+        :return: self.__bytecode_directory.
+        :rtype: unicode
+        """
+
+        return self.__bytecode_directory
+
+    @bytecode_directory.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def bytecode_directory(self, value):
+        """
+        Setter for **self.__bytecode_directory** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        if value is not None:
+            assert type(value) is unicode, "'{0}' attribute: '{1}' type is not 'unicode'!".format(
+                "bytecode_directory", value)
+        self.__bytecode_directory = value
+
+    @bytecode_directory.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def bytecode_directory(self):
+        """
+        Deleter for **self.__bytecode_directory** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "bytecode_directory"))
+
+    def __contains__(self, package):
+        """
+        Reimplements the :meth:`object.__contains__` method.
+
+        :param package: Package name.
+        :type package: unicode
+        :return: Package registration state.
+        :rtype: bool
+        """
+
+        return package in self.__paths
+
+    def register(self, package, path):
+        """
+        Registers given package directory.
+
+        :param package: Package name.
+        :type package: unicode
+        :param path: Directory containing the package.
+        :type path: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        self.__paths[package] = path
+        return True
+
+    def unregister(self, package):
+        """
+        Unregisters given package.
+
+        :param package: Package name.
+        :type package: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        return self.__paths.pop(package, None) is not None
+
+    def clear(self):
+        """
+        Clears the registered packages.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        self.__paths.clear()
+        return True
+
+    def install(self):
+        """
+        Installs the importer in :data:`sys.meta_path`.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        self in sys.meta_path or sys.meta_path.append(self)
+        return True
+
+    def uninstall(self):
+        """
+        Uninstalls the importer from :data:`sys.meta_path`.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        self in sys.meta_path and sys.meta_path.remove(self)
+        return True
+
+    def __get_search_path(self, name):
+        """
+        Returns the directories given module is searched into.
+
+        :param name: Module name.
+        :type name: unicode
+        :return: Directories.
+        :rtype: list
+        """
+
+        parent = name.rpartition(".")[0]
+        return getattr(sys.modules.get(parent), "__path__", None) if parent else [self.__paths[name]]
+
+    def __get_bytecode(self, name, pathname, description):
+        """
+        Returns given module bytecode file and code from the bytecode directory if it is up to date with its source.
+
+        :param name: Module name.
+        :type name: unicode
+        :param pathname: Module path.
+        :type pathname: unicode
+        :param description: Module description as returned by :func:`imp.find_module` definition.
+        :type description: tuple
+        :return: Bytecode file, code.
+        :rtype: tuple
+        """
+
+        if self.__bytecode_directory is None:
+            return
+
+        parts = name.split(".")
+        if description[2] == imp.PKG_DIRECTORY:
+            source = os.path.join(pathname, "__init__.py")
+            parts.append("__init__")
+        elif description[2] == imp.PY_SOURCE:
+            source = pathname
+        else:
+            return
+
+        bytecode = "{0}.pyc".format(os.path.join(self.__bytecode_directory, *parts))
+        if not os.path.isfile(source) or not os.path.isfile(bytecode):
+            return
+
+        with open(bytecode, "rb") as file:
+            data = file.read()
+
+        if data[:4] != imp.get_magic() or \
+                struct.unpack(b"<I", data[4:8])[0] != int(os.stat(source).st_mtime) & 0xFFFFFFFF:
+            LOGGER.debug("> '{0}' bytecode file is outdated.".format(bytecode))
+            return
+
+        return bytecode, marshal.loads(data[8:])
+
+    def find_module(self, name, path=None):
+        """
+        | Implements the :pep:`302` finder protocol, registered top level packages are handled and their submodules
+            when a bytecode directory is set.
+        | Packages that cannot be found in their registered directory are left to the next finders.
+
+        :param name: Module name.
+        :type name: unicode
+        :param path: Parent package path.
+        :type path: list
+        :return: Loader.
+        :rtype: ComponentsImporter
+        """
+
+        if path is None:
+            if name not in self.__paths:
+                return
+
+            search_path = [self.__paths[name]]
+        else:
+            if self.__bytecode_directory is None or name.partition(".")[0] not in self.__paths:
+                return
+
+            search_path = path
+
+        try:
+            file = imp.find_module(name.rpartition(".")[2], search_path)[0]
+        except ImportError:
+            LOGGER.debug("> '{0}' Component module not found in '{1}' directories.".format(name, search_path))
+            return
+
+        file and file.close()
+        return self
+
+    def load_module(self, name):
+        """
+        Implements the :pep:`302` loader protocol, reloading modules existing in :data:`sys.modules`.
+
+        :param name: Module name.
+        :type name: unicode
+        :return: Module.
+        :rtype: ModuleType
+        """
+
+        with self.__lock:
+            search_path = self.__get_search_path(name)
+
+            LOGGER.debug("> Loading '{0}' Component module from '{1}' directories.".format(name, search_path))
+
+            file, pathname, description = imp.find_module(name.rpartition(".")[2], search_path)
+            try:
+                bytecode = self.__get_bytecode(name, pathname, description)
+                if bytecode is None:
+                    module = imp.load_module(name, file, pathname, description)
+                else:
+                    module = self.__execute_bytecode(name, pathname, description, *bytecode)
+            finally:
+                file and file.close()
+            module.__loader__ = self
+        return module
+
+    def __execute_bytecode(self, name, pathname, description, bytecode, code):
+        """
+        Executes given module code into the module existing in :data:`sys.modules` or a new one.
+
+        :param name: Module name.
+        :type name: unicode
+        :param pathname: Module path.
+        :type pathname: unicode
+        :param description: Module description as returned by :func:`imp.find_module` definition.
+        :type description: tuple
+        :param bytecode: Bytecode file.
+        :type bytecode: unicode
+        :param code: Module code.
+        :type code: code
+        :return: Module.
+        :rtype: ModuleType
+        """
+
+        LOGGER.debug("> Loading '{0}' Component module from '{1}' bytecode file.".format(name, bytecode))
+
+        existing = name in sys.modules
+        module = sys.modules.setdefault(name, imp.new_module(name))
+        module.__file__ = bytecode
+        module.__loader__ = self
+        if description[2] == imp.PKG_DIRECTORY:
+            module.__path__ = [pathname]
+            module.__package__ = name
+        else:
+            module.__package__ = name.rpartition(".")[0] or None
+
+        try:
+            exec(code, module.__dict__)
+        except Exception:
+            existing or sys.modules.pop(name, None)
+            raise
+        return module
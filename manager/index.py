@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**index.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines the Components index file building objects and command line tool.
+
+**Others:**
+    Usage: manager_index [-e rc] [-w 8] -o components.index path [path ...]
+"""
+
+from __future__ import unicode_literals
+
+import argparse
+import sys
+
+import foundations.verbose
+from manager.components_manager import Manager
+from manager.globals.constants import Constants
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "register_components", "build_index", "get_command_line_arguments", "main"]
+
+LOGGER = foundations.verbose.install_logger()
+
+
+def register_components(components_manager, workers=None):
+    """
+    | Registers given :class:`manager.components_manager.Manager` class instance Components.
+    | The registration fails if any walked Component file is not registered.
+
+    :param components_manager: Manager.
+    :type components_manager: Manager
+    :param workers: Components files are parsed concurrently using given threads count.
+    :type workers: int
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    registered = components_manager.register_components(workers)
+
+    files = components_manager.walked_files
+    if registered and len(components_manager) == len(files):
+        return True
+
+    LOGGER.critical("!> {0} | '{1}' Components registered out of '{2}' Components files!".format(
+        register_components.__name__, len(components_manager), len(files)))
+    return False
+
+
+def build_index(paths,
+                file,
+                extension="rc",
+                ignored_directories=Constants.ignored_directories,
+                maximum_depth=None,
+                workers=None):
+    """
+    | Registers the Components from given paths and saves them into given index file.
+    | The index file is not saved if any Component fails to register.
+
+    Usage::
+
+        >>> build_index(("./manager/tests/tests_manager/resources/components/core",), "components.index")
+        True
+
+    :param paths: Paths to walk.
+    :type paths: tuple or list
+    :param file: Index file.
+    :type file: unicode
+    :param extension: Components file extension.
+    :type extension: unicode
+    :param ignored_directories: Directories names or glob patterns not walked for Components files.
+    :type ignored_directories: tuple or list
+    :param maximum_depth: Maximum depth walked below each path, no limit if None.
+    :type maximum_depth: int
+    :param workers: Components files are parsed concurrently using given threads count.
+    :type workers: int
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    components_manager = Manager(paths,
+                                 extension=extension,
+                                 ignored_directories=ignored_directories,
+                                 maximum_depth=maximum_depth)
+    if not register_components(components_manager, workers):
+        return False
+
+    LOGGER.info("{0} | Indexing '{1}' Components into '{2}' file.".format(
+        build_index.__name__, len(components_manager), file))
+
+    return components_manager.save_index(file)
+
+
+def get_command_line_arguments():
+    """
+    Retrieves command line arguments.
+
+    :return: Namespace.
+    :rtype: Namespace
+    """
+
+    parser = argparse.ArgumentParser(add_help=False)
+
+    parser.add_argument("-h",
+                        "--help",
+                        action="help",
+                        help="'Displays this help message and exit.'")
+
+    parser.add_argument("paths",
+                        nargs="+",
+                        help="'Paths to walk.'")
+
+    parser.add_argument("-o",
+                        "--output",
+                        dest="output",
+                        required=True,
+                        help="'Index file.'")
+
+    parser.add_argument("-e",
+                        "--extension",
+                        dest="extension",
+                        default="rc",
+                        help="'Components file extension.'")
+
+    parser.add_argument("-d",
+                        "--maximum_depth",
+                        type=int,
+                        dest="maximum_depth",
+                        help="'Maximum depth walked below each path.'")
+
+    parser.add_argument("-w",
+                        "--workers",
+                        type=int,
+                        dest="workers",
+                        help="'Components files parsing threads count.'")
+
+    return parser.parse_args([argument.decode(sys.getfilesystemencoding() or Constants.default_codec)
+                              if isinstance(argument, str) else argument for argument in sys.argv[1:]])
+
+
+def main():
+    """
+    Starts the Components index building.
+
+    :return: Exit status.
+    :rtype: int
+    """
+
+    args = get_command_line_arguments()
+
+    success = build_index(args.paths,
+                          args.output,
+                          extension=args.extension,
+                          maximum_depth=args.maximum_depth,
+                          workers=args.workers)
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**indexes.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines the :class:`ProfilesIndexes` class.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import bisect
+import itertools
+
+import foundations.exceptions
+import foundations.verbose
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "ProfilesIndexes"]
+
+LOGGER = foundations.verbose.install_logger()
+
+
+class ProfilesIndexes(object):
+    """
+    | Defines secondary indexes mapping :class:`manager.components_manager.Profile` class attributes values
+        to the Components names.
+    | Informations attributes of profiles whose **[Informations]** section is not loaded yet are only indexed
+        when first queried.
+    | The Components names are also kept sorted to resolve prefix queries by bisection.
+    | Profiles attached to the indexes through their **indexes** attribute update them when their indexed
+        attributes are set.
+    """
+
+    attributes = ("category", "package", "version", "author")
+    """
+    :param attributes: Indexed attributes.
+    :type attributes: tuple
+    """
+
+    informations_attributes = ("author",)
+    """
+    :param informations_attributes: Indexed **[Informations]** section attributes.
+    :type informations_attributes: tuple
+    """
+
+    def __init__(self):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> profiles_indexes = ProfilesIndexes()
+            >>> profile = Profile(file="tests_component_a.rc")
+            >>> profile.initializeProfile()
+            True
+            >>> profiles_indexes.add(profile)
+            True
+            >>> profiles_indexes.get("package", "tests_component_a")
+            set([u'core.tests_component_a'])
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__indexes = dict((attribute, {}) for attribute in self.attributes)
+        self.__entries = {}
+        self.__names = []
+        self.__pending = dict((attribute, {}) for attribute in self.informations_attributes)
+
+    @property
+    def indexes(self):
+        """
+        Property for **self.__indexes** attribute.
+
+        :return: self.__indexes.
+        :rtype: dict
+        """
+
+        return self.__indexes
+
+    @indexes.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def indexes(self, value):
+        """
+        Setter for **self.__indexes** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "indexes"))
+
+    @indexes.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def indexes(self):
+        """
+        Deleter for **self.__indexes** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "indexes"))
+
+    @property
+    def names(self):
+        """
+        Property for **self.__names** attribute.
+
+        :return: self.__names.
+        :rtype: list
+        """
+
+        return self.__names
+
+    @names.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def names(self, value):
+        """
+        Setter for **self.__names** attribute.
+
+        :param value: Attribute value.
+        :type value: list
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "names"))
+
+    @names.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def names(self):
+        """
+        Deleter for **self.__names** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "names"))
+
+    def __contains__(self, component):
+        """
+        Reimplements the :meth:`object.__contains__` method.
+
+        :param component: Component name.
+        :type component: unicode
+        :return: Component indexing state.
+        :rtype: bool
+        """
+
+        return component in self.__entries
+
+    def __index(self, name, attribute, value):
+        """
+        Indexes given Component attribute value.
+
+        :param name: Component name.
+        :type name: unicode
+        :param attribute: Attribute.
+        :type attribute: unicode
+        :param value: Attribute value.
+        :type value: object
+        """
+
+        self.__entries[name][attribute] = value
+        self.__indexes[attribute].setdefault(value, set()).add(name)
+
+    def __unindex(self, name, attribute, value):
+        """
+        Unindexes given Component attribute value.
+
+        :param name: Component name.
+        :type name: unicode
+        :param attribute: Attribute.
+        :type attribute: unicode
+        :param value: Attribute value.
+        :type value: object
+        """
+
+        names = self.__indexes[attribute].get(value)
+        if names is None:
+            return
+
+        names.discard(name)
+        if not names:
+            del (self.__indexes[attribute][value])
+
+    def __resolve_pending(self, attribute):
+        """
+        Indexes given attribute of the Components pending indexing.
+
+        :param attribute: Attribute.
+        :type attribute: unicode
+        """
+
+        pending = self.__pending.get(attribute)
+        if not pending:
+            return
+
+        LOGGER.debug("> Indexing '{0}' attribute of '{1}' Components.".format(attribute, len(pending)))
+
+        for name, profile in pending.items():
+            self.__index(name, attribute, getattr(profile, attribute))
+        pending.clear()
+
+    def add(self, profile):
+        """
+        Indexes given Component profile.
+
+        :param profile: Component profile.
+        :type profile: Profile
+        :return: Method success.
+        :rtype: bool
+        """
+
+        name = profile.name
+        if name in self.__entries:
+            self.remove(name)
+
+        self.__entries[name] = {}
+        bisect.insort(self.__names, name)
+        for attribute in self.attributes:
+            if attribute in self.__pending and not profile.informations_loaded:
+                self.__pending[attribute][name] = profile
+                continue
+
+            self.__index(name, attribute, getattr(profile, attribute))
+        return True
+
+    def update(self, profile, attribute):
+        """
+        Indexes given Component profile attribute current value.
+
+        :param profile: Component profile.
+        :type profile: Profile
+        :param attribute: Attribute.
+        :type attribute: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        name = profile.name
+        entry = self.__entries.get(name)
+        if entry is None:
+            return False
+
+        if name in self.__pending.get(attribute, ()):
+            return True
+
+        attribute in entry and self.__unindex(name, attribute, entry[attribute])
+        self.__index(name, attribute, getattr(profile, attribute))
+        return True
+
+    def remove(self, component):
+        """
+        Removes given Component from the indexes.
+
+        :param component: Component name.
+        :type component: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        entry = self.__entries.pop(component, None)
+        if entry is None:
+            return False
+
+        del (self.__names[bisect.bisect_left(self.__names, component)])
+
+        for attribute, value in entry.iteritems():
+            self.__unindex(component, attribute, value)
+
+        for pending in self.__pending.itervalues():
+            pending.pop(component, None)
+        return True
+
+    def clear(self):
+        """
+        Clears the indexes.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        for index in self.__indexes.itervalues():
+            index.clear()
+        self.__entries.clear()
+        del (self.__names[:])
+        for pending in self.__pending.itervalues():
+            pending.clear()
+        return True
+
+    def get(self, attribute, value):
+        """
+        Returns the Components having given attribute value.
+
+        :param attribute: Attribute.
+        :type attribute: unicode
+        :param value: Attribute value.
+        :type value: object
+        :return: Components names.
+        :rtype: set
+        """
+
+        self.__resolve_pending(attribute)
+
+        return self.__indexes[attribute].get(value, set())
+
+    def get_prefixed(self, prefix):
+        """
+        Returns the Components names starting with given prefix.
+
+        :param prefix: Prefix.
+        :type prefix: unicode
+        :return: Sorted Components names.
+        :rtype: list
+        """
+
+        return list(itertools.takewhile(lambda x: x.startswith(prefix),
+                                        itertools.islice(self.__names,
+                                                         bisect.bisect_left(self.__names, prefix),
+                                                         None)))
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**parsers.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines **Manager** package Components files parsing objects.
+
+**Others:**
+    :func:`read_manifest` definition follows :class:`foundations.parsers.SectionsFileParser` class parsing rules.
+"""
+
+from __future__ import unicode_literals
+
+import codecs
+import re
+
+import foundations.exceptions
+import foundations.verbose
+from manager.globals.constants import Constants
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER",
+           "MANIFEST_SECTIONS",
+           "DEFAULTS_SECTION",
+           "COMMENT_PATTERN",
+           "SECTION_PATTERN",
+           "ATTRIBUTE_PATTERN",
+           "read_manifest"]
+
+LOGGER = foundations.verbose.install_logger()
+
+MANIFEST_SECTIONS = ("Component", "Informations")
+DEFAULTS_SECTION = "_defaults"
+COMMENT_PATTERN = re.compile(r"^\s*[;#].+$")
+SECTION_PATTERN = re.compile(r"^\s*\[(?P<section>.+)\]\s*$")
+ATTRIBUTE_PATTERN = re.compile(r"^(?P<attribute>.+?)[=:](?:(?P<value>.+)$|\s*$)")
+
+WHITESPACES = " \t\n\r\f\v"
+QUOTATION_MARKERS = "\"'`"
+
+
+def read_manifest(file, sections=MANIFEST_SECTIONS):
+    """
+    | Reads given Component file in a single pass, only given sections attributes are retained.
+    | The returned sections are the ones :class:`foundations.parsers.SectionsFileParser` class would
+        have built, other sections are present without attributes.
+
+    Usage::
+
+        >>> read_manifest("tests_component_a.rc")["Component"]
+        {u'Name': u'core.tests_component_a', u'Module': u'tests_component_a', u'Object': u'TestsComponentA', \
+u'Version': u'1.0', u'Title': u'Tests Component A'}
+
+    :param file: Component file.
+    :type file: unicode
+    :param sections: Retained sections.
+    :type sections: tuple or list
+    :return: Sections attributes.
+    :rtype: dict
+    """
+
+    LOGGER.debug("> Reading '{0}' manifest.".format(file))
+
+    try:
+        with codecs.open(file, "r", encoding=Constants.default_codec, errors=Constants.codec_error) as file_object:
+            content = file_object.read().splitlines(True)
+    except IOError as error:
+        LOGGER.warning("!> '{0}' file cannot be read: '{1}'".format(file, error))
+        return {}
+
+    manifest, section, attributes, parsing_errors = {}, DEFAULTS_SECTION, {}, []
+    retained = section in sections
+    for i, line in enumerate(content):
+        stripped = line.strip(WHITESPACES)
+        if not stripped:
+            continue
+
+        if stripped[0] in ";#" and COMMENT_PATTERN.match(line):
+            continue
+
+        if stripped[0] == "[":
+            search = SECTION_PATTERN.match(line)
+            if search:
+                section = search.group("section").strip()
+                attributes = {}
+                retained = section in sections
+                continue
+
+        if retained:
+            search = ATTRIBUTE_PATTERN.match(line)
+            if search:
+                value = search.group("value")
+                attributes[search.group("attribute").strip()] = value.strip().strip(QUOTATION_MARKERS) \
+                    if value is not None else None
+            else:
+                parsing_errors.append(i + 1)
+        elif not any(character in line[1:] for character in "=:"):
+            parsing_errors.append(i + 1)
+
+        manifest[section] = attributes
+
+    if parsing_errors:
+        raise foundations.exceptions.FileStructureParsingError(
+            "'{0}' structure is invalid, parsing exceptions occured on line(s): '{1}'!".format(
+                file, ", ".join(map(unicode, parsing_errors))))
+
+    return manifest
@@ -0,0 +1,412 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**profiles_cache.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines the :class:`ProfilesCache` class.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import codecs
+import hashlib
+import json
+import os
+import threading
+
+import foundations.exceptions
+import foundations.strings
+import foundations.verbose
+from manager.globals.constants import Constants
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "get_file_signature", "ProfilesCache"]
+
+LOGGER = foundations.verbose.install_logger()
+
+
+def get_file_signature(path, hash_content=False):
+    """
+    Returns given file signature built from its modification time and size and optionally its content hash.
+
+    Usage::
+
+        >>> get_file_signature("tests_component_a.rc")
+        [1389719474.0, 285]
+        >>> get_file_signature("tests_component_a.rc", hash_content=True)
+        [1389719474.0, 285, u'5d7a4c1cc2c6aa0d56c8dd2b7e0bb1e5']
+
+    :param path: File path.
+    :type path: unicode
+    :param hash_content: File content hash is part of the signature.
+    :type hash_content: bool
+    :return: File signature.
+    :rtype: list
+    """
+
+    stat = os.stat(path)
+    signature = [stat.st_mtime, stat.st_size]
+    if hash_content:
+        with open(path, "rb") as file:
+            signature.append(hashlib.md5(file.read()).hexdigest())
+    return signature
+
+
+class ProfilesCache(object):
+    """
+    | Defines an on-disk cache storing :class:`manager.components_manager.Profile` class data.
+    | Entries are keyed by the Component file path using forward slashes and validated against the file
+        signature, allowing unchanged Components files to skip parsing.
+    """
+
+    def __init__(self, file=None, hash_content=False):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> profiles_cache = ProfilesCache("profiles_cache.json")
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",),
+            ...                   profiles_cache=profiles_cache)
+            >>> manager.register_components()
+            True
+            >>> profiles_cache.content.keys()
+            [u'./manager/tests/tests_manager/resources/components/core/tests_component_a/tests_component_a.rc',
+            u'./manager/tests/tests_manager/resources/components/core/tests_component_b/tests_component_b.rc']
+
+        :param file: Cache file.
+        :type file: unicode
+        :param hash_content: Components files content hash is part of the signature.
+        :type hash_content: bool
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__file = None
+        self.file = file
+        self.__hash_content = None
+        self.hash_content = hash_content
+
+        self.__content = {}
+        self.__signatures = {}
+        self.__loaded = False
+        self.__modified = False
+        self.__lock = threading.Lock()
+
+    @property
+    def file(self):
+        """
+        Property for **self.__file** attribute.
+
+        :return: self.__file.
+        :rtype: unicode
+        """
+
+        return self.__file
+
+    @file.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def file(self, value):
+        """
+        Setter for **self.__file** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        if value is not None:
+            assert type(value) is unicode, "'{0}' attribute: '{1}' type is not 'unicode'!".format("file", value)
+        self.__file = value
+
+    @file.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def file(self):
+        """
+        Deleter for **self.__file** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "file"))
+
+    @property
+    def hash_content(self):
+        """
+        Property for **self.__hash_content** attribute.
+
+        :return: self.__hash_content.
+        :rtype: bool
+        """
+
+        return self.__hash_content
+
+    @hash_content.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def hash_content(self, value):
+        """
+        Setter for **self.__hash_content** attribute.
+
+        :param value: Attribute value.
+        :type value: bool
+        """
+
+        if value is not None:
+            assert type(value) is bool, "'{0}' attribute: '{1}' type is not 'bool'!".format("hash_content", value)
+        self.__hash_content = value
+
+    @hash_content.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def hash_content(self):
+        """
+        Deleter for **self.__hash_content** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "hash_content"))
+
+    @property
+    def content(self):
+        """
+        Property for **self.__content** attribute.
+
+        :return: self.__content.
+        :rtype: dict
+        """
+
+        return self.__content
+
+    @content.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def content(self, value):
+        """
+        Setter for **self.__content** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "content"))
+
+    @content.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def content(self):
+        """
+        Deleter for **self.__content** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "content"))
+
+    def __contains__(self, path):
+        """
+        Reimplements the :meth:`object.__contains__` method.
+
+        :param path: Component file path.
+        :type path: unicode
+        :return: Path existence in the cache.
+        :rtype: bool
+        """
+
+        self.__load_once()
+
+        return foundations.strings.to_forward_slashes(path) in self.__content
+
+    def __len__(self):
+        """
+        Reimplements the :meth:`object.__len__` method.
+
+        :return: Cache entries count.
+        :rtype: int
+        """
+
+        self.__load_once()
+
+        return len(self.__content)
+
+    def __load_once(self):
+        """
+        Loads the cache content if it has not been loaded yet.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if self.__loaded:
+            return True
+
+        with self.__lock:
+            return self.__loaded or self.load()
+
+    def load(self):
+        """
+        Loads the cache content from the cache file.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        content, success = {}, True
+        if self.__file is not None and os.path.isfile(self.__file):
+            LOGGER.debug("> Loading profiles cache from '{0}' file.".format(self.__file))
+
+            try:
+                with codecs.open(self.__file, "r", encoding=Constants.default_codec) as file:
+                    data = json.load(file)
+            except (IOError, ValueError) as error:
+                LOGGER.warning("!> {0} | '{1}' cache file cannot be read and will be ignored: '{2}'".format(
+                    self.__class__.__name__, self.__file, error))
+                success = False
+            else:
+                if isinstance(data, dict) and \
+                                data.get("format") == Constants.profiles_cache_format and \
+                                data.get("hash_content") == self.__hash_content:
+                    content = data.get("profiles", {})
+                else:
+                    LOGGER.debug("> '{0}' cache file is outdated and will be ignored.".format(self.__file))
+
+        self.__content = content
+        self.__signatures = {}
+        self.__modified = False
+        self.__loaded = True
+        return success
+
+    def save(self):
+        """
+        Saves the cache content to the cache file if it has been modified.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if self.__file is None or not self.__modified:
+            return True
+
+        LOGGER.debug("> Saving profiles cache to '{0}' file.".format(self.__file))
+
+        with codecs.open(self.__file, "w", encoding=Constants.default_codec) as file:
+            file.write(json.dumps({"format": Constants.profiles_cache_format,
+                                   "hash_content": self.__hash_content,
+                                   "profiles": self.__content}, ensure_ascii=False))
+        self.__modified = False
+        return True
+
+    def get_content(self, path, signature=None):
+        """
+        Returns given Component file cached profile data if its signature is still valid.
+
+        :param path: Component file path.
+        :type path: unicode
+        :param signature: Component file current signature, computed if not provided.
+        :type signature: list
+        :return: Profile data.
+        :rtype: dict
+        """
+
+        self.__load_once()
+
+        key = foundations.strings.to_forward_slashes(path)
+        signature = self.__signatures[key] = signature or get_file_signature(path, self.__hash_content)
+        entry = self.__content.get(key)
+        if entry is None or entry.get("signature") != signature:
+            return
+
+        LOGGER.debug("> Profiles cache hit for '{0}' file.".format(path))
+        return entry.get("profile")
+
+    def set_content(self, path, data, signature=None):
+        """
+        Stores given Component file profile data along its signature.
+
+        :param path: Component file path.
+        :type path: unicode
+        :param data: Profile data.
+        :type data: dict
+        :param signature: Component file signature, computed if not provided.
+        :type signature: list
+        :return: Method success.
+        :rtype: bool
+        """
+
+        self.__load_once()
+
+        key = foundations.strings.to_forward_slashes(path)
+        signature = signature or self.__signatures.get(key) or get_file_signature(path, self.__hash_content)
+        self.__signatures.pop(key, None)
+        self.__content[key] = {"signature": signature, "profile": data}
+        self.__modified = True
+        return True
+
+    def remove_content(self, path):
+        """
+        Removes given Component file profile data.
+
+        :param path: Component file path.
+        :type path: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        self.__load_once()
+
+        key = foundations.strings.to_forward_slashes(path)
+        if self.__content.pop(key, None) is not None:
+            self.__modified = True
+        self.__signatures.pop(key, None)
+        return True
+
+    def prune_content(self, paths, directories=None):
+        """
+        | Removes the profiles data of the Components files not in given paths.
+        | Only the entries located in given directories are considered when provided, allowing the cache to be
+            shared by Managers with different paths.
+
+        :param paths: Existing Components files paths.
+        :type paths: tuple or list
+        :param directories: Directories the pruned entries are located in.
+        :type directories: tuple or list
+        :return: Method success.
+        :rtype: bool
+        """
+
+        self.__load_once()
+
+        paths = set(foundations.strings.to_forward_slashes(path) for path in paths)
+        prefixes = None
+        if directories is not None:
+            prefixes = tuple("{0}/".format(foundations.strings.to_forward_slashes(directory).rstrip("/"))
+                             for directory in directories)
+
+        for path in [path for path in self.__content
+                     if path not in paths and (prefixes is None or path.startswith(prefixes))]:
+            LOGGER.debug("> Pruning '{0}' file from profiles cache.".format(path))
+            self.remove_content(path)
+        return True
+
+    def flush_content(self):
+        """
+        Flushes the cache content.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        self.__content.clear()
+        self.__signatures.clear()
+        self.__loaded = True
+        self.__modified = True
+        return True
@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**proxies.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines the :class:`InterfaceProxy` class and others proxies related objects.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import threading
+
+import foundations.verbose
+import manager.exceptions
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "InterfaceProxy", "is_proxy", "is_resolved", "resolve_interface"]
+
+LOGGER = foundations.verbose.install_logger()
+
+_RESOLUTION_LOCK = threading.RLock()
+
+
+class InterfaceProxy(object):
+    """
+    | Defines a proxy deferring a Component instantiation until its Interface is first used.
+    | Attributes access, assignment and deletion, calls, containers protocol, truth value testing as well as
+        :func:`isinstance` definition checks resolve the proxy: the Component dependencies are instantiated first,
+        then the Component itself, and the proxy forwards to its Interface.
+    | :func:`type` definition still returns the :class:`InterfaceProxy` class and others special methods
+        are not forwarded, use :func:`resolve_interface` definition to retrieve the Interface itself.
+    | Use :func:`is_proxy`, :func:`is_resolved` and :func:`resolve_interface` definitions to inspect a proxy
+        without resolving it.
+    """
+
+    __slots__ = ("_InterfaceProxy__manager", "_InterfaceProxy__component", "_InterfaceProxy__callback",
+                 "_InterfaceProxy__interface")
+
+    def __init__(self, manager, component, callback=None):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
+            >>> manager.register_components()
+            True
+            >>> proxy = InterfaceProxy(manager, "core.tests_component_b")
+            >>> is_resolved(proxy)
+            False
+            >>> proxy.name
+            u'core.tests_component_b'
+            >>> is_resolved(proxy)
+            True
+
+        :param manager: Manager.
+        :type manager: Manager
+        :param component: Component name.
+        :type component: unicode
+        :param callback: Callback object invoked when the Component is instantiated.
+        :type callback: object
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(InterfaceProxy.__name__))
+
+        # --- Setting class attributes. ---
+        object.__setattr__(self, "_InterfaceProxy__manager", manager)
+        object.__setattr__(self, "_InterfaceProxy__component", component)
+        object.__setattr__(self, "_InterfaceProxy__callback", callback)
+        object.__setattr__(self, "_InterfaceProxy__interface", None)
+
+    @property
+    def __class__(self):
+        """
+        Property for the resolved Interface class, allowing :func:`isinstance` definition checks.
+
+        :return: Interface class.
+        :rtype: type
+        """
+
+        return self.__resolve().__class__
+
+    def __resolve(self):
+        """
+        Resolves the proxy by instantiating the Component and its dependencies.
+
+        :return: Component Interface.
+        :rtype: object
+        """
+
+        if self.__interface is not None:
+            return self.__interface
+
+        with _RESOLUTION_LOCK:
+            if self.__interface is not None:
+                return self.__interface
+
+            LOGGER.debug("> Resolving '{0}' Component Interface proxy.".format(self.__component))
+
+            for dependency in self.__manager.list_dependencies(self.__component):
+                profile = self.__manager.get_profile(dependency)
+                if profile is None or profile.module is not None:
+                    continue
+
+                if is_proxy(profile.interface):
+                    profile.interface.__resolve()
+                elif not self.__manager.instantiate_component(dependency, self.__callback):
+                    raise manager.exceptions.ComponentInstantiationError(
+                        "{0} | '{1}' Component dependency failed to instantiate!".format(
+                            InterfaceProxy.__name__, dependency))
+
+            profile = self.__manager.get_profile(self.__component)
+            if profile is not None and profile.module is None:
+                self.__manager.instantiate_component(self.__component, self.__callback)
+
+            profile = self.__manager.get_profile(self.__component)
+            if profile is None or profile.interface is None or is_proxy(profile.interface):
+                raise manager.exceptions.ComponentInstantiationError(
+                    "{0} | '{1}' Component failed to instantiate!".format(InterfaceProxy.__name__,
+                                                                          self.__component))
+
+            object.__setattr__(self, "_InterfaceProxy__interface", profile.interface)
+        return self.__interface
+
+    def __getattr__(self, attribute):
+        """
+        Reimplements the :meth:`object.__getattr__` method.
+
+        :param attribute: Attribute.
+        :type attribute: unicode
+        :return: Interface attribute value.
+        :rtype: object
+        """
+
+        return getattr(self.__resolve(), attribute)
+
+    def __setattr__(self, attribute, value):
+        """
+        Reimplements the :meth:`object.__setattr__` method.
+
+        :param attribute: Attribute.
+        :type attribute: unicode
+        :param value: Attribute value.
+        :type value: object
+        """
+
+        setattr(self.__resolve(), attribute, value)
+
+    def __delattr__(self, attribute):
+        """
+        Reimplements the :meth:`object.__delattr__` method.
+
+        :param attribute: Attribute.
+        :type attribute: unicode
+        """
+
+        delattr(self.__resolve(), attribute)
+
+    def __call__(self, *args, **kwargs):
+        """
+        Reimplements the :meth:`object.__call__` method.
+
+        :param \*args: Arguments.
+        :type \*args: \*
+        :param \*\*kwargs: Keywords arguments.
+        :type \*\*kwargs: \*\*
+        :return: Interface call result.
+        :rtype: object
+        """
+
+        return self.__resolve()(*args, **kwargs)
+
+    def __getitem__(self, item):
+        """
+        Reimplements the :meth:`object.__getitem__` method.
+
+        :param item: Item.
+        :type item: object
+        :return: Interface item.
+        :rtype: object
+        """
+
+        return self.__resolve()[item]
+
+    def __iter__(self):
+        """
+        Reimplements the :meth:`object.__iter__` method.
+
+        :return: Interface iterator.
+        :rtype: object
+        """
+
+        return iter(self.__resolve())
+
+    def __len__(self):
+        """
+        Reimplements the :meth:`object.__len__` method.
+
+        :return: Interface length.
+        :rtype: int
+        """
+
+        return len(self.__resolve())
+
+    def __contains__(self, item):
+        """
+        Reimplements the :meth:`object.__contains__` method.
+
+        :param item: Item.
+        :type item: object
+        :return: Item existence in the Interface.
+        :rtype: bool
+        """
+
+        return item in self.__resolve()
+
+    def __nonzero__(self):
+        """
+        Reimplements the :meth:`object.__nonzero__` method.
+
+        :return: Interface truth value.
+        :rtype: bool
+        """
+
+        return bool(self.__resolve())
+
+    def __repr__(self):
+        """
+        Reimplements the :meth:`object.__repr__` method without resolving the proxy.
+
+        :return: Object representation.
+        :rtype: unicode
+        """
+
+        if self.__interface is not None:
+            return repr(self.__interface)
+
+        return "<{0} '{1}' at {2}>".format(InterfaceProxy.__name__, self.__component, hex(id(self)))
+
+
+def is_proxy(interface):
+    """
+    Returns if given Interface is an :class:`InterfaceProxy` class instance without resolving it.
+
+    :param interface: Interface.
+    :type interface: object
+    :return: Is proxy.
+    :rtype: bool
+    """
+
+    return type(interface) is InterfaceProxy
+
+
+def is_resolved(interface):
+    """
+    Returns if given Interface is resolved, Interfaces that are not proxies are always resolved.
+
+    :param interface: Interface.
+    :type interface: object
+    :return: Is resolved.
+    :rtype: bool
+    """
+
+    return not is_proxy(interface) or object.__getattribute__(interface, "_InterfaceProxy__interface") is not None
+
+
+def resolve_interface(interface):
+    """
+    Returns given Interface, resolving it if it is an :class:`InterfaceProxy` class instance.
+
+    :param interface: Interface.
+    :type interface: object
+    :return: Resolved Interface.
+    :rtype: object
+    """
+
+    return interface._InterfaceProxy__resolve() if is_proxy(interface) else interface
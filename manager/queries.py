@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**queries.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines **Manager** package Components names queries analysis objects.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import fnmatch
+import re
+import threading
+
+import foundations.verbose
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER",
+           "PATTERNS_CACHE_MAXIMUM_SIZE",
+           "QUERY_EXACT",
+           "QUERY_PREFIX",
+           "QUERY_PATTERN",
+           "compile_pattern",
+           "parse_pattern",
+           "parse_glob",
+           "translate_glob"]
+
+LOGGER = foundations.verbose.install_logger()
+
+PATTERNS_CACHE_MAXIMUM_SIZE = 512
+
+QUERY_EXACT = "exact"
+QUERY_PREFIX = "prefix"
+QUERY_PATTERN = "pattern"
+
+PATTERN_METACHARACTERS = ".^$*+?{}[]\\|()"
+PATTERN_QUANTIFIERS = "*+?{"
+GLOB_METACHARACTERS = "*?["
+
+_PATTERNS_CACHE = {}
+_PATTERNS_CACHE_LOCK = threading.Lock()
+
+
+def _get_cached(key, builder):
+    """
+    Returns given key cached value, building it with given builder if not cached yet.
+
+    :param key: Cache key.
+    :type key: tuple
+    :param builder: Value builder.
+    :type builder: object
+    :return: Value.
+    :rtype: object
+    """
+
+    value = _PATTERNS_CACHE.get(key)
+    if value is not None:
+        return value
+
+    value = builder()
+    with _PATTERNS_CACHE_LOCK:
+        if len(_PATTERNS_CACHE) >= PATTERNS_CACHE_MAXIMUM_SIZE:
+            LOGGER.debug("> Flushing patterns cache.")
+            _PATTERNS_CACHE.clear()
+        _PATTERNS_CACHE[key] = value
+    return value
+
+
+def compile_pattern(pattern):
+    """
+    | Compiles given regex pattern.
+    | Compiled patterns are cached, the cache is flushed once it reaches
+        :attr:`PATTERNS_CACHE_MAXIMUM_SIZE` entries.
+
+    Usage::
+
+        >>> compile_pattern(r"\w+A$")
+        <_sre.SRE_Pattern object at 0x10d7aa4f0>
+        >>> compile_pattern(r"\w+A$") is compile_pattern(r"\w+A$")
+        True
+
+    :param pattern: Regex pattern.
+    :type pattern: unicode
+    :return: Compiled pattern.
+    :rtype: object
+    """
+
+    return _get_cached(("compile", pattern), lambda: re.compile(pattern))
+
+
+def _parse_pattern(pattern):
+    """
+    Parses given regex pattern literal prefix, see :func:`parse_pattern` definition.
+
+    :param pattern: Regex pattern.
+    :type pattern: unicode
+    :return: Literal prefix, query type.
+    :rtype: tuple
+    """
+
+    if not pattern.startswith("^") or \
+            re.search(r"(?<!\\)(?:\\\\)*\|", pattern) or \
+            re.search(r"\(\?[iLmsux]", pattern):
+        return "", QUERY_PATTERN
+
+    prefix, i = [], 1
+    while i < len(pattern):
+        character = pattern[i]
+        if character == "\\":
+            if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+                break
+            literal, width = pattern[i + 1], 2
+        elif character in PATTERN_METACHARACTERS:
+            break
+        else:
+            literal, width = character, 1
+
+        if pattern[i + width:i + width + 1] and pattern[i + width] in PATTERN_QUANTIFIERS:
+            break
+
+        prefix.append(literal)
+        i += width
+
+    prefix, remainder = "".join(prefix), pattern[i:]
+    if remainder in ("", ".*", ".*$"):
+        return prefix, QUERY_PREFIX
+    elif remainder == "$":
+        return prefix, QUERY_EXACT
+    else:
+        return prefix, QUERY_PATTERN
+
+
+def parse_pattern(pattern):
+    """
+    | Parses given regex pattern literal prefix, results are cached.
+    | The query type defines how matching names are resolved from the prefix:
+
+        - :attr:`QUERY_EXACT`: The prefix is the only matching name.
+        - :attr:`QUERY_PREFIX`: Every name starting with the prefix matches.
+        - :attr:`QUERY_PATTERN`: Names starting with the prefix need to be matched against the pattern.
+
+    Usage::
+
+        >>> parse_pattern(r"^addons\.")
+        (u'addons.', u'prefix')
+        >>> parse_pattern(r"^core\.tests_component_a$")
+        (u'core.tests_component_a', u'exact')
+        >>> parse_pattern(r"^core\.\w+_a$")
+        (u'core.', u'pattern')
+        >>> parse_pattern(r"\w+A$")
+        (u'', u'pattern')
+
+    :param pattern: Regex pattern.
+    :type pattern: unicode
+    :return: Literal prefix, query type.
+    :rtype: tuple
+    """
+
+    return _get_cached(("pattern", pattern), lambda: _parse_pattern(pattern))
+
+
+def parse_glob(glob):
+    """
+    Parses given glob pattern literal prefix, see :func:`parse_pattern` definition for the query types.
+
+    Usage::
+
+        >>> parse_glob("addons.*")
+        (u'addons.', u'prefix')
+        >>> parse_glob("core.tests_component_?")
+        (u'core.tests_component_', u'pattern')
+
+    :param glob: Glob pattern.
+    :type glob: unicode
+    :return: Literal prefix, query type.
+    :rtype: tuple
+    """
+
+    for i, character in enumerate(glob):
+        if character in GLOB_METACHARACTERS:
+            return glob[:i], QUERY_PREFIX if glob[i:] == "*" else QUERY_PATTERN
+    return glob, QUERY_EXACT
+
+
+def translate_glob(glob):
+    """
+    Returns given glob pattern compiled regex pattern.
+
+    Usage::
+
+        >>> translate_glob("addons.*").match("addons.tests_component_c")
+        <_sre.SRE_Match object at 0x10d6e4ed0>
+
+    :param glob: Glob pattern.
+    :type glob: unicode
+    :return: Compiled pattern.
+    :rtype: object
+    """
+
+    return _get_cached(("glob", glob), lambda: re.compile(fnmatch.translate(glob)))
@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**scheduler.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines the :class:`DependenciesScheduler` class.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import Queue
+from multiprocessing.pool import ThreadPool
+
+import foundations.exceptions
+import foundations.verbose
+import manager.exceptions
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "DependenciesScheduler"]
+
+LOGGER = foundations.verbose.install_logger()
+
+
+class DependenciesScheduler(object):
+    """
+    | Defines a scheduler executing a task on Components concurrently using a threads pool.
+    | Each Component task is started as soon as its dependencies tasks are done instead of waiting for whole
+        dependency batches. Dependencies that are not scheduled are considered done.
+    | Initializer and finalizer callables are invoked in the calling thread before and after each Component task,
+        the Component is done once its finalizer returns.
+    """
+
+    def __init__(self, dependencies, workers=4):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> scheduler = DependenciesScheduler({"core.tests_component_a": [],
+            ...                                    "core.tests_component_b": ["core.tests_component_a"]})
+            >>> scheduler.execute(lambda x: x.upper())
+            {u'core.tests_component_b': u'CORE.TESTS_COMPONENT_B', u'core.tests_component_a': u'CORE.TESTS_COMPONENT_A'}
+
+        :param dependencies: Components dependencies.
+        :type dependencies: dict
+        :param workers: Threads count.
+        :type workers: int
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__dependencies = None
+        self.dependencies = dependencies
+        self.__workers = None
+        self.workers = workers
+
+    @property
+    def dependencies(self):
+        """
+        Property for **self.__dependencies** attribute.
+
+        :return: self.__dependencies.
+        :rtype: dict
+        """
+
+        return self.__dependencies
+
+    @dependencies.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def dependencies(self, value):
+        """
+        Setter for **self.__dependencies** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        if value is not None:
+            assert type(value) is dict, "'{0}' attribute: '{1}' type is not 'dict'!".format("dependencies", value)
+        self.__dependencies = value
+
+    @dependencies.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def dependencies(self):
+        """
+        Deleter for **self.__dependencies** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "dependencies"))
+
+    @property
+    def workers(self):
+        """
+        Property for **self.__workers** attribute.
+
+        :return: self.__workers.
+        :rtype: int
+        """
+
+        return self.__workers
+
+    @workers.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def workers(self, value):
+        """
+        Setter for **self.__workers** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) is int, "'{0}' attribute: '{1}' type is not 'int'!".format("workers", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format("workers", value)
+        self.__workers = value
+
+    @workers.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def workers(self):
+        """
+        Deleter for **self.__workers** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "workers"))
+
+    @staticmethod
+    def __execute_task(task, component, queue):
+        """
+        Executes given task on given Component and puts the outcome in given queue.
+
+        :param task: Task.
+        :type task: object
+        :param component: Component name.
+        :type component: unicode
+        :param queue: Outcomes queue.
+        :type queue: Queue
+        """
+
+        try:
+            queue.put((component, task(component), None))
+        except Exception as error:
+            queue.put((component, None, error))
+
+    def execute(self, task, initializer=None, finalizer=None):
+        """
+        | Executes given task on the Components.
+        | The first exception raised by a task, initializer or finalizer stops the scheduling of new tasks and is
+            raised again once the running tasks are done.
+
+        :param task: Task executed in the threads pool, called with the Component name.
+        :type task: object
+        :param initializer: Initializer called with the Component name before its task is started.
+        :type initializer: object
+        :param finalizer: Finalizer called with the Component name and its task result, its own result replaces the
+            task result.
+        :type finalizer: object
+        :return: Components tasks results.
+        :rtype: dict
+        """
+
+        dependencies = dict((component, set(requires).intersection(self.__dependencies).difference((component,)))
+                            for component, requires in self.__dependencies.iteritems())
+        dependents = dict((component, []) for component in dependencies)
+        for component, requires in dependencies.iteritems():
+            for dependency in requires:
+                dependents[dependency].append(component)
+
+        results, errors, queue = {}, [], Queue.Queue()
+        pool = ThreadPool(max(1, min(self.__workers, len(dependencies))))
+        running = [0]
+
+        def submit(component):
+            if errors:
+                return
+
+            try:
+                initializer and initializer(component)
+            except Exception as error:
+                errors.append(error)
+                return
+
+            LOGGER.debug("> Scheduling '{0}' Component task.".format(component))
+
+            running[0] += 1
+            pool.apply_async(self.__execute_task, (task, component, queue))
+
+        try:
+            for component in sorted(component for component, requires in dependencies.iteritems() if not requires):
+                submit(component)
+
+            while running[0]:
+                component, result, error = queue.get()
+                running[0] -= 1
+                if error is not None:
+                    errors.append(error)
+                    continue
+
+                try:
+                    results[component] = finalizer(component, result) if finalizer else result
+                except Exception as error:
+                    errors.append(error)
+                    continue
+
+                for dependent in sorted(dependents[component]):
+                    dependencies[dependent].discard(component)
+                    if not dependencies[dependent]:
+                        submit(dependent)
+        finally:
+            pool.close()
+            pool.join()
+
+        if errors:
+            raise errors[0]
+
+        if len(results) != len(dependencies):
+            raise manager.exceptions.ComponentDependenciesError(
+                "{0} | '{1}' Components have circular dependencies!".format(
+                    self.__class__.__name__, ", ".join(sorted(set(dependencies).difference(results)))))
+        return results
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_bytecode.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`manager.bytecode` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import sys
+import tempfile
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+from manager.bytecode import compile_file
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["TestCompileFile"]
+
+
+class TestCompileFile(unittest.TestCase):
+    """
+    Defines :func:`manager.bytecode.compile_file` definition units tests methods.
+    """
+
+    def test_compile_file(self):
+        """
+        Tests :func:`manager.bytecode.compile_file` definition.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        try:
+            source = os.path.join(directory, "module.py")
+            with open(source, "w") as file:
+                file.write("VALUE = 1\n")
+            self.assertIsNone(compile_file((source, None)))
+            self.assertTrue(os.path.isfile("{0}c".format(source)))
+
+            target = os.path.join(directory, "bytecode.pyc")
+            self.assertIsNone(compile_file((source, target)))
+            self.assertTrue(os.path.isfile(target))
+
+            with open(source, "w") as file:
+                file.write("def (\n")
+            self.assertIn(source, compile_file((source, None)))
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    import manager.tests.utilities
+
+    unittest.main()
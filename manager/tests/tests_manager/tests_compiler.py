@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_compiler.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`manager.compiler` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import sys
+import tempfile
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+from manager.compiler import compile_components
+from manager.compiler import main
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["RESOURCES_DIRECTORY", "COMPONENTS_DIRECTORY", "TestCompileComponents", "TestMain"]
+
+RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), "resources")
+COMPONENTS_DIRECTORY = os.path.join(RESOURCES_DIRECTORY, "components")
+
+
+class TestCompileComponents(unittest.TestCase):
+    """
+    Defines :func:`manager.compiler.compile_components` definition units tests methods.
+    """
+
+    def test_compile_components(self):
+        """
+        Tests :func:`manager.compiler.compile_components` definition.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        try:
+            self.assertTrue(compile_components([os.path.join(COMPONENTS_DIRECTORY, "core")], directory, workers=2))
+            for package in ("tests_component_a", "tests_component_b"):
+                self.assertTrue(os.path.isfile(os.path.join(directory, "{0}.pyc".format(package))))
+        finally:
+            shutil.rmtree(directory)
+
+
+class TestMain(unittest.TestCase):
+    """
+    Defines :func:`manager.compiler.main` definition units tests methods.
+    """
+
+    def test_main(self):
+        """
+        Tests :func:`manager.compiler.main` definition.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        arguments = sys.argv
+        try:
+            sys.argv = ["manager_compile", "-o", directory, os.path.join(COMPONENTS_DIRECTORY, "core")]
+            self.assertEqual(main(), 0)
+            self.assertTrue(os.path.isfile(os.path.join(directory, "tests_component_a.pyc")))
+        finally:
+            sys.argv = arguments
+            shutil.rmtree(directory)
+
+    def test_main_registration_failure(self):
+        """
+        Tests :func:`manager.compiler.main` definition with a Component failing to register.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        arguments = sys.argv
+        try:
+            shutil.copytree(os.path.join(COMPONENTS_DIRECTORY, "core"), os.path.join(directory, "core"))
+            with open(os.path.join(directory, "core", "tests_component_b", "tests_component_b.rc"), "w") as file:
+                file.write("[Component]\nName = core.tests_component_b\n")
+
+            output = os.path.join(directory, "bytecode")
+            sys.argv = ["manager_compile", "-o", output, os.path.join(directory, "core")]
+            self.assertEqual(main(), 1)
+            self.assertFalse(os.path.exists(output))
+        finally:
+            sys.argv = arguments
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    import manager.tests.utilities
+
+    unittest.main()
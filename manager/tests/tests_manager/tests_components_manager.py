@@ -16,8 +16,12 @@
 
 from __future__ import unicode_literals
 
+import json
 import os
+import shutil
 import sys
+import tempfile
+import time
 
 if sys.version_info[:2] <= (2, 6):
     import unittest2 as unittest
@@ -27,6 +31,16 @@ else:
 from manager.component import Component
 from manager.components_manager import Manager
 from manager.components_manager import Profile
+from manager.components_manager import StringsTable
+from manager.exceptions import ComponentActivationError
+from manager.exceptions import ComponentDeactivationError
+from manager.exceptions import ComponentExistsError
+from manager.exceptions import ComponentInterfaceError
+from manager.exceptions import ComponentModuleError
+from manager.exceptions import ComponentTimeoutError
+from manager.exceptions import ComponentsIndexError
+from manager.profiles_cache import ProfilesCache
+from manager.QObject_component import QObjectComponent
 
 __author__ = "Thomas Mansencal"
 __copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
@@ -43,6 +57,7 @@ __all__ = ["RESOURCES_DIRECTORY",
            "COMPONENTS_DEPENDENCY_ORDER",
            "STANDARD_PROFILE_CONTENT",
            "managerCallback",
+           "TestStringsTable",
            "TestProfile",
            "TestManager"]
 
@@ -90,6 +105,72 @@ def managerCallback(profile):
     profile.callback = True
 
 
+class TestStringsTable(unittest.TestCase):
+    """
+    Defines :class:`manager.components_manager.StringsTable` class units tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ("strings",)
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(StringsTable))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("__contains__",
+                            "__len__",
+                            "intern",
+                            "release",
+                            "clear")
+
+        for method in required_methods:
+            self.assertIn(method, dir(StringsTable))
+
+    def test_intern(self):
+        """
+        Tests :meth:`manager.components_manager.StringsTable.intern` method.
+        """
+
+        strings_table = StringsTable()
+        value = strings_table.intern("".join(("Thomas ", "Mansencal")))
+        self.assertEqual(value, "Thomas Mansencal")
+        self.assertIs(strings_table.intern("".join(("Thomas ", "Mansencal"))), value)
+        self.assertIsNone(strings_table.intern(None))
+        self.assertEqual(len(strings_table), 1)
+
+    def test_release(self):
+        """
+        Tests :meth:`manager.components_manager.StringsTable.release` method.
+        """
+
+        strings_table = StringsTable()
+        strings_table.intern("Thomas Mansencal")
+        strings_table.intern("Thomas Mansencal")
+        self.assertTrue(strings_table.release("Thomas Mansencal"))
+        self.assertIn("Thomas Mansencal", strings_table)
+        self.assertTrue(strings_table.release("Thomas Mansencal"))
+        self.assertNotIn("Thomas Mansencal", strings_table)
+        self.assertFalse(strings_table.release("Thomas Mansencal"))
+
+    def test_clear(self):
+        """
+        Tests :meth:`manager.components_manager.StringsTable.clear` method.
+        """
+
+        strings_table = StringsTable()
+        strings_table.intern("Thomas Mansencal")
+        self.assertTrue(strings_table.clear())
+        self.assertEqual(len(strings_table), 0)
+
+
 class TestProfile(unittest.TestCase):
     """
     Defines :class:`manager.components_manager.Profile` class units tests methods.
@@ -114,7 +195,10 @@ class TestProfile(unittest.TestCase):
                                "author",
                                "email",
                                "url",
-                               "description")
+                               "description",
+                               "informations_loaded",
+                               "strings_table",
+                               "indexes")
 
         for attribute in required_attributes:
             self.assertIn(attribute, dir(Profile))
@@ -124,7 +208,9 @@ class TestProfile(unittest.TestCase):
         Tests presence of required methods.
         """
 
-        required_methods = ("initializeProfile",)
+        required_methods = ("initializeProfile",
+                            "serialize_profile",
+                            "deserialize_profile")
 
         for method in required_methods:
             self.assertIn(method, dir(Profile))
@@ -140,6 +226,96 @@ class TestProfile(unittest.TestCase):
             self.assertIsInstance(getattr(profile, attribute), type(value))
             self.assertEqual(getattr(profile, attribute), value)
 
+    def test_initialize_profile_lazy(self):
+        """
+        Tests :meth:`manager.components_manager.Profile.initializeProfile` method in lazy mode.
+        """
+
+        profile = Profile(file=STANDARD_PROFILE_CONTENT["file"])
+        self.assertTrue(profile.initializeProfile(lazy=True))
+        self.assertFalse(profile.informations_loaded)
+        self.assertNotIn("author", profile.serialize_profile())
+        self.assertEqual(profile.name, STANDARD_PROFILE_CONTENT["name"])
+        self.assertEqual(profile.author, STANDARD_PROFILE_CONTENT["author"])
+        self.assertTrue(profile.informations_loaded)
+        for attribute, value in STANDARD_PROFILE_CONTENT.iteritems():
+            self.assertEqual(getattr(profile, attribute), value)
+        self.assertDictEqual(profile.serialize_profile(), STANDARD_PROFILE_CONTENT)
+
+        profile = Profile(file=STANDARD_PROFILE_CONTENT["file"])
+        profile.initializeProfile(lazy=True)
+        profile.email = "email@domain.com"
+        self.assertEqual(profile.email, "email@domain.com")
+        self.assertEqual(profile.author, STANDARD_PROFILE_CONTENT["author"])
+
+    def test_serialize_profile(self):
+        """
+        Tests :meth:`manager.components_manager.Profile.serialize_profile` method.
+        """
+
+        profile = Profile(file=STANDARD_PROFILE_CONTENT["file"])
+        profile.initializeProfile()
+        self.assertDictEqual(profile.serialize_profile(), STANDARD_PROFILE_CONTENT)
+
+    def test__slots__(self):
+        """
+        Tests :class:`manager.components_manager.Profile` class slots.
+        """
+
+        profile = Profile(file=STANDARD_PROFILE_CONTENT["file"])
+        profile.initializeProfile()
+        self.assertDictEqual(profile.__dict__, {})
+        self.assertDictEqual(profile.timings, {})
+
+        strings_table = StringsTable()
+        profile.strings_table = strings_table
+        other_profile = Profile()
+        other_profile.strings_table = strings_table
+        other_profile.deserialize_profile(json.loads(json.dumps(STANDARD_PROFILE_CONTENT)))
+        for attribute in ("version", "author", "email", "url"):
+            self.assertIs(getattr(other_profile, attribute), getattr(profile, attribute))
+
+        managerCallback(profile)
+        self.assertTrue(profile.callback)
+
+    def test_strings_table(self):
+        """
+        Tests :attr:`manager.components_manager.Profile.strings_table` attribute.
+        """
+
+        profile = Profile(file=STANDARD_PROFILE_CONTENT["file"])
+        profile.initializeProfile()
+
+        strings_table = StringsTable()
+        profile.strings_table = strings_table
+        self.assertIn(STANDARD_PROFILE_CONTENT["author"], strings_table)
+        self.assertEqual(len(strings_table), len(set(STANDARD_PROFILE_CONTENT[attribute] for attribute in
+                                                     ("version", "author", "email", "url"))))
+
+        profile.version = "2.0.0"
+        self.assertNotIn(STANDARD_PROFILE_CONTENT["version"], strings_table)
+        self.assertIn("2.0.0", strings_table)
+
+        profile.strings_table = None
+        self.assertEqual(len(strings_table), 0)
+
+    def test_deserialize_profile(self):
+        """
+        Tests :meth:`manager.components_manager.Profile.deserialize_profile` method.
+        """
+
+        profile = Profile()
+        self.assertTrue(profile.deserialize_profile(STANDARD_PROFILE_CONTENT))
+        for attribute, value in STANDARD_PROFILE_CONTENT.iteritems():
+            self.assertEqual(getattr(profile, attribute), value)
+
+        data = dict((key, value) for key, value in STANDARD_PROFILE_CONTENT.iteritems()
+                    if key not in ("author", "email", "url", "description"))
+        profile = Profile()
+        self.assertTrue(profile.deserialize_profile(data))
+        self.assertFalse(profile.informations_loaded)
+        self.assertEqual(profile.description, STANDARD_PROFILE_CONTENT["description"])
+
 
 class TestManager(unittest.TestCase):
     """
@@ -154,7 +330,18 @@ class TestManager(unittest.TestCase):
         required_attributes = ("paths",
                                "extension",
                                "categories",
-                               "components",)
+                               "profiles_cache",
+                               "ignored_directories",
+                               "maximum_depth",
+                               "lazy_profiles",
+                               "bytecode_directory",
+                               "components",
+                               "importer",
+                               "dependency_graph",
+                               "strings_table",
+                               "walked_directories",
+                               "walked_files",
+                               "unregistered_files")
 
         for attribute in required_attributes:
             self.assertIn(attribute, dir(Manager))
@@ -172,13 +359,29 @@ class TestManager(unittest.TestCase):
                             "unregister_component",
                             "register_components",
                             "unregister_components",
+                            "rescan",
+                            "save_index",
+                            "load_index",
+                            "save_snapshot",
+                            "load_snapshot",
+                            "compile_components",
                             "instantiate_component",
                             "instantiate_components",
+                            "initialize_component",
+                            "activate_component",
+                            "activate_components",
+                            "deactivate_components",
+                            "shutdown_components",
                             "reload_component",
                             "list_components",
                             "list_dependents",
+                            "list_dependencies",
+                            "get_critical_path",
+                            "get_timings_report",
+                            "save_timings",
                             "filter_components",
                             "get_profile",
+                            "match_profile",
                             "get_interface",
                             "get_component_attribute_name")
 
@@ -247,9 +450,11 @@ class TestManager(unittest.TestCase):
         manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
         manager.register_components()
         manager.instantiate_components()
+        self.assertNotEqual(len(manager.strings_table), 0)
         for component in dict(manager.components):
             self.assertTrue(manager.unregister_component(component))
         self.assertTrue(not manager.components)
+        self.assertEqual(len(manager.strings_table), 0)
 
     def test_register_components(self):
         """
@@ -263,6 +468,123 @@ class TestManager(unittest.TestCase):
         self.assertIsInstance(manager.components, dict)
         for component in ("{0}.{1}".format(item, name) for item in COMPONENTS for name in COMPONENTS[item]):
             self.assertIn(component, manager.components)
+        self.assertEqual(len(manager.walked_files), len(manager))
+        self.assertListEqual(manager.unregistered_files, [])
+
+    def test_register_components_ignored_directories(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.register_components` method with ignored directories.
+        """
+
+        manager = Manager([COMPONENTS_DIRECTORY], ignored_directories=["extras"])
+        manager.register_components()
+        self.assertListEqual(sorted(manager.components), sorted(COMPONENTS_NAMES[:3]))
+
+        manager = Manager([COMPONENTS_DIRECTORY], maximum_depth=2)
+        manager.register_components()
+        self.assertListEqual(sorted(manager.components), sorted(COMPONENTS_NAMES[:3]))
+
+    def test_register_components_modules(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.register_components` method modules existence checks.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        try:
+            shutil.copytree(os.path.join(COMPONENTS_DIRECTORY, "core"), os.path.join(directory, "core"))
+            file = os.path.join(directory, "core", "tests_component_b", "tests_component_b.rc")
+            with open(file) as file_object:
+                content = file_object.read()
+            with open(file, "w") as file_object:
+                file_object.write(content.replace("Module = tests_component_b", "Module = tests_component_missing"))
+            manager = Manager([directory])
+            self.assertFalse(manager.register_components())
+            self.assertListEqual(manager.list_components(), ["core.tests_component_a"])
+            self.assertEqual(len(manager.walked_files), 2)
+            self.assertListEqual(manager.unregistered_files, [file])
+
+            self.assertTrue(manager.instantiate_components())
+            self.assertEqual(manager.importer.paths["tests_component_a"],
+                             os.path.join(directory, "core", "tests_component_a"))
+            self.assertNotIn(os.path.join(directory, "core", "tests_component_a"), sys.path)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_register_components_workers(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.register_components` method with concurrent parsing.
+        """
+
+        components_paths = [os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS]
+        components_paths.append(ALTERNATIVE_COMPONENTS_DIRECTORY)
+        manager = Manager(components_paths)
+        self.assertTrue(manager.register_components(workers=4))
+        self.assertListEqual(sorted(manager.components), sorted(COMPONENTS_NAMES))
+        self.assertListEqual(manager.list_components(), COMPONENTS_DEPENDENCY_ORDER)
+
+    def test_register_components_profiles_cache(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.register_components` method with a profiles cache.
+        """
+
+        directory = tempfile.mkdtemp()
+        try:
+            components_paths = [os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS]
+            profiles_cache = ProfilesCache(os.path.join(directory, "profiles_cache.json"))
+            manager = Manager(components_paths, profiles_cache=profiles_cache)
+            manager.register_components()
+            self.assertEqual(len(profiles_cache), len(manager))
+            self.assertTrue(os.path.isfile(profiles_cache.file))
+
+            profiles_cache = ProfilesCache(profiles_cache.file)
+            cached_manager = Manager(components_paths, profiles_cache=profiles_cache)
+            cached_manager.register_components()
+            for name, profile in manager:
+                self.assertDictEqual(profile.serialize_profile(), cached_manager.get_profile(name).serialize_profile())
+        finally:
+            shutil.rmtree(directory)
+
+    def test_rescan_profiles_cache(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.rescan` method pruning the profiles cache.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        try:
+            shutil.copytree(os.path.join(COMPONENTS_DIRECTORY, "core"), os.path.join(directory, "core"))
+            profiles_cache = ProfilesCache(os.path.join(directory, "profiles_cache.json"))
+            manager = Manager([os.path.join(directory, "core")], profiles_cache=profiles_cache)
+            manager.register_components()
+            self.assertEqual(len(profiles_cache), 2)
+
+            shutil.rmtree(os.path.join(directory, "core", "tests_component_b"))
+            self.assertListEqual(manager.rescan().removed, ["core.tests_component_b"])
+            self.assertEqual(len(profiles_cache), 1)
+            self.assertEqual(len(ProfilesCache(profiles_cache.file)), 1)
+
+            self.assertTrue(manager.unregister_component("core.tests_component_a"))
+            self.assertEqual(len(profiles_cache), 1)
+
+            self.assertTrue(manager.register_components())
+            shutil.rmtree(os.path.join(directory, "core", "tests_component_a"))
+            self.assertTrue(manager.unregister_component("core.tests_component_a"))
+            self.assertEqual(len(profiles_cache), 0)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_register_components_lazy_profiles(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.register_components` method with lazy profiles.
+        """
+
+        manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS], lazy_profiles=True)
+        manager.register_components()
+        reference_manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+        reference_manager.register_components()
+        for name, profile in manager:
+            self.assertFalse(profile.informations_loaded)
+            self.assertEqual(profile.author, reference_manager.get_profile(name).author)
+            self.assertTrue(profile.informations_loaded)
 
     def test_unregister_components(self):
         """
@@ -274,6 +596,245 @@ class TestManager(unittest.TestCase):
         manager.instantiate_components()
         manager.unregister_components()
         self.assertTrue(not manager.components)
+        self.assertEqual(len(manager.strings_table), 0)
+
+    def test_rescan(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.rescan` method.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        try:
+            shutil.copytree(os.path.join(COMPONENTS_DIRECTORY, "core"), os.path.join(directory, "core"))
+            manager = Manager([directory])
+            manager.register_components()
+            manager.instantiate_components()
+            interface = manager.get_interface("core.tests_component_a")
+
+            changes = manager.rescan()
+            self.assertDictEqual(changes, {"added": [], "removed": [], "modified": []})
+
+            shutil.copytree(os.path.join(COMPONENTS_DIRECTORY, "addons", "tests_component_C"),
+                            os.path.join(directory, "addons", "tests_component_C"))
+            shutil.rmtree(os.path.join(directory, "core", "tests_component_b"))
+            with open(os.path.join(directory, "core", "tests_component_a", "tests_component_a.rc"), "a") as file:
+                file.write("\n; Modified.\n")
+
+            changes = manager.rescan()
+            self.assertListEqual(changes.added, ["addons.tests_component_c"])
+            self.assertListEqual(changes.removed, ["core.tests_component_b"])
+            self.assertListEqual(changes.modified, ["core.tests_component_a"])
+            self.assertListEqual(sorted(manager.components), ["addons.tests_component_c", "core.tests_component_a"])
+            self.assertIs(manager.get_interface("core.tests_component_a"), interface)
+
+            changes = manager.rescan()
+            self.assertDictEqual(changes, {"added": [], "removed": [], "modified": []})
+        finally:
+            shutil.rmtree(directory)
+
+    def test_save_index(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.save_index` method.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        try:
+            manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+            manager.register_components()
+            file = os.path.join(directory, "components.index")
+            self.assertTrue(manager.save_index(file))
+            self.assertTrue(os.path.isfile(file))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_load_index(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.load_index` method.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        try:
+            shutil.copytree(COMPONENTS_DIRECTORY, os.path.join(directory, "components"))
+            manager = Manager([os.path.join(directory, "components", item) for item in COMPONENTS])
+            manager.register_components()
+            manager.save_index(os.path.join(directory, "components", "components.index"))
+
+            shutil.move(os.path.join(directory, "components"), os.path.join(directory, "deployed"))
+            indexed_manager = Manager()
+            self.assertTrue(indexed_manager.load_index(os.path.join(directory, "deployed", "components.index")))
+            self.assertListEqual(sorted(indexed_manager.components), sorted(manager.components))
+            self.assertListEqual(indexed_manager.list_components(), manager.list_components())
+            for name, profile in indexed_manager:
+                self.assertTrue(os.path.isfile(profile.file))
+                self.assertEqual(os.path.dirname(profile.file), profile.directory)
+                self.assertIn("/deployed/", profile.file)
+                self.assertEqual(profile.author, manager.get_profile(name).author)
+                self.assertEqual(profile.signature, manager.get_profile(name).signature)
+            self.assertTrue(indexed_manager.instantiate_components())
+
+            with open(os.path.join(directory, "invalid.index"), "w") as file:
+                file.write("{\"format\": -1}")
+            self.assertRaises(ComponentsIndexError,
+                              indexed_manager.load_index,
+                              os.path.join(directory, "invalid.index"))
+            self.assertRaises(ComponentsIndexError,
+                              indexed_manager.load_index,
+                              os.path.join(directory, "missing.index"))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_save_snapshot(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.save_snapshot` method.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        try:
+            manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+            manager.register_components()
+            manager.instantiate_components()
+            file = os.path.join(directory, "components.snapshot")
+            self.assertTrue(manager.save_snapshot(file))
+            with open(file) as file_object:
+                data = json.load(file_object)
+            self.assertListEqual(data["order"], manager.list_components(dependency_order=True))
+            self.assertListEqual([profile["category"] for profile in data["profiles"]],
+                                 ["Default"] * len(manager.components))
+            self.assertIn(os.path.normpath(os.path.join(COMPONENTS_DIRECTORY, "core")),
+                          [path for path, signature in data["directories"]])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_instantiate_component_module_changes(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.instantiate_component` method with a Component module
+        changed after registration.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        try:
+            component_directory = os.path.join(directory, "components", "tests_component_module")
+            os.makedirs(component_directory)
+            with open(os.path.join(component_directory, "tests_component_module.rc"), "w") as file:
+                file.write("[Component]\nName = core.tests_component_module\nTitle = Tests Component Module\n"
+                           "Module = tests_component_module\nObject = TestsComponentModule\nVersion = 1.0\n")
+            content = "from manager.component import Component\n\n\nclass TestsComponentModule(Component):\n" \
+                      "    pass\n"
+            with open(os.path.join(component_directory, "__init__.py"), "w") as file:
+                file.write(content)
+
+            manager = Manager([os.path.join(directory, "components")])
+            manager.register_components()
+
+            with open(os.path.join(component_directory, "tests_component_module.py"), "w") as file:
+                file.write(content)
+
+            self.assertTrue(manager.instantiate_component("core.tests_component_module"))
+            self.assertEqual(os.path.dirname(manager.get_profile("core.tests_component_module").module.__file__),
+                             component_directory)
+            self.assertEqual(os.path.basename(manager.get_profile("core.tests_component_module").module.__file__),
+                             "tests_component_module.py")
+        finally:
+            sys.modules.pop("tests_component_module", None)
+            shutil.rmtree(directory)
+
+    def test_load_snapshot(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.load_snapshot` method.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        try:
+            shutil.copytree(COMPONENTS_DIRECTORY, os.path.join(directory, "components"))
+            paths = [os.path.join(directory, "components", item) for item in COMPONENTS]
+            manager = Manager(paths)
+            manager.register_components()
+            manager.instantiate_components()
+            file = os.path.join(directory, "components.snapshot")
+            manager.save_snapshot(file)
+            with open(file) as file_object:
+                self.assertNotIn("listings", json.load(file_object))
+
+            snapshot_manager = Manager(paths)
+            self.assertTrue(snapshot_manager.load_snapshot(file))
+            self.assertListEqual(sorted(snapshot_manager.components), sorted(manager.components))
+            self.assertListEqual(snapshot_manager.list_components(dependency_order=True),
+                                 manager.list_components(dependency_order=True))
+            for name, profile in snapshot_manager:
+                self.assertEqual(profile.category, "Default")
+                self.assertEqual(profile.signature, manager.get_profile(name).signature)
+            self.assertTrue(snapshot_manager.instantiate_components())
+
+            self.assertFalse(Manager(paths, extension="ini").load_snapshot(file))
+            self.assertFalse(Manager(paths).load_snapshot(os.path.join(directory, "missing.snapshot")))
+
+            core_directory = os.path.join(directory, "components", "core")
+            os.mkdir(os.path.join(core_directory, "tests_component_e"))
+            os.utime(core_directory, (0, 0))
+            self.assertFalse(Manager(paths).load_snapshot(file))
+            manager.save_snapshot(file)
+            self.assertTrue(Manager(paths).load_snapshot(file))
+
+            with open(os.path.join(core_directory, "tests_component_a", "tests_component_a.rc"), "a") as file_object:
+                file_object.write("\n")
+            self.assertFalse(Manager(paths).load_snapshot(file))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_compile_components(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.compile_components` method.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        try:
+            shutil.copytree(os.path.join(COMPONENTS_DIRECTORY, "core"), os.path.join(directory, "core"))
+            module = os.path.join(directory, "core", "tests_component_a", "tests_component_a.py")
+            os.path.exists("{0}c".format(module)) and os.remove("{0}c".format(module))
+
+            manager = Manager([directory])
+            manager.register_components()
+            self.assertTrue(manager.compile_components(workers=2))
+            self.assertTrue(os.path.isfile("{0}c".format(module)))
+
+            self.assertTrue(manager.compile_components(directory=os.path.join(directory, "bytecode")))
+            self.assertTrue(os.path.isfile(os.path.join(directory, "bytecode", "tests_component_b.pyc")))
+
+            with open(module, "a") as file:
+                file.write("\ndef (\n")
+            self.assertRaises(ComponentModuleError, manager.compile_components)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_compile_components_bytecode_directory(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.compile_components` method with a bytecode directory.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        try:
+            component_directory = os.path.join(directory, "components", "tests_component_bytecode")
+            os.makedirs(component_directory)
+            with open(os.path.join(component_directory, "tests_component_bytecode.rc"), "w") as file:
+                file.write("[Component]\nName = core.tests_component_bytecode\nTitle = Tests Component Bytecode\n"
+                           "Module = tests_component_bytecode\nObject = TestsComponentBytecode\nVersion = 1.0\n")
+            with open(os.path.join(component_directory, "tests_component_bytecode.py"), "w") as file:
+                file.write("from manager.component import Component\n\n\n"
+                           "class TestsComponentBytecode(Component):\n    pass\n")
+
+            bytecode_directory = os.path.join(directory, "bytecode")
+            manager = Manager([os.path.join(directory, "components")], bytecode_directory=bytecode_directory)
+            manager.register_components()
+            self.assertTrue(manager.compile_components())
+            self.assertTrue(os.path.isfile(os.path.join(bytecode_directory, "tests_component_bytecode.pyc")))
+            self.assertFalse(os.path.exists(os.path.join(component_directory, "tests_component_bytecode.pyc")))
+
+            self.assertTrue(manager.instantiate_component("core.tests_component_bytecode"))
+            self.assertEqual(manager.get_profile("core.tests_component_bytecode").module.__file__,
+                             os.path.join(bytecode_directory, "tests_component_bytecode.pyc"))
+        finally:
+            sys.modules.pop("tests_component_bytecode", None)
+            shutil.rmtree(directory)
 
     def test_instantiate_component(self):
         """
@@ -285,6 +846,37 @@ class TestManager(unittest.TestCase):
         self.assertTrue(manager.instantiate_component(SINGLE_COMPONENT[0], managerCallback))
         self.assertIsInstance(manager.components.values()[0].interface, SINGLE_COMPONENT[2])
 
+    def test_instantiate_component_indirect_subclass(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.instantiate_component` method with an indirect
+        :class:`manager.component.Component` class subclass.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        try:
+            shutil.copytree(os.path.join(COMPONENTS_DIRECTORY, "core"), os.path.join(directory, "core"))
+            module = os.path.join(directory, "core", "tests_component_a", "tests_component_a.py")
+            with open(module) as file:
+                content = file.read()
+            with open(module, "w") as file:
+                file.write(content.replace("class TestsComponentA(Component):",
+                                           "class BaseComponent(Component):\n    pass\n\n\n"
+                                           "class TestsComponentA(BaseComponent):"))
+            for path in ("{0}c".format(module), "{0}o".format(module)):
+                os.path.exists(path) and os.remove(path)
+
+            manager = Manager([directory])
+            manager.register_components()
+            self.assertTrue(manager.instantiate_component("core.tests_component_a"))
+            profile = manager.get_profile("core.tests_component_a")
+            self.assertEqual(profile.category, "Default")
+            self.assertIsInstance(profile.interface, Component)
+            self.assertTrue(manager.reload_component("core.tests_component_a"))
+            self.assertIsInstance(profile.interface, Component)
+        finally:
+            sys.modules.pop("tests_component_a", None)
+            shutil.rmtree(directory)
+
     def test_instantiate_components(self):
         """
         Tests :meth:`manager.components_manager.Manager.instantiate_components` method.
@@ -300,6 +892,209 @@ class TestManager(unittest.TestCase):
         manager.instantiate_components(managerCallback)
         for component in manager.components.itervalues():
             self.assertTrue(component.callback)
+        manager.unregister_components()
+        manager.register_components()
+        self.assertTrue(manager.instantiate_components(managerCallback, workers=4))
+        for component in manager.components.itervalues():
+            self.assertIsInstance(component.interface, Component)
+            self.assertTrue(component.callback)
+        manager.unregister_components()
+        manager.register_components()
+        self.assertTrue(manager.instantiate_components(managerCallback, lazy=True))
+        for component in manager.components.itervalues():
+            self.assertIsNone(component.module)
+        self.assertIsInstance(manager.get_interface("addons.tests_component_c"), Component)
+        for component in manager.components.itervalues():
+            self.assertIsNotNone(component.module)
+            self.assertTrue(component.callback)
+
+    def test_instantiate_components_importing(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.instantiate_components` method with workers while a
+        module import is in progress.
+        """
+
+        directory = tempfile.mkdtemp()
+        module = "tests_instantiate_components_importing"
+        try:
+            with open(os.path.join(directory, "{0}.py".format(module)), "w") as file:
+                file.write("from manager.components_manager import Manager\n\n"
+                           "MANAGER = Manager({0!r})\n"
+                           "MANAGER.register_components()\n"
+                           "RESULT = MANAGER.instantiate_components(workers=4)\n".format(
+                    [os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS]))
+
+            sys.path.insert(0, directory)
+            self.assertTrue(__import__(module).RESULT)
+        finally:
+            sys.path.remove(directory)
+            sys.modules.pop(module, None)
+            shutil.rmtree(directory)
+
+    def test_instantiate_components_targets(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.instantiate_components` method with targets.
+        """
+
+        manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+        manager.register_components()
+        self.assertTrue(manager.instantiate_components(targets=["core.tests_component_b"]))
+        self.assertIsInstance(manager.get_interface("core.tests_component_a"), Component)
+        self.assertIsInstance(manager.get_interface("core.tests_component_b"), Component)
+        self.assertIsNone(manager.get_interface("addons.tests_component_c"))
+
+        interface = manager.get_interface("core.tests_component_a")
+        self.assertTrue(manager.instantiate_components(targets=["addons.tests_component_c"], workers=4))
+        self.assertIs(manager.get_interface("core.tests_component_a"), interface)
+        self.assertIsInstance(manager.get_interface("addons.tests_component_c"), Component)
+
+        self.assertRaises(ComponentExistsError,
+                          manager.instantiate_components,
+                          targets=["core.tests_component_z"])
+
+    def test_initialize_component(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.initialize_component` method.
+        """
+
+        manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+        manager.register_components()
+        self.assertRaises(ComponentInterfaceError, manager.initialize_component, "core.tests_component_a")
+        manager.instantiate_components(lazy=True)
+        self.assertTrue(manager.initialize_component("core.tests_component_a"))
+        self.assertTrue(manager.get_interface("core.tests_component_a").initialized)
+        self.assertIn("initialize", manager.get_profile("core.tests_component_a").timings)
+
+    def test_activate_component(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.activate_component` method.
+        """
+
+        manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+        manager.register_components()
+        manager.instantiate_components()
+        self.assertTrue(manager.activate_component("core.tests_component_a", None))
+        self.assertTrue(manager.get_interface("core.tests_component_a").activated)
+        self.assertIn("activate", manager.get_profile("core.tests_component_a").timings)
+
+    def test_activate_components(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.activate_components` method.
+        """
+
+        for workers in (None, 4):
+            manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+            manager.register_components()
+            manager.instantiate_components()
+            self.assertEqual(manager.activate_components((None,), workers), {})
+            for component in manager.components:
+                interface = manager.get_interface(component)
+                self.assertTrue(interface.initialized)
+                self.assertTrue(interface.activated)
+
+        def activate(container):
+            raise RuntimeError("Activation failed!")
+
+        manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+        manager.register_components()
+        manager.instantiate_components()
+        manager.get_interface("core.tests_component_b").activate = activate
+        failures = manager.activate_components((None,), 4)
+        self.assertListEqual(sorted(failures), ["addons.tests_component_c", "core.tests_component_b"])
+        for failure in failures.itervalues():
+            self.assertIsInstance(failure, ComponentActivationError)
+        self.assertTrue(manager.get_interface("core.tests_component_a").activated)
+        self.assertFalse(manager.get_interface("addons.tests_component_c").initialized)
+
+    def test_deactivate_components(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.deactivate_components` method.
+        """
+
+        for workers in (None, 4):
+            manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+            manager.register_components()
+            manager.instantiate_components()
+            manager.activate_components((None,))
+            self.assertEqual(manager.deactivate_components(workers), {})
+            for component in manager.components:
+                interface = manager.get_interface(component)
+                self.assertFalse(interface.activated)
+                self.assertFalse(interface.initialized)
+
+        def deactivate():
+            raise RuntimeError("Deactivation failed!")
+
+        manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+        manager.register_components()
+        manager.instantiate_components()
+        manager.activate_components((None,))
+        manager.get_interface("core.tests_component_b").deactivate = deactivate
+        failures = manager.deactivate_components()
+        self.assertListEqual(sorted(failures), ["core.tests_component_a", "core.tests_component_b"])
+        for failure in failures.itervalues():
+            self.assertIsInstance(failure, ComponentDeactivationError)
+        self.assertFalse(manager.get_interface("addons.tests_component_c").activated)
+        self.assertTrue(manager.get_interface("core.tests_component_a").activated)
+
+    def test_shutdown_components(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.shutdown_components` method.
+        """
+
+        manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+        manager.register_components()
+        manager.instantiate_components()
+        manager.activate_components((None,))
+        self.assertEqual(manager.shutdown_components(timeout=5), {})
+        for component in manager.components:
+            interface = manager.get_interface(component)
+            self.assertFalse(interface.activated)
+            self.assertFalse(interface.initialized)
+
+        def deactivate():
+            time.sleep(0.5)
+
+        manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+        manager.register_components()
+        manager.instantiate_components()
+        manager.activate_components((None,))
+        manager.get_interface("core.tests_component_b").deactivate = deactivate
+        failures = manager.shutdown_components(timeout=0.1)
+        self.assertListEqual(failures.keys(), ["core.tests_component_b"])
+        self.assertIsInstance(failures["core.tests_component_b"], ComponentTimeoutError)
+        self.assertFalse(manager.get_interface("core.tests_component_a").activated)
+        self.assertFalse(manager.get_interface("addons.tests_component_c").activated)
+
+        class FailingQObjectComponent(QObjectComponent):
+            activated = True
+
+            def deactivate(self):
+                raise RuntimeError("Deactivation failed!")
+
+        manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+        manager.register_components()
+        manager.instantiate_components()
+        manager.activate_components((None,))
+        manager.get_profile("core.tests_component_b").interface = FailingQObjectComponent(
+            name="core.tests_component_b")
+        failures = manager.shutdown_components(timeout=5)
+        self.assertListEqual(failures.keys(), ["core.tests_component_b"])
+        self.assertIsInstance(failures["core.tests_component_b"], ComponentDeactivationError)
+        self.assertFalse(manager.get_interface("core.tests_component_a").activated)
+
+        def get_interface(component):
+            raise ComponentInterfaceError("'{0}' Component Interface is not available!".format(component))
+
+        manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+        manager.register_components()
+        manager.instantiate_components()
+        manager.activate_components((None,))
+        manager._Manager__get_interface = get_interface
+        failures = manager.shutdown_components(timeout=5)
+        self.assertListEqual(sorted(failures), sorted(manager.components))
+        for failure in failures.itervalues():
+            self.assertIsInstance(failure, ComponentDeactivationError)
 
     def test_reload_component(self):
         """
@@ -338,8 +1133,78 @@ class TestManager(unittest.TestCase):
         manager = Manager(components_paths)
         manager.register_components()
         manager.instantiate_components()
+        components = manager.list_components()
+        for name, profile in manager:
+            dependents = manager.list_dependents(name)
+            self.assertListEqual(sorted(COMPONENTS_DEPENDENTS[name]), sorted(dependents))
+            self.assertListEqual(dependents, sorted(dependents, key=components.index))
+
+    def test_list_dependencies(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.list_dependencies` method.
+        """
+
+        components_paths = [os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS]
+        components_paths.append(ALTERNATIVE_COMPONENTS_DIRECTORY)
+        manager = Manager(components_paths)
+        manager.register_components()
+        for name, profile in manager:
+            dependencies = [component for component in COMPONENTS_DEPENDENCY_ORDER
+                            if name in COMPONENTS_DEPENDENTS[component]]
+            self.assertListEqual(manager.list_dependencies(name), dependencies)
+
+    def test_get_critical_path(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.get_critical_path` method.
+        """
+
+        manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+        manager.register_components()
+        manager.instantiate_components()
+        for name, profile in manager:
+            self.assertTrue(set(("parse", "import", "construct")).issubset(profile.timings))
+            profile.timings = {"import": {"wall": 1.0, "cpu": 0.5}}
+        manager.get_profile("core.tests_component_a").timings = {}
+
+        components, total = manager.get_critical_path()
+        self.assertListEqual(components, ["core.tests_component_a",
+                                          "core.tests_component_b",
+                                          "addons.tests_component_c"])
+        self.assertEqual(total, 2.0)
+        self.assertEqual(manager.get_critical_path("cpu")[1], 1.0)
+
+    def test_get_timings_report(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.get_timings_report` method.
+        """
+
+        manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+        manager.register_components()
+        manager.instantiate_components()
+        report = manager.get_timings_report()
+        self.assertIsInstance(report, unicode)
         for name, profile in manager:
-            self.assertListEqual(sorted(COMPONENTS_DEPENDENTS[name]), sorted(manager.list_dependents(name)))
+            self.assertIn(name, report)
+        self.assertIn("Critical path", report)
+
+    def test_save_timings(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.save_timings` method.
+        """
+
+        manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+        manager.register_components()
+        manager.instantiate_components()
+        directory = unicode(tempfile.mkdtemp())
+        try:
+            file = os.path.join(directory, "timings.json")
+            self.assertTrue(manager.save_timings(file))
+            with open(file) as file_object:
+                data = json.load(file_object)
+            self.assertListEqual(sorted(data["components"]), sorted(manager.components))
+            self.assertIn("components", data["critical_path"]["wall"])
+        finally:
+            shutil.rmtree(directory)
 
     def test_filter_components(self):
         """
@@ -353,6 +1218,39 @@ class TestManager(unittest.TestCase):
         self.assertIsInstance(components, list)
         self.assertListEqual(components, ["addons.tests_component_c"])
 
+        self.assertListEqual(manager.filter_components(category="Default"), sorted(manager.components))
+        self.assertListEqual(manager.filter_components("core", category="Default"),
+                             ["core.tests_component_a", "core.tests_component_b"])
+        self.assertListEqual(manager.filter_components(category="QWidget"), [])
+        self.assertListEqual(manager.filter_components(package="tests_component_b", version="1.0"),
+                             ["core.tests_component_b"])
+        self.assertListEqual(manager.filter_components(author="Thomas Mansencal"), sorted(manager.components))
+
+        self.assertListEqual(manager.filter_components(r"^core\."),
+                             ["core.tests_component_a", "core.tests_component_b"])
+        self.assertListEqual(manager.filter_components(r"^core\.\w+_b$"), ["core.tests_component_b"])
+        self.assertListEqual(manager.filter_components(r"^core\.tests_component_a$"), ["core.tests_component_a"])
+        self.assertListEqual(manager.filter_components(r"^core\.tests_component_a$", package="tests_component_b"), [])
+        self.assertListEqual(manager.filter_components(glob="core.*"),
+                             ["core.tests_component_a", "core.tests_component_b"])
+        self.assertListEqual(manager.filter_components(glob="*_[ac]"), ["addons.tests_component_c",
+                                                                        "core.tests_component_a"])
+        self.assertListEqual(manager.filter_components(r"^addons", glob="core.*"), [])
+        self.assertListEqual(manager.filter_components(r"_a$", glob="core.*"), ["core.tests_component_a"])
+
+        self.assertListEqual(manager.filter_components(category=""), sorted(manager.components))
+        manager.get_profile("core.tests_component_a").category = "Zzz"
+        manager.get_profile("core.tests_component_b").author = "John Doe"
+        self.assertListEqual(manager.filter_components(".*", category="Zzz"), ["core.tests_component_a"])
+        self.assertListEqual(manager.filter_components(author="John Doe"), ["core.tests_component_b"])
+        self.assertNotIn("core.tests_component_a", manager.filter_components(category="Default"))
+        self.assertNotIn("core.tests_component_b", manager.filter_components(author="Thomas Mansencal"))
+
+        manager.unregister_component("core.tests_component_b")
+        self.assertListEqual(manager.filter_components(package="tests_component_b"), [])
+        manager.unregister_components()
+        self.assertListEqual(manager.filter_components(category="Default"), [])
+
     def test_get_profile(self):
         """
         Tests :meth:`manager.components_manager.Manager.get_profile` method.
@@ -363,6 +1261,18 @@ class TestManager(unittest.TestCase):
         manager.instantiate_components()
         for component in manager.components:
             self.assertIsInstance(manager.get_profile(component), Profile)
+        self.assertIsNone(manager.get_profile("core.tests_component_.$"))
+        self.assertIsNone(manager.get_profile("Undefined"))
+
+    def test_match_profile(self):
+        """
+        Tests :meth:`manager.components_manager.Manager.match_profile` method.
+        """
+
+        manager = Manager([os.path.join(COMPONENTS_DIRECTORY, item) for item in COMPONENTS])
+        manager.register_components()
+        self.assertIs(manager.match_profile(r"core\.\w+_a$"), manager.get_profile("core.tests_component_a"))
+        self.assertIsNone(manager.match_profile(r"^Undefined$"))
 
     def test_get_interface(self):
         """
@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_dependency_graph.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`manager.dependency_graph` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import itertools
+import sys
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+import foundations.common
+import manager.exceptions
+from manager.dependency_graph import DependencyGraph
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["DEPENDENCIES", "TestDependencyGraph"]
+
+DEPENDENCIES = {"core.database": [],
+                "core.settings": [],
+                "core.engine": ["core.database", "core.settings"],
+                "addons.projects": ["core.engine"],
+                "addons.editor": ["core.engine", "addons.projects"],
+                "addons.viewer": ["core.missing"]}
+
+
+class TestDependencyGraph(unittest.TestCase):
+    """
+    Defines :class:`manager.dependency_graph.DependencyGraph` class units tests methods.
+    """
+
+    def __get_dependency_graph(self, dependencies=DEPENDENCIES):
+        """
+        Returns a dependency graph built from given dependencies.
+
+        :param dependencies: Dependencies.
+        :type dependencies: dict
+        :return: Dependency graph.
+        :rtype: DependencyGraph
+        """
+
+        dependency_graph = DependencyGraph()
+        for component, requires in dependencies.iteritems():
+            dependency_graph.add(component, requires)
+        return dependency_graph
+
+    def __resolve(self, dependencies):
+        """
+        Resolves given dependencies with :func:`foundations.common.dependency_resolver` definition.
+
+        :param dependencies: Dependencies.
+        :type dependencies: dict
+        :return: Components.
+        :rtype: list
+        """
+
+        return list(itertools.chain.from_iterable(
+            sorted(batch) for batch in foundations.common.dependency_resolver(dependencies)))
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ("requires",
+                               "dependents")
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(DependencyGraph))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("__contains__",
+                            "__len__",
+                            "add",
+                            "remove",
+                            "clear",
+                            "get_level",
+                            "get_dependencies",
+                            "get_dependents",
+                            "get_order",
+                            "set_order",
+                            "get_ranks")
+
+        for method in required_methods:
+            self.assertIn(method, dir(DependencyGraph))
+
+    def test__contains__(self):
+        """
+        Tests :meth:`manager.dependency_graph.DependencyGraph.__contains__` method.
+        """
+
+        dependency_graph = self.__get_dependency_graph()
+        self.assertIn("core.engine", dependency_graph)
+        self.assertNotIn("core.missing", dependency_graph)
+
+    def test__len__(self):
+        """
+        Tests :meth:`manager.dependency_graph.DependencyGraph.__len__` method.
+        """
+
+        self.assertEqual(len(self.__get_dependency_graph()), len(DEPENDENCIES))
+
+    def test_add(self):
+        """
+        Tests :meth:`manager.dependency_graph.DependencyGraph.add` method.
+        """
+
+        dependency_graph = self.__get_dependency_graph()
+        self.assertSetEqual(dependency_graph.dependents["core.engine"], set(["addons.projects", "addons.editor"]))
+        self.assertEqual(dependency_graph.get_level("addons.editor"), 3)
+
+        self.assertTrue(dependency_graph.add("addons.editor", ["core.engine"]))
+        self.assertSetEqual(dependency_graph.dependents["addons.projects"], set())
+        self.assertEqual(dependency_graph.get_level("addons.editor"), 2)
+
+        self.assertTrue(dependency_graph.add("core.missing", ["core.engine"]))
+        self.assertEqual(dependency_graph.get_level("addons.viewer"), 3)
+
+    def test_remove(self):
+        """
+        Tests :meth:`manager.dependency_graph.DependencyGraph.remove` method.
+        """
+
+        dependency_graph = self.__get_dependency_graph()
+        dependency_graph.get_order()
+        self.assertTrue(dependency_graph.remove("core.engine"))
+        self.assertFalse(dependency_graph.remove("core.engine"))
+        self.assertNotIn("core.engine", dependency_graph)
+        self.assertEqual(dependency_graph.get_level("addons.editor"), 2)
+
+        self.assertTrue(dependency_graph.remove("addons.viewer"))
+        self.assertNotIn("core.missing", dependency_graph.dependents)
+
+        dependencies = dict(DEPENDENCIES)
+        for component in ("core.engine", "addons.viewer"):
+            del (dependencies[component])
+        self.assertListEqual(dependency_graph.get_order(), self.__resolve(dependencies))
+
+    def test_clear(self):
+        """
+        Tests :meth:`manager.dependency_graph.DependencyGraph.clear` method.
+        """
+
+        dependency_graph = self.__get_dependency_graph()
+        self.assertTrue(dependency_graph.clear())
+        self.assertEqual(len(dependency_graph), 0)
+        self.assertListEqual(dependency_graph.get_order(), [])
+
+    def test_get_level(self):
+        """
+        Tests :meth:`manager.dependency_graph.DependencyGraph.get_level` method.
+        """
+
+        dependency_graph = self.__get_dependency_graph()
+        self.assertEqual(dependency_graph.get_level("core.database"), 0)
+        self.assertEqual(dependency_graph.get_level("core.missing"), 0)
+        self.assertEqual(dependency_graph.get_level("addons.viewer"), 1)
+        self.assertEqual(dependency_graph.get_level("addons.projects"), 2)
+
+        dependency_graph.add("core.database", ["addons.editor"])
+        self.assertRaises(manager.exceptions.ComponentDependenciesError, dependency_graph.get_level, "core.engine")
+
+        dependency_graph.add("core.database", [])
+        self.assertEqual(dependency_graph.get_level("addons.editor"), 3)
+
+        dependency_graph.add("core.settings", ["core.settings"])
+        self.assertRaises(manager.exceptions.ComponentDependenciesError, dependency_graph.get_order)
+
+    def test_get_dependencies(self):
+        """
+        Tests :meth:`manager.dependency_graph.DependencyGraph.get_dependencies` method.
+        """
+
+        dependency_graph = self.__get_dependency_graph()
+        self.assertSetEqual(dependency_graph.get_dependencies("addons.editor"),
+                            set(["addons.projects", "core.engine", "core.database", "core.settings"]))
+        self.assertSetEqual(dependency_graph.get_dependencies("addons.viewer"), set(["core.missing"]))
+        self.assertSetEqual(dependency_graph.get_dependencies("core.database"), set())
+        self.assertSetEqual(dependency_graph.get_dependencies("core.unknown"), set())
+
+    def test_get_dependents(self):
+        """
+        Tests :meth:`manager.dependency_graph.DependencyGraph.get_dependents` method.
+        """
+
+        dependency_graph = self.__get_dependency_graph()
+        self.assertSetEqual(dependency_graph.get_dependents("core.database"),
+                            set(["core.engine", "addons.projects", "addons.editor"]))
+        self.assertSetEqual(dependency_graph.get_dependents("core.missing"), set(["addons.viewer"]))
+        self.assertSetEqual(dependency_graph.get_dependents("addons.editor"), set())
+        self.assertSetEqual(dependency_graph.get_dependents("core.unknown"), set())
+
+        dependency_graph.add("core.database", ["addons.editor"])
+        self.assertIn("core.database", dependency_graph.get_dependents("core.database"))
+
+    def test_get_order(self):
+        """
+        Tests :meth:`manager.dependency_graph.DependencyGraph.get_order` method.
+        """
+
+        dependency_graph = self.__get_dependency_graph()
+        order = dependency_graph.get_order()
+        self.assertListEqual(order, self.__resolve(DEPENDENCIES))
+        self.assertIs(dependency_graph.get_order(), order)
+
+        dependency_graph.add("addons.viewer", ["addons.editor"])
+        dependencies = dict(DEPENDENCIES, **{"addons.viewer": ["addons.editor"]})
+        self.assertListEqual(dependency_graph.get_order(), self.__resolve(dependencies))
+
+    def test_set_order(self):
+        """
+        Tests :meth:`manager.dependency_graph.DependencyGraph.set_order` method.
+        """
+
+        dependency_graph = self.__get_dependency_graph()
+        order = list(self.__resolve(DEPENDENCIES))
+        self.assertTrue(dependency_graph.set_order(order))
+        self.assertListEqual(dependency_graph.get_order(), order)
+        self.assertFalse(dependency_graph.set_order(order[1:]))
+
+    def test_get_ranks(self):
+        """
+        Tests :meth:`manager.dependency_graph.DependencyGraph.get_ranks` method.
+        """
+
+        dependency_graph = self.__get_dependency_graph()
+        ranks = dependency_graph.get_ranks()
+        self.assertListEqual(sorted(ranks, key=ranks.get), dependency_graph.get_order())
+
+
+if __name__ == "__main__":
+    import manager.tests.utilities
+
+    unittest.main()
@@ -59,7 +59,11 @@ class TestConstants(unittest.TestCase):
                                "codec_error",
                                "application_directory",
                                "provider_directory",
-                               "null_object")
+                               "null_object",
+                               "ignored_directories",
+                               "profiles_cache_format",
+                               "index_format",
+                               "snapshot_format")
 
         for attribute in required_attributes:
             self.assertIn(attribute, Constants.__dict__)
@@ -181,6 +185,36 @@ class TestConstants(unittest.TestCase):
 
         self.assertRegexpMatches(Constants.null_object, "\w+")
 
+    def test_ignored_directories_attribute(self):
+        """
+        Tests :attr:`manager.globals.constants.Constants.ignored_directories` attribute.
+        """
+
+        self.assertIsInstance(Constants.ignored_directories, tuple)
+        for directory in Constants.ignored_directories:
+            self.assertRegexpMatches(directory, "\w+")
+
+    def test_profiles_cache_format_attribute(self):
+        """
+        Tests :attr:`manager.globals.constants.Constants.profiles_cache_format` attribute.
+        """
+
+        self.assertIsInstance(Constants.profiles_cache_format, int)
+
+    def test_index_format_attribute(self):
+        """
+        Tests :attr:`manager.globals.constants.Constants.index_format` attribute.
+        """
+
+        self.assertIsInstance(Constants.index_format, int)
+
+    def test_snapshot_format_attribute(self):
+        """
+        Tests :attr:`manager.globals.constants.Constants.snapshot_format` attribute.
+        """
+
+        self.assertIsInstance(Constants.snapshot_format, int)
+
 
 if __name__ == "__main__":
     unittest.main()
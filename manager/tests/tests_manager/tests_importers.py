@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_importers.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`manager.importers` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+import py_compile
+import shutil
+import sys
+import tempfile
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+from manager.importers import ComponentsImporter
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["PACKAGE", "TestComponentsImporter"]
+
+PACKAGE = "tests_importers_package"
+
+
+class TestComponentsImporter(unittest.TestCase):
+    """
+    Defines :class:`manager.importers.ComponentsImporter` class units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initializes common tests objects.
+        """
+
+        self.__directory = unicode(tempfile.mkdtemp())
+        os.mkdir(os.path.join(self.__directory, PACKAGE))
+        for name, content in (("__init__.py", "from {0}.module import VALUE\n".format(PACKAGE)),
+                              ("module.py", "VALUE = 1\n")):
+            with open(os.path.join(self.__directory, PACKAGE, name), "w") as file:
+                file.write(content)
+
+        self.__importer = ComponentsImporter()
+
+    def tearDown(self):
+        """
+        Deletes common tests objects.
+        """
+
+        self.__importer.uninstall()
+        for name in (PACKAGE, "{0}.module".format(PACKAGE)):
+            sys.modules.pop(name, None)
+        shutil.rmtree(self.__directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ("paths", "bytecode_directory")
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(ComponentsImporter))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("__contains__",
+                            "register",
+                            "unregister",
+                            "clear",
+                            "install",
+                            "uninstall",
+                            "find_module",
+                            "load_module")
+
+        for method in required_methods:
+            self.assertIn(method, dir(ComponentsImporter))
+
+    def test_register(self):
+        """
+        Tests :meth:`manager.importers.ComponentsImporter.register` method.
+        """
+
+        self.assertTrue(self.__importer.register(PACKAGE, self.__directory))
+        self.assertIn(PACKAGE, self.__importer)
+        self.assertTrue(self.__importer.unregister(PACKAGE))
+        self.assertFalse(self.__importer.unregister(PACKAGE))
+        self.__importer.register(PACKAGE, self.__directory)
+        self.assertTrue(self.__importer.clear())
+        self.assertNotIn(PACKAGE, self.__importer)
+
+    def test_install(self):
+        """
+        Tests :meth:`manager.importers.ComponentsImporter.install` method.
+        """
+
+        self.assertTrue(self.__importer.install())
+        self.__importer.install()
+        self.assertEqual(sys.meta_path.count(self.__importer), 1)
+        self.assertTrue(self.__importer.uninstall())
+        self.assertNotIn(self.__importer, sys.meta_path)
+
+    def test_find_module(self):
+        """
+        Tests :meth:`manager.importers.ComponentsImporter.find_module` method.
+        """
+
+        self.__importer.register(PACKAGE, self.__directory)
+        self.assertIs(self.__importer.find_module(PACKAGE), self.__importer)
+        self.assertIsNone(self.__importer.find_module(PACKAGE, [self.__directory]))
+        self.assertIsNone(self.__importer.find_module("os"))
+        self.__importer.register(PACKAGE, os.path.join(self.__directory, PACKAGE))
+        self.assertIsNone(self.__importer.find_module(PACKAGE))
+
+    def test_load_module(self):
+        """
+        Tests :meth:`manager.importers.ComponentsImporter.load_module` method.
+        """
+
+        self.__importer.register(PACKAGE, self.__directory)
+        self.__importer.install()
+        path = list(sys.path)
+        module = __import__(PACKAGE)
+        self.assertListEqual(sys.path, path)
+        self.assertIs(module.__loader__, self.__importer)
+        self.assertEqual(module.VALUE, 1)
+        self.assertEqual(os.path.dirname(module.__file__), os.path.join(self.__directory, PACKAGE))
+
+        with open(os.path.join(self.__directory, PACKAGE, "__init__.py"), "w") as file:
+            file.write("VALUE = 2\n")
+        bytecode = "{0}c".format(os.path.splitext(module.__file__)[0] + ".py")
+        os.path.exists(bytecode) and os.remove(bytecode)
+        self.assertIs(reload(module), module)
+        self.assertEqual(module.VALUE, 2)
+
+
+    def test_load_module_bytecode(self):
+        """
+        Tests :meth:`manager.importers.ComponentsImporter.load_module` method with a bytecode directory.
+        """
+
+        bytecode_directory = os.path.join(self.__directory, "bytecode")
+        os.makedirs(os.path.join(bytecode_directory, PACKAGE))
+        for name in ("__init__", "module"):
+            py_compile.compile(os.path.join(self.__directory, PACKAGE, "{0}.py".format(name)),
+                               cfile=os.path.join(bytecode_directory, PACKAGE, "{0}.pyc".format(name)),
+                               doraise=True)
+
+        self.__importer.bytecode_directory = bytecode_directory
+        self.__importer.register(PACKAGE, self.__directory)
+        self.__importer.install()
+        module = __import__(PACKAGE)
+        self.assertEqual(module.VALUE, 1)
+        self.assertEqual(module.__file__, os.path.join(bytecode_directory, PACKAGE, "__init__.pyc"))
+        self.assertEqual(sys.modules["{0}.module".format(PACKAGE)].__file__,
+                         os.path.join(bytecode_directory, PACKAGE, "module.pyc"))
+        self.assertFalse(os.path.exists(os.path.join(self.__directory, PACKAGE, "__init__.pyc")))
+
+        source = os.path.join(self.__directory, PACKAGE, "__init__.py")
+        with open(source, "w") as file:
+            file.write("VALUE = 2\n")
+        os.utime(source, (os.stat(source).st_atime, os.stat(source).st_mtime + 10))
+        self.assertIs(reload(module), module)
+        self.assertEqual(module.VALUE, 2)
+        self.assertNotEqual(module.__file__, os.path.join(bytecode_directory, PACKAGE, "__init__.pyc"))
+
+if __name__ == "__main__":
+    import manager.tests.utilities
+
+    unittest.main()
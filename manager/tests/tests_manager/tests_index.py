@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_index.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`manager.index` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import sys
+import tempfile
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+from manager.components_manager import Manager
+from manager.index import build_index
+from manager.index import main
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["RESOURCES_DIRECTORY", "COMPONENTS_DIRECTORY", "TestBuildIndex", "TestMain"]
+
+RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), "resources")
+COMPONENTS_DIRECTORY = os.path.join(RESOURCES_DIRECTORY, "components")
+
+
+class TestBuildIndex(unittest.TestCase):
+    """
+    Defines :func:`manager.index.build_index` definition units tests methods.
+    """
+
+    def test_build_index(self):
+        """
+        Tests :func:`manager.index.build_index` definition.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        try:
+            file = os.path.join(directory, "components.index")
+            self.assertTrue(build_index([os.path.join(COMPONENTS_DIRECTORY, "core")], file))
+
+            manager = Manager()
+            manager.load_index(file)
+            self.assertListEqual(manager.list_components(), ["core.tests_component_a", "core.tests_component_b"])
+        finally:
+            shutil.rmtree(directory)
+
+
+class TestMain(unittest.TestCase):
+    """
+    Defines :func:`manager.index.main` definition units tests methods.
+    """
+
+    def test_main(self):
+        """
+        Tests :func:`manager.index.main` definition.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        arguments = sys.argv
+        try:
+            file = os.path.join(directory, "components.index")
+            sys.argv = ["manager_index", "-o", file, os.path.join(COMPONENTS_DIRECTORY, "core")]
+            self.assertEqual(main(), 0)
+            self.assertTrue(os.path.isfile(file))
+        finally:
+            sys.argv = arguments
+            shutil.rmtree(directory)
+
+    def test_main_registration_failure(self):
+        """
+        Tests :func:`manager.index.main` definition with a Component failing to register.
+        """
+
+        directory = unicode(tempfile.mkdtemp())
+        arguments = sys.argv
+        try:
+            shutil.copytree(os.path.join(COMPONENTS_DIRECTORY, "core"), os.path.join(directory, "core"))
+            with open(os.path.join(directory, "core", "tests_component_b", "tests_component_b.rc"), "w") as file:
+                file.write("[Component]\nName = core.tests_component_b\n")
+
+            file = os.path.join(directory, "components.index")
+            sys.argv = ["manager_index", "-o", file, os.path.join(directory, "core")]
+            self.assertEqual(main(), 1)
+            self.assertFalse(os.path.isfile(file))
+        finally:
+            sys.argv = arguments
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    import manager.tests.utilities
+
+    unittest.main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_indexes.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`manager.indexes` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+import sys
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+from manager.components_manager import Profile
+from manager.indexes import ProfilesIndexes
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["RESOURCES_DIRECTORY", "COMPONENTS_FILES", "TestProfilesIndexes"]
+
+RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), "resources")
+COMPONENTS_FILES = (os.path.join(RESOURCES_DIRECTORY, "components/core/tests_component_a/tests_component_a.rc"),
+                    os.path.join(RESOURCES_DIRECTORY, "components/core/tests_component_b/tests_component_b.rc"))
+
+
+class TestProfilesIndexes(unittest.TestCase):
+    """
+    Defines :class:`manager.indexes.ProfilesIndexes` class units tests methods.
+    """
+
+    def __get_profiles(self, lazy=False):
+        """
+        Returns the tests Components profiles.
+
+        :param lazy: Lazy profiles.
+        :type lazy: bool
+        :return: Profiles.
+        :rtype: list
+        """
+
+        profiles = []
+        for file in COMPONENTS_FILES:
+            profile = Profile(file=file)
+            profile.initializeProfile(lazy)
+            profiles.append(profile)
+        return profiles
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ("attributes",
+                               "informations_attributes",
+                               "indexes",
+                               "names")
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(ProfilesIndexes))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("__contains__",
+                            "add",
+                            "update",
+                            "remove",
+                            "clear",
+                            "get",
+                            "get_prefixed")
+
+        for method in required_methods:
+            self.assertIn(method, dir(ProfilesIndexes))
+
+    def test_add(self):
+        """
+        Tests :meth:`manager.indexes.ProfilesIndexes.add` method.
+        """
+
+        profiles_indexes = ProfilesIndexes()
+        profile_a, profile_b = self.__get_profiles()
+        for profile in (profile_a, profile_b):
+            self.assertTrue(profiles_indexes.add(profile))
+            self.assertIn(profile.name, profiles_indexes)
+
+        self.assertSetEqual(profiles_indexes.get("package", "tests_component_a"), set([profile_a.name]))
+        self.assertSetEqual(profiles_indexes.get("version", "1.0"), set([profile_a.name, profile_b.name]))
+        self.assertSetEqual(profiles_indexes.get("category", None), set([profile_a.name, profile_b.name]))
+
+        profile_a.category = "Default"
+        profiles_indexes.add(profile_a)
+        self.assertSetEqual(profiles_indexes.get("category", "Default"), set([profile_a.name]))
+        self.assertSetEqual(profiles_indexes.get("category", None), set([profile_b.name]))
+
+    def test_add_lazy(self):
+        """
+        Tests :meth:`manager.indexes.ProfilesIndexes.add` method with lazy profiles.
+        """
+
+        profiles_indexes = ProfilesIndexes()
+        profiles = self.__get_profiles(lazy=True)
+        for profile in profiles:
+            profiles_indexes.add(profile)
+
+        for profile in profiles:
+            self.assertFalse(profile.informations_loaded)
+        self.assertSetEqual(profiles_indexes.get("author", "Thomas Mansencal"),
+                            set(profile.name for profile in profiles))
+        for profile in profiles:
+            self.assertTrue(profile.informations_loaded)
+
+    def test_update(self):
+        """
+        Tests :meth:`manager.indexes.ProfilesIndexes.update` method.
+        """
+
+        profiles_indexes = ProfilesIndexes()
+        profile_a, profile_b = self.__get_profiles()
+        profiles_indexes.add(profile_a)
+        profiles_indexes.add(profile_b)
+        profile_a.indexes = profiles_indexes
+        profile_a.version = "2.0"
+        self.assertSetEqual(profiles_indexes.get("version", "2.0"), set([profile_a.name]))
+        self.assertSetEqual(profiles_indexes.get("version", "1.0"), set([profile_b.name]))
+
+        profile_b.version = "3.0"
+        self.assertTrue(profiles_indexes.update(profile_b, "version"))
+        self.assertSetEqual(profiles_indexes.get("version", "3.0"), set([profile_b.name]))
+
+        profiles_indexes.remove(profile_a.name)
+        self.assertFalse(profiles_indexes.update(profile_a, "version"))
+
+    def test_remove(self):
+        """
+        Tests :meth:`manager.indexes.ProfilesIndexes.remove` method.
+        """
+
+        profiles_indexes = ProfilesIndexes()
+        profile_a, profile_b = self.__get_profiles(lazy=True)
+        profiles_indexes.add(profile_a)
+        profiles_indexes.add(profile_b)
+        self.assertTrue(profiles_indexes.remove(profile_a.name))
+        self.assertFalse(profiles_indexes.remove(profile_a.name))
+        self.assertNotIn(profile_a.name, profiles_indexes)
+        self.assertSetEqual(profiles_indexes.get("package", "tests_component_a"), set())
+        self.assertSetEqual(profiles_indexes.get("author", "Thomas Mansencal"), set([profile_b.name]))
+        self.assertFalse(profile_a.informations_loaded)
+
+    def test_clear(self):
+        """
+        Tests :meth:`manager.indexes.ProfilesIndexes.clear` method.
+        """
+
+        profiles_indexes = ProfilesIndexes()
+        for profile in self.__get_profiles():
+            profiles_indexes.add(profile)
+        self.assertTrue(profiles_indexes.clear())
+        for index in profiles_indexes.indexes.itervalues():
+            self.assertDictEqual(index, {})
+
+    def test_get_prefixed(self):
+        """
+        Tests :meth:`manager.indexes.ProfilesIndexes.get_prefixed` method.
+        """
+
+        profiles_indexes = ProfilesIndexes()
+        profile_a, profile_b = self.__get_profiles()
+        for profile in (profile_b, profile_a):
+            profiles_indexes.add(profile)
+        self.assertListEqual(profiles_indexes.names, [profile_a.name, profile_b.name])
+        self.assertListEqual(profiles_indexes.get_prefixed("core."), [profile_a.name, profile_b.name])
+        self.assertListEqual(profiles_indexes.get_prefixed(profile_b.name), [profile_b.name])
+        self.assertListEqual(profiles_indexes.get_prefixed("addons."), [])
+
+        profiles_indexes.remove(profile_a.name)
+        self.assertListEqual(profiles_indexes.get_prefixed("core."), [profile_b.name])
+
+
+if __name__ == "__main__":
+    import manager.tests.utilities
+
+    unittest.main()
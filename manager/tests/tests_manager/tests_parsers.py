@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_parsers.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`manager.parsers` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import codecs
+import os
+import shutil
+import sys
+import tempfile
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+import foundations.exceptions
+from manager.parsers import read_manifest
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["RESOURCES_DIRECTORY", "COMPONENT_FILE", "TestReadManifest"]
+
+RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), "resources")
+COMPONENT_FILE = os.path.join(RESOURCES_DIRECTORY, "components/core/tests_component_a/tests_component_a.rc")
+
+
+class TestReadManifest(unittest.TestCase):
+    """
+    Defines :func:`manager.parsers.read_manifest` definition units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initializes the tests.
+        """
+
+        self.__directory = unicode(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """
+        Cleans up the tests.
+        """
+
+        shutil.rmtree(self.__directory)
+
+    def __write_manifest(self, content):
+        """
+        Writes given content into a Component file.
+
+        :param content: Content.
+        :type content: unicode
+        :return: Component file.
+        :rtype: unicode
+        """
+
+        file = os.path.join(self.__directory, "manifest.rc")
+        with codecs.open(file, "w", encoding="utf-8") as file_object:
+            file_object.write(content)
+        return file
+
+    def test_read_manifest(self):
+        """
+        Tests :func:`manager.parsers.read_manifest` definition.
+        """
+
+        manifest = read_manifest(COMPONENT_FILE)
+        self.assertDictEqual(manifest["Component"], {"Name": "core.tests_component_a",
+                                                     "Title": "Tests Component A",
+                                                     "Module": "tests_component_a",
+                                                     "Object": "TestsComponentA",
+                                                     "Version": "1.0"})
+        self.assertEqual(manifest["Informations"]["Author"], "Thomas Mansencal")
+
+        manifest = read_manifest(COMPONENT_FILE, sections=("Component",))
+        self.assertDictEqual(manifest["Informations"], {})
+
+        self.assertDictEqual(read_manifest(os.path.join(self.__directory, "missing.rc")), {})
+
+    def test_read_manifest_rules(self):
+        """
+        Tests :func:`manager.parsers.read_manifest` definition parsing rules.
+        """
+
+        manifest = read_manifest(self.__write_manifest("# Comment.\n"
+                                                       "\n"
+                                                       "[Component]\n"
+                                                       "Name = \"core.component\"\n"
+                                                       "Module: component\n"
+                                                       "Require =\n"
+                                                       "  [ Component ]  \n"
+                                                       "Object = `Component`\n"
+                                                       "[Others]\n"
+                                                       "Key = Value\n"))
+        self.assertDictEqual(manifest, {"Component": {"Object": "Component"}, "Others": {}})
+
+        manifest = read_manifest(self.__write_manifest("[Component]\n"
+                                                       "Name = core.component\n"
+                                                       "Require =\n"))
+        self.assertDictEqual(manifest, {"Component": {"Name": "core.component", "Require": None}})
+
+        self.assertDictEqual(read_manifest(self.__write_manifest("; Comment.\n[Component]\n")), {})
+
+    def test_read_manifest_errors(self):
+        """
+        Tests :func:`manager.parsers.read_manifest` definition parsing errors.
+        """
+
+        for content in ("[Component]\nName = core.component\nInvalid\n",
+                        "[Others]\nInvalid\n",
+                        "=Invalid\n"):
+            self.assertRaises(foundations.exceptions.FileStructureParsingError,
+                              read_manifest,
+                              self.__write_manifest(content))
+
+
+if __name__ == "__main__":
+    import manager.tests.utilities
+
+    unittest.main()
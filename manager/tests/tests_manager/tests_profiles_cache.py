@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_profiles_cache.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`manager.profiles_cache` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import sys
+import tempfile
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+from manager.profiles_cache import ProfilesCache
+from manager.profiles_cache import get_file_signature
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["RESOURCES_DIRECTORY",
+           "COMPONENT_FILE",
+           "PROFILE_DATA",
+           "TestGetFileSignature",
+           "TestProfilesCache"]
+
+RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), "resources")
+COMPONENT_FILE = os.path.join(RESOURCES_DIRECTORY,
+                              "components/core/tests_component_a/tests_component_a.rc")
+PROFILE_DATA = {"name": "core.tests_component_a",
+                "package": "tests_component_a",
+                "require": []}
+
+
+class TestGetFileSignature(unittest.TestCase):
+    """
+    Defines :func:`manager.profiles_cache.get_file_signature` definition units tests methods.
+    """
+
+    def test_get_file_signature(self):
+        """
+        Tests :func:`manager.profiles_cache.get_file_signature` definition.
+        """
+
+        signature = get_file_signature(COMPONENT_FILE)
+        self.assertIsInstance(signature, list)
+        self.assertEqual(len(signature), 2)
+        self.assertEqual(signature[1], os.path.getsize(COMPONENT_FILE))
+        signature = get_file_signature(COMPONENT_FILE, hash_content=True)
+        self.assertEqual(len(signature), 3)
+        self.assertEqual(signature, get_file_signature(COMPONENT_FILE, hash_content=True))
+
+
+class TestProfilesCache(unittest.TestCase):
+    """
+    Defines :class:`manager.profiles_cache.ProfilesCache` class units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initializes the tests fixture.
+        """
+
+        self.__directory = tempfile.mkdtemp()
+        self.__file = os.path.join(self.__directory, "profiles_cache.json")
+        self.__component_file = os.path.join(self.__directory, "tests_component_a.rc")
+        shutil.copyfile(COMPONENT_FILE, self.__component_file)
+
+    def tearDown(self):
+        """
+        Cleans the tests fixture.
+        """
+
+        shutil.rmtree(self.__directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ("file",
+                               "hash_content",
+                               "content")
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(ProfilesCache))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("__contains__",
+                            "__len__",
+                            "load",
+                            "save",
+                            "get_content",
+                            "set_content",
+                            "remove_content",
+                            "prune_content",
+                            "flush_content")
+
+        for method in required_methods:
+            self.assertIn(method, dir(ProfilesCache))
+
+    def test_get_content(self):
+        """
+        Tests :meth:`manager.profiles_cache.ProfilesCache.get_content` method.
+        """
+
+        profiles_cache = ProfilesCache(self.__file)
+        self.assertIsNone(profiles_cache.get_content(self.__component_file))
+        profiles_cache.set_content(self.__component_file, PROFILE_DATA)
+        self.assertDictEqual(profiles_cache.get_content(self.__component_file), PROFILE_DATA)
+
+        with open(self.__component_file, "a") as file:
+            file.write("\n")
+        self.assertIsNone(profiles_cache.get_content(self.__component_file))
+
+    def test_save(self):
+        """
+        Tests :meth:`manager.profiles_cache.ProfilesCache.save` method.
+        """
+
+        profiles_cache = ProfilesCache(self.__file)
+        profiles_cache.set_content(self.__component_file, PROFILE_DATA)
+        self.assertTrue(profiles_cache.save())
+        self.assertTrue(os.path.isfile(self.__file))
+
+        profiles_cache = ProfilesCache(self.__file)
+        self.assertIn(self.__component_file, profiles_cache)
+        self.assertDictEqual(profiles_cache.get_content(self.__component_file), PROFILE_DATA)
+
+        profiles_cache = ProfilesCache(self.__file, hash_content=True)
+        self.assertEqual(len(profiles_cache), 0)
+
+    def test_load(self):
+        """
+        Tests :meth:`manager.profiles_cache.ProfilesCache.load` method.
+        """
+
+        with open(self.__file, "w") as file:
+            file.write("{ Invalid Content")
+
+        profiles_cache = ProfilesCache(self.__file)
+        self.assertFalse(profiles_cache.load())
+        self.assertEqual(len(profiles_cache), 0)
+
+    def test_remove_content(self):
+        """
+        Tests :meth:`manager.profiles_cache.ProfilesCache.remove_content` method.
+        """
+
+        profiles_cache = ProfilesCache(self.__file)
+        profiles_cache.set_content(self.__component_file, PROFILE_DATA)
+        self.assertTrue(profiles_cache.remove_content(self.__component_file))
+        self.assertNotIn(self.__component_file, profiles_cache)
+
+    def test_prune_content(self):
+        """
+        Tests :meth:`manager.profiles_cache.ProfilesCache.prune_content` method.
+        """
+
+        component_file = os.path.join(self.__directory, "components", "tests_component_a.rc")
+        os.makedirs(os.path.dirname(component_file))
+        shutil.copyfile(COMPONENT_FILE, component_file)
+
+        profiles_cache = ProfilesCache(self.__file)
+        profiles_cache.set_content(self.__component_file, PROFILE_DATA)
+        profiles_cache.set_content(component_file, PROFILE_DATA)
+        self.assertTrue(profiles_cache.prune_content([], [os.path.dirname(component_file)]))
+        self.assertIn(self.__component_file, profiles_cache)
+        self.assertNotIn(component_file, profiles_cache)
+
+        self.assertTrue(profiles_cache.prune_content([self.__component_file.replace("/", "\\")]))
+        self.assertIn(self.__component_file, profiles_cache)
+        self.assertTrue(profiles_cache.prune_content([]))
+        self.assertEqual(len(profiles_cache), 0)
+
+        windows_file = "C:\\Components\\tests_component_a\\tests_component_a.rc"
+        profiles_cache.set_content(windows_file, PROFILE_DATA, [0, 0])
+        self.assertIn("C:/Components/tests_component_a/tests_component_a.rc", profiles_cache)
+        self.assertTrue(profiles_cache.prune_content([], ["C:\\Components"]))
+        self.assertNotIn(windows_file, profiles_cache)
+
+    def test_flush_content(self):
+        """
+        Tests :meth:`manager.profiles_cache.ProfilesCache.flush_content` method.
+        """
+
+        profiles_cache = ProfilesCache(self.__file)
+        profiles_cache.set_content(self.__component_file, PROFILE_DATA)
+        self.assertTrue(profiles_cache.flush_content())
+        self.assertEqual(len(profiles_cache), 0)
+
+
+if __name__ == "__main__":
+    import manager.tests.utilities
+
+    unittest.main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_proxies.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`manager.proxies` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+import sys
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+import manager.exceptions
+from manager.component import Component
+from manager.components_manager import Manager
+from manager.proxies import InterfaceProxy
+from manager.proxies import is_proxy
+from manager.proxies import is_resolved
+from manager.proxies import resolve_interface
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["RESOURCES_DIRECTORY",
+           "COMPONENTS_DIRECTORY",
+           "TestInterfaceProxy",
+           "TestIsProxy",
+           "TestIsResolved",
+           "TestResolveInterface"]
+
+RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), "resources")
+COMPONENTS_DIRECTORY = os.path.join(RESOURCES_DIRECTORY, "components")
+
+
+def _get_manager():
+    """
+    Returns a :class:`manager.components_manager.Manager` class instance with lazily instantiated Components.
+
+    :return: Manager.
+    :rtype: Manager
+    """
+
+    manager = Manager((os.path.join(COMPONENTS_DIRECTORY, "core"),))
+    manager.register_components()
+    manager.instantiate_components(lazy=True)
+    return manager
+
+
+class TestInterfaceProxy(unittest.TestCase):
+    """
+    Defines :class:`manager.proxies.InterfaceProxy` class units tests methods.
+    """
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("__getattr__",
+                            "__setattr__",
+                            "__delattr__",
+                            "__call__",
+                            "__getitem__",
+                            "__iter__",
+                            "__len__",
+                            "__contains__",
+                            "__nonzero__",
+                            "__repr__")
+
+        for method in required_methods:
+            self.assertIn(method, dir(InterfaceProxy))
+
+    def test__getattr__(self):
+        """
+        Tests :meth:`manager.proxies.InterfaceProxy.__getattr__` method.
+        """
+
+        manager = _get_manager()
+        proxy = manager.get_interface("core.tests_component_b")
+        self.assertIsNone(manager.get_profile("core.tests_component_a").module)
+        self.assertEqual(proxy.name, "core.tests_component_b")
+        self.assertIsNotNone(manager.get_profile("core.tests_component_a").module)
+        self.assertIs(manager.get_interface("core.tests_component_b"), resolve_interface(proxy))
+
+    def test__setattr__(self):
+        """
+        Tests :meth:`manager.proxies.InterfaceProxy.__setattr__` method.
+        """
+
+        proxy = _get_manager().get_interface("core.tests_component_a")
+        proxy.activated = True
+        self.assertTrue(resolve_interface(proxy).activated)
+
+    def test_special_methods(self):
+        """
+        Tests :class:`manager.proxies.InterfaceProxy` class special methods forwarding.
+        """
+
+        proxy = _get_manager().get_interface("core.tests_component_a")
+        self.assertTrue(proxy)
+        self.assertTrue(is_resolved(proxy))
+
+        proxy = InterfaceProxy(None, "core.tests_component_a")
+        object.__setattr__(proxy, "_InterfaceProxy__interface", ["core.tests_component_a"])
+        self.assertEqual(len(proxy), 1)
+        self.assertListEqual(list(proxy), ["core.tests_component_a"])
+        self.assertIn("core.tests_component_a", proxy)
+        self.assertEqual(proxy[0], "core.tests_component_a")
+
+        object.__setattr__(proxy, "_InterfaceProxy__interface", lambda *args, **kwargs: (args, kwargs))
+        self.assertEqual(proxy(1, value=2), ((1,), {"value": 2}))
+
+    def test__repr__(self):
+        """
+        Tests :meth:`manager.proxies.InterfaceProxy.__repr__` method.
+        """
+
+        proxy = _get_manager().get_interface("core.tests_component_a")
+        self.assertIn("core.tests_component_a", repr(proxy))
+        self.assertFalse(is_resolved(proxy))
+
+    def test__class__(self):
+        """
+        Tests :attr:`manager.proxies.InterfaceProxy.__class__` attribute.
+        """
+
+        proxy = _get_manager().get_interface("core.tests_component_a")
+        self.assertIsInstance(proxy, Component)
+        self.assertTrue(is_resolved(proxy))
+
+    def test_callback(self):
+        """
+        Tests :class:`manager.proxies.InterfaceProxy` class callback.
+        """
+
+        manager = Manager((os.path.join(COMPONENTS_DIRECTORY, "core"),))
+        manager.register_components()
+        profiles = []
+        proxy = InterfaceProxy(manager, "core.tests_component_b", profiles.append)
+        self.assertTrue(proxy.name)
+        self.assertListEqual([profile.name for profile in profiles],
+                             ["core.tests_component_a", "core.tests_component_b"])
+
+    def test_resolution_errors(self):
+        """
+        Tests :class:`manager.proxies.InterfaceProxy` class resolution errors.
+        """
+
+        proxy = InterfaceProxy(_get_manager(), "core.tests_component_z")
+        self.assertRaises(manager.exceptions.ComponentInstantiationError, getattr, proxy, "name")
+
+
+class TestIsProxy(unittest.TestCase):
+    """
+    Defines :func:`manager.proxies.is_proxy` definition units tests methods.
+    """
+
+    def test_is_proxy(self):
+        """
+        Tests :func:`manager.proxies.is_proxy` definition.
+        """
+
+        manager = _get_manager()
+        self.assertTrue(is_proxy(manager.get_interface("core.tests_component_a")))
+        manager.instantiate_component("core.tests_component_a")
+        self.assertFalse(is_proxy(manager.get_interface("core.tests_component_a")))
+
+
+class TestIsResolved(unittest.TestCase):
+    """
+    Defines :func:`manager.proxies.is_resolved` definition units tests methods.
+    """
+
+    def test_is_resolved(self):
+        """
+        Tests :func:`manager.proxies.is_resolved` definition.
+        """
+
+        proxy = _get_manager().get_interface("core.tests_component_a")
+        self.assertFalse(is_resolved(proxy))
+        resolve_interface(proxy)
+        self.assertTrue(is_resolved(proxy))
+        self.assertTrue(is_resolved(Component()))
+
+
+class TestResolveInterface(unittest.TestCase):
+    """
+    Defines :func:`manager.proxies.resolve_interface` definition units tests methods.
+    """
+
+    def test_resolve_interface(self):
+        """
+        Tests :func:`manager.proxies.resolve_interface` definition.
+        """
+
+        proxy = _get_manager().get_interface("core.tests_component_a")
+        interface = resolve_interface(proxy)
+        self.assertEqual(type(interface).__name__, "TestsComponentA")
+        self.assertIs(resolve_interface(interface), interface)
+
+
+if __name__ == "__main__":
+    import manager.tests.utilities
+
+    unittest.main()
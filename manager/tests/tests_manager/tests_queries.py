@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_queries.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`manager.queries` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import re
+import sys
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+from manager.queries import QUERY_EXACT
+from manager.queries import QUERY_PATTERN
+from manager.queries import QUERY_PREFIX
+from manager.queries import compile_pattern
+from manager.queries import parse_glob
+from manager.queries import parse_pattern
+from manager.queries import translate_glob
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["TestCompilePattern", "TestParsePattern", "TestParseGlob", "TestTranslateGlob"]
+
+
+class TestCompilePattern(unittest.TestCase):
+    """
+    Defines :func:`manager.queries.compile_pattern` definition units tests methods.
+    """
+
+    def test_compile_pattern(self):
+        """
+        Tests :func:`manager.queries.compile_pattern` definition.
+        """
+
+        pattern = compile_pattern(r"\w+_a$")
+        self.assertTrue(pattern.search("core.tests_component_a"))
+        self.assertIs(compile_pattern(r"\w+_a$"), pattern)
+
+
+class TestParsePattern(unittest.TestCase):
+    """
+    Defines :func:`manager.queries.parse_pattern` definition units tests methods.
+    """
+
+    def test_parse_pattern(self):
+        """
+        Tests :func:`manager.queries.parse_pattern` definition.
+        """
+
+        self.assertTupleEqual(parse_pattern(r"^addons\."), ("addons.", QUERY_PREFIX))
+        self.assertTupleEqual(parse_pattern(r"^addons\..*"), ("addons.", QUERY_PREFIX))
+        self.assertTupleEqual(parse_pattern(r"^core\.tests_component_a$"), ("core.tests_component_a", QUERY_EXACT))
+        self.assertTupleEqual(parse_pattern("^{0}$".format(re.escape("core.tests_component_a"))),
+                              ("core.tests_component_a", QUERY_EXACT))
+        self.assertTupleEqual(parse_pattern(r"^core\.\w+_a$"), ("core.", QUERY_PATTERN))
+        self.assertTupleEqual(parse_pattern(r"^core.tests"), ("core", QUERY_PATTERN))
+        self.assertTupleEqual(parse_pattern(r"^cores?"), ("core", QUERY_PATTERN))
+        self.assertTupleEqual(parse_pattern(r"^core{2}"), ("cor", QUERY_PATTERN))
+        self.assertTupleEqual(parse_pattern(r"\w+A$"), ("", QUERY_PATTERN))
+        self.assertTupleEqual(parse_pattern(r"^core|addons"), ("", QUERY_PATTERN))
+        self.assertTupleEqual(parse_pattern(r"^core\|addons"), ("core|addons", QUERY_PREFIX))
+        self.assertTupleEqual(parse_pattern(r"^core(?i)"), ("", QUERY_PATTERN))
+
+
+class TestParseGlob(unittest.TestCase):
+    """
+    Defines :func:`manager.queries.parse_glob` definition units tests methods.
+    """
+
+    def test_parse_glob(self):
+        """
+        Tests :func:`manager.queries.parse_glob` definition.
+        """
+
+        self.assertTupleEqual(parse_glob("addons.*"), ("addons.", QUERY_PREFIX))
+        self.assertTupleEqual(parse_glob("core.tests_component_?"), ("core.tests_component_", QUERY_PATTERN))
+        self.assertTupleEqual(parse_glob("core.*_[ab]"), ("core.", QUERY_PATTERN))
+        self.assertTupleEqual(parse_glob("core.tests_component_a"), ("core.tests_component_a", QUERY_EXACT))
+        self.assertTupleEqual(parse_glob("*"), ("", QUERY_PREFIX))
+
+
+class TestTranslateGlob(unittest.TestCase):
+    """
+    Defines :func:`manager.queries.translate_glob` definition units tests methods.
+    """
+
+    def test_translate_glob(self):
+        """
+        Tests :func:`manager.queries.translate_glob` definition.
+        """
+
+        self.assertTrue(translate_glob("core.*_[ab]").match("core.tests_component_b"))
+        self.assertFalse(translate_glob("core.*_[ab]").match("core.tests_component_c"))
+        self.assertIs(translate_glob("core.*"), translate_glob("core.*"))
+
+
+if __name__ == "__main__":
+    import manager.tests.utilities
+
+    unittest.main()
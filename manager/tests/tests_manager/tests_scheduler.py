@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_scheduler.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`manager.scheduler` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import sys
+import threading
+import time
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+import manager.exceptions
+from manager.scheduler import DependenciesScheduler
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["DEPENDENCIES", "TestDependenciesScheduler"]
+
+DEPENDENCIES = {"core.database": [],
+                "core.settings": [],
+                "core.engine": ["core.database", "core.settings"],
+                "addons.projects": ["core.engine"],
+                "addons.editor": ["core.engine", "addons.projects"],
+                "addons.viewer": ["core.missing"]}
+
+
+class TestDependenciesScheduler(unittest.TestCase):
+    """
+    Defines :class:`manager.scheduler.DependenciesScheduler` class units tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ("dependencies",
+                               "workers")
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(DependenciesScheduler))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("execute",)
+
+        for method in required_methods:
+            self.assertIn(method, dir(DependenciesScheduler))
+
+    def test_execute(self):
+        """
+        Tests :meth:`manager.scheduler.DependenciesScheduler.execute` method.
+        """
+
+        done, lock = [], threading.Lock()
+
+        def task(component):
+            with lock:
+                for dependency in DEPENDENCIES[component]:
+                    self.assertTrue(dependency in done or dependency not in DEPENDENCIES)
+            time.sleep(0.01)
+            return component.upper()
+
+        def finalizer(component, result):
+            self.assertIs(threading.current_thread(), main_thread)
+            with lock:
+                done.append(component)
+            return result.lower()
+
+        main_thread = threading.current_thread()
+        initialized = []
+        results = DependenciesScheduler(DEPENDENCIES, 4).execute(task, initialized.append, finalizer)
+        self.assertDictEqual(results, dict((component, component) for component in DEPENDENCIES))
+        self.assertListEqual(sorted(initialized), sorted(DEPENDENCIES))
+        self.assertLess(done.index("core.engine"), done.index("addons.projects"))
+        self.assertLess(done.index("addons.projects"), done.index("addons.editor"))
+
+    def test_execute_concurrency(self):
+        """
+        Tests :meth:`manager.scheduler.DependenciesScheduler.execute` method concurrency.
+        """
+
+        dependencies = dict(("component_{0}".format(i), []) for i in range(8))
+        barrier, lock = [0], threading.Lock()
+
+        def task(component):
+            with lock:
+                barrier[0] += 1
+            while barrier[0] < len(dependencies):
+                time.sleep(0.001)
+            return True
+
+        self.assertTrue(all(DependenciesScheduler(dependencies, len(dependencies)).execute(task).values()))
+
+    def test_execute_errors(self):
+        """
+        Tests :meth:`manager.scheduler.DependenciesScheduler.execute` method errors.
+        """
+
+        def task(component):
+            if component == "core.engine":
+                raise ValueError(component)
+            return component
+
+        executed = []
+        scheduler = DependenciesScheduler(DEPENDENCIES, 2)
+        self.assertRaises(ValueError, scheduler.execute, task, executed.append)
+        self.assertNotIn("addons.projects", executed)
+
+        scheduler = DependenciesScheduler({"core.engine": ["core.database"], "core.database": ["core.engine"]})
+        self.assertRaises(manager.exceptions.ComponentDependenciesError, scheduler.execute, task)
+
+
+if __name__ == "__main__":
+    import manager.tests.utilities
+
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_timings.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`manager.timings` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import sys
+import time
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+from manager.timings import format_report
+from manager.timings import get_cpu_time
+from manager.timings import get_critical_path
+from manager.timings import get_total_time
+from manager.timings import timer
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["TIMINGS",
+           "TestGetCpuTime",
+           "TestTimer",
+           "TestGetTotalTime",
+           "TestGetCriticalPath",
+           "TestFormatReport"]
+
+TIMINGS = {"core.database": {"import": {"wall": 0.5, "cpu": 0.25}},
+           "core.engine": {"import": {"wall": 0.25, "cpu": 0.25}, "activate": {"wall": 1.0, "cpu": 0.5}},
+           "addons.editor": {"import": {"wall": 0.5, "cpu": 0.5}},
+           "addons.viewer": {"import": {"wall": 1.0, "cpu": 0.75}}}
+
+
+class TestGetCpuTime(unittest.TestCase):
+    """
+    Defines :func:`manager.timings.get_cpu_time` definition units tests methods.
+    """
+
+    def test_get_cpu_time(self):
+        """
+        Tests :func:`manager.timings.get_cpu_time` definition.
+        """
+
+        self.assertIsInstance(get_cpu_time(), float)
+
+
+class TestTimer(unittest.TestCase):
+    """
+    Defines :func:`manager.timings.timer` definition units tests methods.
+    """
+
+    def test_timer(self):
+        """
+        Tests :func:`manager.timings.timer` definition.
+        """
+
+        timings = {}
+        with timer(timings, "import"):
+            time.sleep(0.01)
+        self.assertGreaterEqual(timings["import"]["wall"], 0.01)
+        self.assertIn("cpu", timings["import"])
+
+        try:
+            with timer(timings, "construct"):
+                raise ValueError()
+        except ValueError:
+            pass
+        self.assertIn("construct", timings)
+
+
+class TestGetTotalTime(unittest.TestCase):
+    """
+    Defines :func:`manager.timings.get_total_time` definition units tests methods.
+    """
+
+    def test_get_total_time(self):
+        """
+        Tests :func:`manager.timings.get_total_time` definition.
+        """
+
+        self.assertEqual(get_total_time(TIMINGS["core.engine"]), 1.25)
+        self.assertEqual(get_total_time(TIMINGS["core.engine"], "cpu"), 0.75)
+        self.assertEqual(get_total_time({}), 0)
+
+
+class TestGetCriticalPath(unittest.TestCase):
+    """
+    Defines :func:`manager.timings.get_critical_path` definition units tests methods.
+    """
+
+    def test_get_critical_path(self):
+        """
+        Tests :func:`manager.timings.get_critical_path` definition.
+        """
+
+        order = ["core.database", "core.engine", "addons.editor", "addons.viewer"]
+        requires = {"core.engine": ["core.database"],
+                    "addons.editor": ["core.engine"],
+                    "addons.viewer": ["core.database"]}
+        weights = dict((component, get_total_time(timings)) for component, timings in TIMINGS.iteritems())
+        self.assertTupleEqual(get_critical_path(order, requires, weights),
+                              (["core.database", "core.engine", "addons.editor"], 2.25))
+        self.assertTupleEqual(get_critical_path([], {}, {}), ([], 0))
+
+
+class TestFormatReport(unittest.TestCase):
+    """
+    Defines :func:`manager.timings.format_report` definition units tests methods.
+    """
+
+    def test_format_report(self):
+        """
+        Tests :func:`manager.timings.format_report` definition.
+        """
+
+        report = format_report(TIMINGS, (["core.database", "core.engine"], 1.75)).splitlines()
+        self.assertListEqual(report[0].split(), ["Component", "Total", "import", "activate"])
+        self.assertListEqual([line.split()[0] for line in report[1:5]],
+                             ["core.engine", "addons.viewer", "addons.editor", "core.database"])
+        self.assertListEqual(report[1].split()[1:], ["1250.00", "250.00", "1000.00"])
+        self.assertEqual(report[3].split()[-1], "-")
+        self.assertEqual(report[6], "Critical path: 1750.00ms")
+
+
+if __name__ == "__main__":
+    import manager.tests.utilities
+
+    unittest.main()
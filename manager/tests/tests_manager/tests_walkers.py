@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_walkers.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`manager.walkers` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+import sys
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+from manager.walkers import components_walker
+from manager.walkers import get_ignored_directories_matcher
+from manager.walkers import list_directory
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["RESOURCES_DIRECTORY",
+           "COMPONENTS_DIRECTORY",
+           "COMPONENTS_FILES",
+           "TestListDirectory",
+           "TestGetIgnoredDirectoriesMatcher",
+           "TestComponentsWalker"]
+
+RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), "resources")
+COMPONENTS_DIRECTORY = os.path.join(RESOURCES_DIRECTORY, "components")
+COMPONENTS_FILES = ("addons/tests_component_C/tests_component_c.rc",
+                    "core/tests_component_a/tests_component_a.rc",
+                    "core/tests_component_b/tests_component_b.rc",
+                    "extras/addons/tests_component_d/tests_component_d.rc")
+
+
+class TestListDirectory(unittest.TestCase):
+    """
+    Defines :func:`manager.walkers.list_directory` definition units tests methods.
+    """
+
+    def test_list_directory(self):
+        """
+        Tests :func:`manager.walkers.list_directory` definition.
+        """
+
+        entries = list_directory(os.path.join(COMPONENTS_DIRECTORY, "core"))
+        self.assertListEqual(entries, sorted(entries))
+        for entry in (("__init__.py", False), ("tests_component_a", True), ("tests_component_b", True)):
+            self.assertIn(entry, entries)
+
+
+class TestGetIgnoredDirectoriesMatcher(unittest.TestCase):
+    """
+    Defines :func:`manager.walkers.get_ignored_directories_matcher` definition units tests methods.
+    """
+
+    def test_get_ignored_directories_matcher(self):
+        """
+        Tests :func:`manager.walkers.get_ignored_directories_matcher` definition.
+        """
+
+        is_ignored = get_ignored_directories_matcher(("extras", "tests_component_[ab]", ".*"))
+        self.assertTrue(is_ignored("extras"))
+        self.assertTrue(is_ignored("tests_component_a"))
+        self.assertTrue(is_ignored(".git"))
+        self.assertFalse(is_ignored("extras_"))
+        self.assertFalse(is_ignored("tests_component_c"))
+
+        self.assertFalse(get_ignored_directories_matcher(None)("extras"))
+
+
+class TestComponentsWalker(unittest.TestCase):
+    """
+    Defines :func:`manager.walkers.components_walker` definition units tests methods.
+    """
+
+    def test_components_walker(self):
+        """
+        Tests :func:`manager.walkers.components_walker` definition.
+        """
+
+        files = [os.path.relpath(file, COMPONENTS_DIRECTORY) for file in components_walker(COMPONENTS_DIRECTORY)]
+        self.assertListEqual(files, list(COMPONENTS_FILES))
+
+        self.assertListEqual(list(components_walker(COMPONENTS_DIRECTORY, extension="ui")), [])
+
+    def test_components_walker_ignored_directories(self):
+        """
+        Tests :func:`manager.walkers.components_walker` definition with ignored directories.
+        """
+
+        files = [os.path.relpath(file, COMPONENTS_DIRECTORY)
+                 for file in components_walker(COMPONENTS_DIRECTORY, ignored_directories=("extras",))]
+        self.assertListEqual(files, list(COMPONENTS_FILES[:3]))
+
+        files = [os.path.relpath(file, COMPONENTS_DIRECTORY)
+                 for file in components_walker(COMPONENTS_DIRECTORY, ignored_directories=("tests_component_[ab]",))]
+        self.assertListEqual(files, [COMPONENTS_FILES[0], COMPONENTS_FILES[3]])
+
+    def test_components_walker_maximum_depth(self):
+        """
+        Tests :func:`manager.walkers.components_walker` definition with maximum depth.
+        """
+
+        self.assertListEqual(list(components_walker(COMPONENTS_DIRECTORY, maximum_depth=1)), [])
+
+        files = [os.path.relpath(file, COMPONENTS_DIRECTORY)
+                 for file in components_walker(COMPONENTS_DIRECTORY, maximum_depth=2)]
+        self.assertListEqual(files, list(COMPONENTS_FILES[:3]))
+
+    def test_components_walker_listings(self):
+        """
+        Tests :func:`manager.walkers.components_walker` definition with directories listings.
+        """
+
+        listings = {}
+        files = list(components_walker(os.path.join(COMPONENTS_DIRECTORY, "core"), listings=listings))
+        self.assertListEqual(sorted(listings), sorted(os.path.normpath(os.path.dirname(file)) for file in files))
+        listing = listings[os.path.normpath(os.path.join(COMPONENTS_DIRECTORY, "core", "tests_component_a"))]
+        self.assertIs(listing.get("tests_component_a.py"), False)
+        self.assertIs(listing.get("tests_component_a.rc"), False)
+
+    def test_components_walker_directories(self):
+        """
+        Tests :func:`manager.walkers.components_walker` definition with walked directories.
+        """
+
+        directories = []
+        list(components_walker(os.path.join(COMPONENTS_DIRECTORY, "core"), walked_directories=directories))
+        self.assertEqual(directories[0], os.path.normpath(os.path.join(COMPONENTS_DIRECTORY, "core")))
+        self.assertIn(os.path.normpath(os.path.join(COMPONENTS_DIRECTORY, "core", "tests_component_b")), directories)
+
+
+if __name__ == "__main__":
+    import manager.tests.utilities
+
+    unittest.main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_watcher.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`manager.watcher` module.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import sys
+import tempfile
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+import manager.watcher
+from manager.components_manager import Manager
+from manager.watcher import ComponentsWatcher
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["RESOURCES_DIRECTORY", "COMPONENTS_DIRECTORY", "TestComponentsWatcher"]
+
+RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), "resources")
+COMPONENTS_DIRECTORY = os.path.join(RESOURCES_DIRECTORY, "components")
+
+
+class TestComponentsWatcher(unittest.TestCase):
+    """
+    Defines :class:`manager.watcher.ComponentsWatcher` class units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initializes the tests.
+        """
+
+        self.__directory = unicode(tempfile.mkdtemp())
+        shutil.copytree(os.path.join(COMPONENTS_DIRECTORY, "core"), os.path.join(self.__directory, "core"))
+        self.__manager = Manager([self.__directory])
+        self.__manager.register_components()
+
+    def tearDown(self):
+        """
+        Cleans up the tests.
+        """
+
+        shutil.rmtree(self.__directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ("manager",
+                               "debounce",
+                               "interval",
+                               "running")
+
+        watcher = ComponentsWatcher(self.__manager)
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(watcher))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("process_events",
+                            "start",
+                            "stop")
+
+        for method in required_methods:
+            self.assertIn(method, dir(ComponentsWatcher))
+
+    def test_start(self):
+        """
+        Tests :meth:`manager.watcher.ComponentsWatcher.start` and :meth:`manager.watcher.ComponentsWatcher.stop`
+        methods.
+        """
+
+        watcher = ComponentsWatcher(self.__manager, interval=0.1, use_inotify=False)
+        self.assertTrue(watcher.start())
+        self.assertTrue(watcher.running)
+        self.assertTrue(watcher.stop())
+        self.assertFalse(watcher.running)
+
+    def test_process_events(self):
+        """
+        Tests :meth:`manager.watcher.ComponentsWatcher.process_events` method.
+        """
+
+        changes = []
+        self.__manager.instantiate_components()
+        watcher = ComponentsWatcher(self.__manager, callback=changes.append, threaded=False, use_inotify=False)
+        watcher.start()
+
+        self.assertDictEqual(watcher.process_events(),
+                             {"added": [], "removed": [], "modified": [], "reloaded": []})
+        self.assertListEqual(changes, [])
+
+        shutil.copytree(os.path.join(COMPONENTS_DIRECTORY, "addons", "tests_component_C"),
+                        os.path.join(self.__directory, "addons", "tests_component_C"))
+        interface = self.__manager.get_interface("core.tests_component_b")
+        with open(os.path.join(self.__directory, "core", "tests_component_a", "tests_component_a.rc"), "a") as file:
+            file.write("\n; Modified.\n")
+
+        result = watcher.process_events()
+        self.assertListEqual(result.added, ["addons.tests_component_c"])
+        self.assertListEqual(result.modified, ["core.tests_component_a"])
+        self.assertListEqual(result.reloaded, ["core.tests_component_a", "core.tests_component_b"])
+        self.assertIsNot(self.__manager.get_interface("core.tests_component_b"), interface)
+        self.assertListEqual(changes, [result])
+
+        shutil.rmtree(os.path.join(self.__directory, "addons"))
+        self.assertListEqual(watcher.process_events().removed, ["addons.tests_component_c"])
+        watcher.stop()
+
+    def test_start_non_threaded(self):
+        """
+        Tests :meth:`manager.watcher.ComponentsWatcher.start` method with a non threaded polling watcher.
+        """
+
+        self.__manager.instantiate_components()
+        watcher = ComponentsWatcher(self.__manager, threaded=False, use_inotify=False)
+        self.assertTrue(watcher.start())
+        self.assertTrue(watcher.running)
+
+        path = os.path.join(self.__directory, "core", "tests_component_a", "tests_component_a.py")
+        os.utime(path, (os.path.getatime(path), os.path.getmtime(path) + 10))
+        self.assertTrue(watcher.start())
+        self.assertListEqual(watcher.process_events().reloaded, ["core.tests_component_a", "core.tests_component_b"])
+
+        self.assertTrue(watcher.stop())
+        self.assertFalse(watcher.running)
+
+    def test_process_events_walking(self):
+        """
+        Tests :meth:`manager.watcher.ComponentsWatcher.process_events` method only walking the paths when the
+        walked directories changed.
+        """
+
+        watcher = ComponentsWatcher(self.__manager, threaded=False, use_inotify=False)
+        watcher.start()
+
+        walked_directories = self.__manager.walked_directories
+        self.assertListEqual(watcher.process_events().added, [])
+        self.assertIs(self.__manager.walked_directories, walked_directories)
+
+        shutil.copytree(os.path.join(COMPONENTS_DIRECTORY, "addons", "tests_component_C"),
+                        os.path.join(self.__directory, "tests_component_C"))
+        os.utime(self.__directory, (os.path.getatime(self.__directory), os.path.getmtime(self.__directory) + 10))
+        self.assertListEqual(watcher.process_events().added, ["addons.tests_component_c"])
+        self.assertIsNot(self.__manager.walked_directories, walked_directories)
+        watcher.stop()
+
+    def test_process_events_submodules(self):
+        """
+        Tests :meth:`manager.watcher.ComponentsWatcher.process_events` method with Components submodules changes.
+        """
+
+        path = os.path.join(self.__directory, "core", "tests_component_a", "utilities", "__init__.py")
+        os.makedirs(os.path.dirname(path))
+        with open(path, "w") as file:
+            file.write("VALUE = 1\n")
+
+        self.__manager.instantiate_components()
+        watcher = ComponentsWatcher(self.__manager, threaded=False, use_inotify=False)
+        watcher.start()
+
+        self.assertListEqual(watcher.process_events().reloaded, [])
+
+        with open(path, "w") as file:
+            file.write("VALUE = 2\n")
+        os.utime(path, (os.path.getatime(path), os.path.getmtime(path) + 10))
+
+        self.assertListEqual(watcher.process_events().reloaded, ["core.tests_component_a", "core.tests_component_b"])
+        self.assertListEqual(watcher.process_events().reloaded, [])
+        watcher.stop()
+
+    @unittest.skipIf(manager.watcher.pyinotify is None, "'pyinotify' is not available!")
+    def test_process_events_inotify(self):
+        """
+        Tests :meth:`manager.watcher.ComponentsWatcher.process_events` method with inotify.
+        """
+
+        watcher = ComponentsWatcher(self.__manager, debounce=0.1, threaded=False)
+        watcher.start()
+        try:
+            shutil.copytree(os.path.join(COMPONENTS_DIRECTORY, "addons", "tests_component_C"),
+                            os.path.join(self.__directory, "addons", "tests_component_C"))
+            added = []
+            for i in range(10):
+                added.extend(watcher.process_events(timeout=1).added)
+                if added:
+                    break
+            self.assertListEqual(added, ["addons.tests_component_c"])
+        finally:
+            watcher.stop()
+
+    @unittest.skipIf(manager.watcher.pyinotify is None, "'pyinotify' is not available!")
+    def test_process_events_inotify_ignored_directories(self):
+        """
+        Tests :meth:`manager.watcher.ComponentsWatcher.process_events` method with inotify and ignored directories
+        glob patterns.
+        """
+
+        self.__manager.ignored_directories = ("extra*",)
+        watcher = ComponentsWatcher(self.__manager, debounce=0.1, threaded=False)
+        watcher.start()
+        try:
+            shutil.copytree(os.path.join(COMPONENTS_DIRECTORY, "addons", "tests_component_C"),
+                            os.path.join(self.__directory, "extras", "tests_component_C"))
+            added = []
+            for i in range(5):
+                added.extend(watcher.process_events(timeout=0.2).added)
+            self.assertListEqual(added, [])
+        finally:
+            watcher.stop()
+
+
+if __name__ == "__main__":
+    import manager.tests.utilities
+
+    unittest.main()
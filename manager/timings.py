@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**timings.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines the Components startup timings instrumentation and reporting objects.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import contextlib
+import os
+import time
+
+import foundations.verbose
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER",
+           "PHASES",
+           "CLOCKS",
+           "get_cpu_time",
+           "timer",
+           "get_total_time",
+           "get_critical_path",
+           "format_report"]
+
+LOGGER = foundations.verbose.install_logger()
+
+PHASES = ("parse", "import", "construct", "initialize", "activate")
+CLOCKS = ("wall", "cpu")
+
+
+def get_cpu_time():
+    """
+    | Returns the process user and system CPU time.
+    | The CPU time is process wide, phases timed concurrently from different threads overlap.
+
+    :return: CPU time.
+    :rtype: float
+    """
+
+    times = os.times()
+    return times[0] + times[1]
+
+
+@contextlib.contextmanager
+def timer(timings, phase):
+    """
+    Times the enclosed block wall and CPU time and stores them into given timings under given phase.
+
+    Usage::
+
+        >>> timings = {}
+        >>> with timer(timings, "import"):
+        ...     import tests_component_a
+        >>> timings
+        {u'import': {u'wall': 0.0012, u'cpu': 0.001}}
+
+    :param timings: Timings.
+    :type timings: dict
+    :param phase: Timed phase.
+    :type phase: unicode
+    """
+
+    wall, cpu = time.time(), get_cpu_time()
+    try:
+        yield
+    finally:
+        timings[phase] = {"wall": time.time() - wall, "cpu": get_cpu_time() - cpu}
+
+
+def get_total_time(timings, clock="wall"):
+    """
+    Returns given timings total time.
+
+    :param timings: Timings.
+    :type timings: dict
+    :param clock: Clock, **wall** or **cpu**.
+    :type clock: unicode
+    :return: Total time.
+    :rtype: float
+    """
+
+    return sum(value[clock] for value in timings.itervalues())
+
+
+def get_critical_path(order, requires, weights):
+    """
+    | Returns the critical path, the dependencies chain with the highest cumulated weight.
+    | Components are assumed to start as soon as all their dependencies are done, the critical path total weight
+        is the lowest achievable startup time.
+
+    Usage::
+
+        >>> get_critical_path(["a", "b", "c"], {"b": ["a"], "c": ["a"]}, {"a": 1, "b": 2, "c": 3})
+        ([u'a', u'c'], 4)
+
+    :param order: Components in dependency order.
+    :type order: list
+    :param requires: Components dependencies.
+    :type requires: dict
+    :param weights: Components weights.
+    :type weights: dict
+    :return: Critical path Components, critical path weight.
+    :rtype: tuple
+    """
+
+    costs, predecessors = {}, {}
+    for component in order:
+        if component not in weights:
+            continue
+
+        predecessor = None
+        for dependency in requires.get(component, ()):
+            if dependency in costs and (predecessor is None or costs[dependency] > costs[predecessor]):
+                predecessor = dependency
+        costs[component] = weights[component] + (costs[predecessor] if predecessor is not None else 0)
+        predecessors[component] = predecessor
+
+    if not costs:
+        return [], 0
+
+    component = max(costs, key=costs.get)
+    total, path = costs[component], []
+    while component is not None:
+        path.append(component)
+        component = predecessors[component]
+    return list(reversed(path)), total
+
+
+def format_report(timings, critical_path=None, clock="wall"):
+    """
+    Formats given Components timings into a report sorted by descending total time.
+
+    Usage::
+
+        >>> print(format_report({"core.tests_component_a": {"import": {"wall": 0.25, "cpu": 0.2}}}))
+        Component                    Total  import
+        core.tests_component_a      250.00  250.00
+
+    :param timings: Components timings.
+    :type timings: dict
+    :param critical_path: Critical path Components, critical path time.
+    :type critical_path: tuple
+    :param clock: Reported clock, **wall** or **cpu**.
+    :type clock: unicode
+    :return: Report, times are in milliseconds.
+    :rtype: unicode
+    """
+
+    phases = [phase for phase in PHASES if any(phase in value for value in timings.itervalues())]
+    width = max([len("Component")] + [len(component) for component in timings]) + 2
+
+    lines = ["{0}{1:>10}{2}".format("Component".ljust(width),
+                                    "Total",
+                                    "".join("{0:>12}".format(phase) for phase in phases))]
+    for component, value in sorted(timings.iteritems(), key=lambda x: (-get_total_time(x[1], clock), x[0])):
+        lines.append("{0}{1:>10.2f}{2}".format(
+            component.ljust(width),
+            get_total_time(value, clock) * 1000,
+            "".join("{0:>12.2f}".format(value[phase][clock] * 1000) if phase in value else "{0:>12}".format("-")
+                    for phase in phases)))
+
+    if critical_path is not None:
+        components, total = critical_path
+        lines.append("")
+        lines.append("Critical path: {0:.2f}ms".format(total * 1000))
+        lines.extend("    {0}".format(component) for component in components)
+    return "\n".join(lines)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**walkers.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines **Manager** package Components files discovery objects.
+
+**Others:**
+    :func:`os.scandir` definition is used when available, either from the standard library or from
+    the `scandir <https://pypi.python.org/pypi/scandir>`_ package, :func:`os.listdir` definition is used otherwise.
+"""
+
+from __future__ import unicode_literals
+
+import fnmatch
+import os
+
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
+import foundations.strings
+import foundations.verbose
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "list_directory", "get_ignored_directories_matcher", "components_walker"]
+
+LOGGER = foundations.verbose.install_logger()
+
+
+def list_directory(directory):
+    """
+    Lists given directory entries.
+
+    Usage::
+
+        >>> list_directory("./manager/tests/tests_manager/resources/components/core/tests_component_a")
+        [(u'__init__.py', False), (u'tests_component_a.py', False), (u'tests_component_a.rc', False)]
+
+    :param directory: Directory to list.
+    :type directory: unicode
+    :return: Sorted entries names and their directory state.
+    :rtype: list
+    """
+
+    if scandir is not None:
+        entries = [(entry.name, entry.is_dir()) for entry in scandir(directory)]
+    else:
+        entries = [(name, os.path.isdir(os.path.join(directory, name))) for name in os.listdir(directory)]
+    return sorted(entries)
+
+
+def get_ignored_directories_matcher(ignored_directories):
+    """
+    | Returns a definition matching directories names against given ignored directories names or glob patterns.
+    | Names are matched with a set lookup, glob patterns with :func:`fnmatch.fnmatchcase` definition.
+
+    Usage::
+
+        >>> is_ignored = get_ignored_directories_matcher(("extras", "tests_component_[ab]"))
+        >>> is_ignored("extras"), is_ignored("tests_component_a"), is_ignored("core")
+        (True, True, False)
+
+    :param ignored_directories: Ignored directories names or glob patterns.
+    :type ignored_directories: tuple or list
+    :return: Matching definition.
+    :rtype: object
+    """
+
+    ignored_names = set()
+    ignored_patterns = []
+    for item in ignored_directories or ():
+        if any(character in item for character in "*?["):
+            ignored_patterns.append(item)
+        else:
+            ignored_names.add(item)
+
+    return lambda name: name in ignored_names or any(fnmatch.fnmatchcase(name, pattern)
+                                                     for pattern in ignored_patterns)
+
+
+def components_walker(directory,
+                      extension="rc",
+                      ignored_directories=None,
+                      maximum_depth=None,
+                      listings=None,
+                      walked_directories=None):
+    """
+    | Defines a generator used to walk Components files using given extension.
+    | Directories matching given ignored directories names or glob patterns are not descended into.
+    | Listings of the directories containing Components files can be gathered into given dictionary,
+        keyed by normalized directory path and mapping entries names to their directory state.
+    | The walked directories normalized paths can be gathered into given list.
+
+    Usage::
+
+        >>> for file in components_walker("./manager/tests/tests_manager/resources/components"):
+        ...     print(file)
+        ...
+        ./manager/tests/tests_manager/resources/components/addons/tests_component_C/tests_component_c.rc
+        ./manager/tests/tests_manager/resources/components/core/tests_component_a/tests_component_a.rc
+        ./manager/tests/tests_manager/resources/components/core/tests_component_b/tests_component_b.rc
+        ./manager/tests/tests_manager/resources/components/extras/addons/tests_component_d/tests_component_d.rc
+        >>> for file in components_walker("./manager/tests/tests_manager/resources/components", maximum_depth=2):
+        ...     print(file)
+        ...
+        ./manager/tests/tests_manager/resources/components/addons/tests_component_C/tests_component_c.rc
+        ./manager/tests/tests_manager/resources/components/core/tests_component_a/tests_component_a.rc
+        ./manager/tests/tests_manager/resources/components/core/tests_component_b/tests_component_b.rc
+
+    :param directory: Directory to recursively walk.
+    :type directory: unicode
+    :param extension: Components files extension.
+    :type extension: unicode
+    :param ignored_directories: Ignored directories names or glob patterns.
+    :type ignored_directories: tuple or list
+    :param maximum_depth: Maximum depth below given directory, no limit if None.
+    :type maximum_depth: int
+    :param listings: Directories listings.
+    :type listings: dict
+    :param walked_directories: Walked directories.
+    :type walked_directories: list
+    :return: Component file.
+    :rtype: unicode
+    """
+
+    suffix = ".{0}".format(extension)
+    is_ignored = get_ignored_directories_matcher(ignored_directories)
+
+    stack = [(directory, 0)]
+    while stack:
+        parent_directory, depth = stack.pop()
+        try:
+            entries = list_directory(parent_directory)
+        except OSError as error:
+            LOGGER.warning("!> '{0}' directory cannot be listed: '{1}'".format(parent_directory, error))
+            continue
+
+        if walked_directories is not None:
+            walked_directories.append(os.path.normpath(parent_directory))
+
+        directories = []
+        for name, is_directory in entries:
+            if is_directory:
+                if maximum_depth is not None and depth >= maximum_depth:
+                    continue
+
+                if is_ignored(name):
+                    LOGGER.debug("> '{0}' directory ignored in '{1}'.".format(name, parent_directory))
+                    continue
+
+                directories.append(os.path.join(parent_directory, name))
+            elif name.endswith(suffix) and not name.startswith("._"):
+                if listings is not None:
+                    listings[os.path.normpath(parent_directory)] = dict(entries)
+
+                path = foundations.strings.to_forward_slashes(os.path.join(parent_directory, name))
+                LOGGER.debug("> '{0}' file filtered in!".format(path))
+                yield path
+
+        stack.extend((path, depth + 1) for path in reversed(directories))
@@ -0,0 +1,640 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**watcher.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines the :class:`ComponentsWatcher` class.
+
+**Others:**
+    `pyinotify <https://pypi.python.org/pypi/pyinotify>`_ package is used when available,
+    the :class:`ComponentsWatcher` class polls the Components otherwise.
+"""
+
+from __future__ import unicode_literals
+
+import os
+import Queue
+import sys
+import threading
+
+try:
+    import pyinotify
+except ImportError:
+    pyinotify = None
+
+import foundations.data_structures
+import foundations.exceptions
+import foundations.strings
+import foundations.verbose
+import manager.walkers
+from manager.globals.constants import Constants
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "ComponentsWatcher"]
+
+LOGGER = foundations.verbose.install_logger()
+
+
+class ComponentsWatcher(object):
+    """
+    | Defines a watcher monitoring :class:`manager.components_manager.Manager` class paths.
+    | Components files changes are registered, unregistered or updated through
+        :meth:`manager.components_manager.Manager.rescan` method, modules changes are reloaded with their
+        dependents through :meth:`manager.components_manager.Manager.reload_component` method.
+    | Changes are gathered with inotify when available, the Components are polled otherwise.
+    | When polling, the paths are only walked again when one of the walked directories modification time
+        changed, the registered Components files are checked otherwise. Modules changes are detected by
+        checking the Components directories modules files, directories are only listed again when their
+        modification time changed.
+
+    .. warning::
+
+        When threaded, changes are applied from the watcher thread, hosts requiring the Components to be
+        updated from their main thread should use a non threaded watcher and call
+        :meth:`ComponentsWatcher.process_events` method periodically.
+    """
+
+    def __init__(self, manager, debounce=0.25, interval=1.0, callback=None, threaded=True, use_inotify=True):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> manager = Manager(("./manager/tests/tests_manager/resources/components/core",))
+            >>> manager.register_components()
+            True
+            >>> watcher = ComponentsWatcher(manager)
+            >>> watcher.start()
+            True
+            >>> watcher.stop()
+            True
+
+        :param manager: Manager to watch.
+        :type manager: Manager
+        :param debounce: Delay in seconds without events before a burst of events is processed.
+        :type debounce: float
+        :param interval: Polling interval in seconds.
+        :type interval: float
+        :param callback: Callback object called with the applied changes.
+        :type callback: object
+        :param threaded: Events are processed in a dedicated thread.
+        :type threaded: bool
+        :param use_inotify: inotify is used when available.
+        :type use_inotify: bool
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__manager = manager
+        self.__debounce = None
+        self.debounce = debounce
+        self.__interval = None
+        self.interval = interval
+        self.__callback = callback
+        self.__threaded = threaded
+        self.__use_inotify = use_inotify and pyinotify is not None
+
+        self.__events = Queue.Queue()
+        self.__stop_event = threading.Event()
+        self.__thread = None
+        self.__notifier = None
+        self.__started = False
+        self.__modules_signatures = {}
+        self.__directories_signatures = None
+        self.__directories_listings = {}
+
+    @property
+    def manager(self):
+        """
+        Property for **self.__manager** attribute.
+
+        :return: self.__manager.
+        :rtype: Manager
+        """
+
+        return self.__manager
+
+    @manager.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def manager(self, value):
+        """
+        Setter for **self.__manager** attribute.
+
+        :param value: Attribute value.
+        :type value: Manager
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "manager"))
+
+    @manager.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def manager(self):
+        """
+        Deleter for **self.__manager** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "manager"))
+
+    @property
+    def debounce(self):
+        """
+        Property for **self.__debounce** attribute.
+
+        :return: self.__debounce.
+        :rtype: float
+        """
+
+        return self.__debounce
+
+    @debounce.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def debounce(self, value):
+        """
+        Setter for **self.__debounce** attribute.
+
+        :param value: Attribute value.
+        :type value: float
+        """
+
+        if value is not None:
+            assert type(value) in (int, float), "'{0}' attribute: '{1}' type is not 'int' or 'float'!".format(
+                "debounce", value)
+            assert value >= 0, "'{0}' attribute: '{1}' need to be positive!".format("debounce", value)
+        self.__debounce = value
+
+    @debounce.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def debounce(self):
+        """
+        Deleter for **self.__debounce** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "debounce"))
+
+    @property
+    def interval(self):
+        """
+        Property for **self.__interval** attribute.
+
+        :return: self.__interval.
+        :rtype: float
+        """
+
+        return self.__interval
+
+    @interval.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def interval(self, value):
+        """
+        Setter for **self.__interval** attribute.
+
+        :param value: Attribute value.
+        :type value: float
+        """
+
+        if value is not None:
+            assert type(value) in (int, float), "'{0}' attribute: '{1}' type is not 'int' or 'float'!".format(
+                "interval", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format("interval", value)
+        self.__interval = value
+
+    @interval.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def interval(self):
+        """
+        Deleter for **self.__interval** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "interval"))
+
+    @property
+    def running(self):
+        """
+        Property for **running** attribute.
+
+        :return: Watcher running state.
+        :rtype: bool
+        """
+
+        return self.__started
+
+    @running.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def running(self, value):
+        """
+        Setter for **running** attribute.
+
+        :param value: Attribute value.
+        :type value: bool
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "running"))
+
+    @running.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def running(self):
+        """
+        Deleter for **running** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "running"))
+
+    def __get_relative_segments(self, path):
+        """
+        Returns given path segments relative to the watched path containing it.
+
+        :param path: Path.
+        :type path: unicode
+        :return: Relative path segments.
+        :rtype: list
+        """
+
+        for directory in self.__manager.paths:
+            relative_path = os.path.relpath(path, directory)
+            if relative_path == os.curdir:
+                return []
+
+            if relative_path != os.pardir and not relative_path.startswith("{0}{1}".format(os.pardir, os.sep)):
+                return foundations.strings.to_forward_slashes(relative_path).split("/")
+        return []
+
+    def __is_ignored(self, path):
+        """
+        | Returns if given path is ignored.
+        | Only the path segments relative to the watched path containing it are matched against
+            :attr:`manager.components_manager.Manager.ignored_directories` attribute names or glob patterns.
+
+        :param path: Path.
+        :type path: unicode
+        :return: Is path ignored.
+        :rtype: bool
+        """
+
+        is_ignored = manager.walkers.get_ignored_directories_matcher(self.__manager.ignored_directories)
+        for name in self.__get_relative_segments(path):
+            if is_ignored(name) or name.startswith("._"):
+                return True
+        return False
+
+    def __queue_event(self, event):
+        """
+        Queues given inotify event path.
+
+        :param event: inotify event.
+        :type event: Event
+        """
+
+        path = event.pathname
+        if not isinstance(path, unicode):
+            path = path.decode(sys.getfilesystemencoding() or Constants.default_codec, Constants.codec_error)
+
+        if not self.__is_ignored(path):
+            self.__events.put(path)
+
+    def __get_events_paths(self, timeout=None):
+        """
+        Returns the queued events paths, waiting for given timeout and for the current burst of events to end.
+
+        :param timeout: Timeout in seconds.
+        :type timeout: float
+        :return: Events paths.
+        :rtype: set
+        """
+
+        paths = set()
+        try:
+            paths.add(self.__events.get(timeout=timeout) if timeout else self.__events.get_nowait())
+        except Queue.Empty:
+            return paths
+
+        while True:
+            try:
+                paths.add(self.__events.get(timeout=self.__debounce) if self.__debounce else
+                          self.__events.get_nowait())
+            except Queue.Empty:
+                return paths
+
+    def __list_directory(self, directory, is_ignored):
+        """
+        | Returns given directory modules files and sub directories.
+        | The listing is cached and only updated when the directory modification time changed.
+
+        :param directory: Directory.
+        :type directory: unicode
+        :param is_ignored: Ignored directories matching definition.
+        :type is_ignored: object
+        :return: Modules files and sub directories.
+        :rtype: tuple
+        """
+
+        signature = os.path.getmtime(directory)
+        listing = self.__directories_listings.get(directory)
+        if listing is not None and listing[0] == signature:
+            return listing[1:]
+
+        files, directories = [], []
+        for name, is_directory in manager.walkers.list_directory(directory):
+            if is_directory:
+                is_ignored(name) or directories.append(os.path.join(directory, name))
+            elif name.endswith(".py"):
+                files.append(os.path.join(directory, name))
+        self.__directories_listings[directory] = (signature, files, directories)
+        return files, directories
+
+    def __get_module_signature(self, profile):
+        """
+        | Returns given Component profile module signature.
+        | The modules files of the Component directory are stat'ed so that submodules changes are detected.
+
+        :param profile: Component profile.
+        :type profile: Profile
+        :return: Module signature.
+        :rtype: tuple
+        """
+
+        is_ignored = manager.walkers.get_ignored_directories_matcher(self.__manager.ignored_directories)
+        signature, stack = [], [profile.directory]
+        while stack:
+            try:
+                files, directories = self.__list_directory(stack.pop(), is_ignored)
+            except OSError:
+                continue
+
+            stack.extend(directories)
+            for path in files:
+                try:
+                    signature.append((path, os.path.getmtime(path)))
+                except OSError:
+                    continue
+        return tuple(sorted(signature))
+
+    def __get_directories_signatures(self):
+        """
+        Returns the Manager walked directories modification times.
+
+        :return: Directories signatures.
+        :rtype: dict
+        """
+
+        signatures = {}
+        for directory in self.__manager.walked_directories:
+            try:
+                signatures[directory] = os.path.getmtime(directory)
+            except OSError:
+                signatures[directory] = None
+        return signatures
+
+    def __get_owning_components(self, path):
+        """
+        Returns the Components owning given module path.
+
+        :param path: Module path.
+        :type path: unicode
+        :return: Components.
+        :rtype: list
+        """
+
+        path = foundations.strings.to_forward_slashes(path)
+        return [name for name, profile in self.__manager
+                if path.startswith("{0}/".format(foundations.strings.to_forward_slashes(profile.directory)))]
+
+    @foundations.exceptions.handle_exceptions(Exception)
+    def __reload_component(self, component):
+        """
+        Reloads given Component and its dependents.
+
+        :param component: Component name.
+        :type component: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        return self.__manager.reload_component(component)
+
+    def __reload_components(self, components):
+        """
+        Reloads given instantiated Components and their dependents.
+
+        :param components: Components names.
+        :type components: set
+        :return: Reloaded Components.
+        :rtype: list
+        """
+
+        ranks = self.__manager.dependency_graph.get_ranks()
+        reloaded = []
+        for component in sorted(components, key=lambda x: ranks.get(x, len(ranks))):
+            profile = self.__manager.get_profile(component)
+            if component in reloaded or profile is None or profile.module is None:
+                continue
+
+            if self.__reload_component(component):
+                reloaded.append(component)
+                reloaded.extend(dependent for dependent in self.__manager.list_dependents(component)
+                                if dependent not in reloaded and
+                                self.__manager.get_profile(dependent).module is not None)
+                self.__modules_signatures[component] = self.__get_module_signature(profile)
+        return reloaded
+
+    def __apply_changes(self, changes, modules=None):
+        """
+        Reloads the Components affected by given changes and notifies the callback.
+
+        :param changes: Changes as returned by :meth:`manager.components_manager.Manager.rescan` method.
+        :type changes: Structure
+        :param modules: Components with modified modules.
+        :type modules: set
+        :return: Applied changes.
+        :rtype: Structure
+        """
+
+        for component in changes.removed:
+            self.__modules_signatures.pop(component, None)
+
+        changes.reloaded = self.__reload_components(set(changes.modified).union(modules or ()))
+
+        if changes.added or changes.removed or changes.modified or changes.reloaded:
+            LOGGER.info("{0} | Components changes: added: '{1}', removed: '{2}', modified: '{3}', "
+                        "reloaded: '{4}'.".format(self.__class__.__name__,
+                                                  ", ".join(changes.added),
+                                                  ", ".join(changes.removed),
+                                                  ", ".join(changes.modified),
+                                                  ", ".join(changes.reloaded)))
+            self.__callback and self.__callback(changes)
+        return changes
+
+    def __process_paths(self, paths):
+        """
+        Processes given changed paths.
+
+        :param paths: Changed paths.
+        :type paths: set
+        :return: Applied changes.
+        :rtype: Structure
+        """
+
+        LOGGER.debug("> Processing changed paths: '{0}'.".format(", ".join(sorted(paths))))
+
+        suffix = ".{0}".format(self.__manager.extension)
+        maximum_depth = self.__manager.maximum_depth
+        registered_files = set(profile.file for name, profile in self.__manager)
+        files, modules = set(), set()
+        for path in paths:
+            path = foundations.strings.to_forward_slashes(path)
+            depth = len(self.__get_relative_segments(path))
+            if path.endswith(suffix):
+                if maximum_depth is None or depth - 1 <= maximum_depth or path in registered_files:
+                    files.add(path)
+            elif os.path.isdir(path):
+                if maximum_depth is not None and depth > maximum_depth:
+                    continue
+
+                files.update(manager.walkers.components_walker(path,
+                                                               self.__manager.extension,
+                                                               self.__manager.ignored_directories,
+                                                               None if maximum_depth is None else
+                                                               maximum_depth - depth))
+            elif path.endswith(".py"):
+                modules.update(self.__get_owning_components(path))
+            elif not os.path.exists(path):
+                files.update(file for file in registered_files if file.startswith("{0}/".format(path)))
+
+        return self.__apply_changes(self.__manager.rescan(sorted(files)), modules)
+
+    def __poll(self):
+        """
+        Polls the Components files and modules for changes.
+
+        :return: Applied changes.
+        :rtype: Structure
+        """
+
+        signatures = self.__directories_signatures
+        if signatures is not None and self.__get_directories_signatures() == signatures:
+            changes = self.__manager.rescan([profile.file for name, profile in self.__manager])
+        else:
+            changes = self.__manager.rescan()
+            self.__directories_signatures = self.__get_directories_signatures()
+
+        modules = set()
+        for name, profile in self.__manager:
+            if profile.module is None:
+                continue
+
+            signature = self.__get_module_signature(profile)
+            if self.__modules_signatures.setdefault(name, signature) != signature:
+                modules.add(name)
+
+        return self.__apply_changes(changes, modules)
+
+    def __run(self):
+        """
+        Processes the events until the watcher is stopped.
+        """
+
+        while not self.__stop_event.is_set():
+            self.process_events(self.__interval)
+
+    def process_events(self, timeout=None):
+        """
+        | Processes the pending events.
+        | When polling, the Components are polled after waiting for given timeout.
+
+        :param timeout: Timeout in seconds.
+        :type timeout: float
+        :return: Applied changes.
+        :rtype: Structure
+        """
+
+        if self.__use_inotify:
+            paths = self.__get_events_paths(timeout)
+            if not paths:
+                return foundations.data_structures.Structure(added=[], removed=[], modified=[], reloaded=[])
+
+            return self.__process_paths(paths)
+        else:
+            if timeout:
+                self.__stop_event.wait(timeout)
+            if self.__stop_event.is_set():
+                return foundations.data_structures.Structure(added=[], removed=[], modified=[], reloaded=[])
+
+            return self.__poll()
+
+    def start(self):
+        """
+        Starts the watcher.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if self.__started:
+            return True
+
+        self.__started = True
+        self.__stop_event.clear()
+        for name, profile in self.__manager:
+            if profile.module is not None:
+                self.__modules_signatures[name] = self.__get_module_signature(profile)
+
+        if self.__use_inotify:
+            LOGGER.debug("> Starting inotify watcher on '{0}' paths.".format(", ".join(self.__manager.paths)))
+
+            watch_manager = pyinotify.WatchManager()
+            mask = pyinotify.IN_CLOSE_WRITE | pyinotify.IN_CREATE | pyinotify.IN_DELETE | \
+                   pyinotify.IN_MOVED_FROM | pyinotify.IN_MOVED_TO
+            for path in self.__manager.paths:
+                watch_manager.add_watch(path, mask, proc_fun=self.__queue_event, rec=True, auto_add=True,
+                                        exclude_filter=self.__is_ignored)
+            self.__notifier = pyinotify.ThreadedNotifier(watch_manager)
+            self.__notifier.daemon = True
+            self.__notifier.start()
+        else:
+            LOGGER.debug("> Starting polling watcher on '{0}' paths.".format(", ".join(self.__manager.paths)))
+
+            self.__directories_signatures = None
+            if self.__manager.walked_directories:
+                self.__directories_signatures = self.__get_directories_signatures()
+
+        if self.__threaded:
+            self.__thread = threading.Thread(target=self.__run, name=self.__class__.__name__)
+            self.__thread.daemon = True
+            self.__thread.start()
+        return True
+
+    def stop(self):
+        """
+        Stops the watcher.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        self.__started = False
+        self.__stop_event.set()
+        if self.__notifier is not None:
+            self.__notifier.stop()
+            self.__notifier = None
+
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+        return True
@@ -60,6 +60,8 @@ setup(name=manager.globals.constants.Constants.application_name,
       include_package_data=True,
       packages=find_packages(),
       scripts=[],
+      entry_points={"console_scripts": ["manager_index = manager.index:main",
+                                        "manager_compile = manager.compiler:main"]},
       url="https://github.com/KelSolaar/Manager",
       license="GPLv3",
       description="Manager is the Components Manager package of Umbra, sIBL_GUI and sIBL_Reporter.",
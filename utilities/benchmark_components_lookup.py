@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**benchmark_components_lookup.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Benchmarks :meth:`manager.components_manager.Manager.get_interface`,
+    :meth:`manager.components_manager.Manager.match_profile` and
+    :meth:`manager.components_manager.Manager.filter_components` methods against the registered Components count.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import timeit
+
+from manager.components_manager import Manager
+from manager.globals.constants import Constants
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["get_manager", "get_command_line_arguments", "main"]
+
+
+def get_manager(count):
+    """
+    Returns a :class:`manager.components_manager.Manager` class instance with given count of Components.
+
+    :param count: Components count.
+    :type count: int
+    :return: Manager.
+    :rtype: Manager
+    """
+
+    directory = tempfile.mkdtemp()
+    try:
+        file = os.path.join(directory, "components.index")
+        with open(file, "w") as file_object:
+            json.dump({"format": Constants.index_format,
+                       "profiles": [{"name": "benchmark.component_{0}".format(i),
+                                     "file": "component_{0}/component_{0}.rc".format(i),
+                                     "directory": "component_{0}".format(i),
+                                     "package": "component_{0}".format(i),
+                                     "attribute": "Component{0}".format(i),
+                                     "require": [],
+                                     "version": "1.0"} for i in range(count)]}, file_object)
+
+        manager = Manager()
+        manager.load_index(file)
+    finally:
+        shutil.rmtree(directory)
+    return manager
+
+
+def get_command_line_arguments():
+    """
+    Retrieves command line arguments.
+
+    :return: Namespace.
+    :rtype: Namespace
+    """
+
+    parser = argparse.ArgumentParser(add_help=False)
+
+    parser.add_argument("-h",
+                        "--help",
+                        action="help",
+                        help="'Displays this help message and exit.'")
+
+    parser.add_argument("-c",
+                        "--counts",
+                        type=int,
+                        nargs="+",
+                        dest="counts",
+                        default=[10, 100, 1000, 10000],
+                        help="'Registered Components counts.'")
+
+    parser.add_argument("-n",
+                        "--number",
+                        type=int,
+                        dest="number",
+                        default=1000,
+                        help="'Lookups count per registry.'")
+
+    return parser.parse_args(sys.argv[1:])
+
+
+def main():
+    """
+    Starts the benchmark.
+
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    args = get_command_line_arguments()
+
+    for count in args.counts:
+        manager = get_manager(count)
+        name = "benchmark.component_{0}".format(count // 2)
+        for method, argument in ((manager.get_interface, name),
+                                 (manager.match_profile, r"^{0}$".format(re.escape(name))),
+                                 (manager.filter_components, r"^{0}".format(re.escape(name))),
+                                 (manager.filter_components, r"{0}$".format(re.escape(name)))):
+            timing = min(timeit.repeat(lambda: method(argument), repeat=3, number=args.number))
+            sys.stdout.write("{0} Components | {1}('{2}'): {3:.3f}us per lookup.\n".format(
+                count, method.__name__, argument, timing / args.number * 1e6))
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(not main())
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**benchmark_manifests_parsing.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Benchmarks :func:`manager.parsers.read_manifest` definition against
+    :class:`foundations.parsers.SectionsFileParser` class on generated Components files.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import argparse
+import codecs
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+from foundations.parsers import SectionsFileParser
+from manager.parsers import read_manifest
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["MANIFEST_TEMPLATE",
+           "write_manifests",
+           "parse_with_sections_file_parser",
+           "parse_with_read_manifest",
+           "get_command_line_arguments",
+           "main"]
+
+MANIFEST_TEMPLATE = """[Component]
+Name = benchmark.component_{0}
+Title = Benchmark Component {0}
+Module = component_{0}
+Object = Component{0}
+Version = 1.0
+Require = benchmark.component_0
+
+[Informations]
+Author = Thomas Mansencal
+Email = thomas.mansencal@gmail.com
+Url = http://www.hdrlabs.com/
+Description = Benchmark Component {0}.
+"""
+
+
+def write_manifests(directory, count):
+    """
+    Writes given count of Components files into given directory.
+
+    :param directory: Output directory.
+    :type directory: unicode
+    :param count: Components files count.
+    :type count: int
+    :return: Components files.
+    :rtype: list
+    """
+
+    files = []
+    for i in range(count):
+        file = os.path.join(directory, "component_{0}.rc".format(i))
+        with codecs.open(file, "w", encoding="utf-8") as file_object:
+            file_object.write(MANIFEST_TEMPLATE.format(i))
+        files.append(file)
+    return files
+
+
+def parse_with_sections_file_parser(files):
+    """
+    Parses given Components files with :class:`foundations.parsers.SectionsFileParser` class.
+
+    :param files: Components files.
+    :type files: list
+    """
+
+    for file in files:
+        sections_file_parser = SectionsFileParser(file)
+        sections_file_parser.parse()
+        for attribute in ("Name", "Title", "Module", "Object", "Require", "Version"):
+            sections_file_parser.get_value(attribute, "Component", default=None)
+        for attribute in ("Author", "Email", "Url", "Description"):
+            sections_file_parser.get_value(attribute, "Informations", default=None)
+
+
+def parse_with_read_manifest(files):
+    """
+    Parses given Components files with :func:`manager.parsers.read_manifest` definition.
+
+    :param files: Components files.
+    :type files: list
+    """
+
+    for file in files:
+        manifest = read_manifest(file)
+        for attribute in ("Name", "Title", "Module", "Object", "Require", "Version"):
+            manifest.get("Component", {}).get(attribute)
+        for attribute in ("Author", "Email", "Url", "Description"):
+            manifest.get("Informations", {}).get(attribute)
+
+
+def get_command_line_arguments():
+    """
+    Retrieves command line arguments.
+
+    :return: Namespace.
+    :rtype: Namespace
+    """
+
+    parser = argparse.ArgumentParser(add_help=False)
+
+    parser.add_argument("-h",
+                        "--help",
+                        action="help",
+                        help="'Displays this help message and exit.'")
+
+    parser.add_argument("-c",
+                        "--count",
+                        type=int,
+                        dest="count",
+                        default=5000,
+                        help="'Generated Components files count.'")
+
+    parser.add_argument("-r",
+                        "--repeat",
+                        type=int,
+                        dest="repeat",
+                        default=3,
+                        help="'Benchmark repetitions, the best timing is retained.'")
+
+    return parser.parse_args(sys.argv[1:])
+
+
+def main():
+    """
+    Starts the benchmark.
+
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    args = get_command_line_arguments()
+
+    directory = tempfile.mkdtemp()
+    try:
+        files = write_manifests(directory, args.count)
+        timings = []
+        for parser in (parse_with_sections_file_parser, parse_with_read_manifest):
+            timing = min(timeit.repeat(lambda: parser(files), repeat=args.repeat, number=1))
+            timings.append(timing)
+            sys.stdout.write("{0}: {1:.3f}s for {2} files, {3:.1f}us per file.\n".format(
+                parser.__name__, timing, args.count, timing / args.count * 1e6))
+        sys.stdout.write("Speedup: {0:.2f}x.\n".format(timings[0] / timings[1]))
+    finally:
+        shutil.rmtree(directory)
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(not main())
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**benchmark_profiles_memory.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Benchmarks :class:`manager.components_manager.Profile` class memory footprint against a per instance
+    dictionary based layout storing the same attributes without strings interning.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import argparse
+import json
+import sys
+
+from manager.components_manager import Profile
+from manager.components_manager import StringsTable
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["DictionaryProfile", "get_profiles_data", "get_size", "get_command_line_arguments", "main"]
+
+
+class DictionaryProfile(object):
+    """
+    Stores the :class:`manager.components_manager.Profile` class attributes in a per instance dictionary.
+    """
+
+    def __init__(self, data):
+        """
+        Initializes the class.
+
+        :param data: Profile data.
+        :type data: dict
+        """
+
+        for attribute in Profile.__slots__:
+            if attribute in ("__dict__", "__weakref__", "__strings_table"):
+                continue
+
+            setattr(self, "_Profile{0}".format(attribute), data.get(attribute.lstrip("_")))
+        self._Profile__require = list(data.get("require") or ())
+        self._Profile__informations_loaded = True
+        self._Profile__timings = {}
+
+
+def get_profiles_data(count):
+    """
+    Returns given count of Components profiles data, strings are distinct objects as when read from files.
+
+    :param count: Components count.
+    :type count: int
+    :return: Profiles data.
+    :rtype: list
+    """
+
+    return json.loads(json.dumps([{"name": "benchmark.component_{0}".format(i),
+                                   "file": "component_{0}/component_{0}.rc".format(i),
+                                   "directory": "component_{0}".format(i),
+                                   "title": "Component {0}".format(i),
+                                   "package": "component_{0}".format(i),
+                                   "attribute": "Component{0}".format(i),
+                                   "require": [],
+                                   "version": "1.0",
+                                   "author": "Thomas Mansencal",
+                                   "email": "thomas.mansencal@gmail.com",
+                                   "url": "http://www.hdrlabs.com/",
+                                   "description": "Benchmark Component {0}.".format(i),
+                                   "category": "Default"} for i in range(count)]))
+
+
+def get_size(objects):
+    """
+    | Returns given objects deep memory size, shared objects are counted once.
+    | :class:`manager.components_manager.Profile` class instances dictionary is not accessed as it would be
+        created.
+
+    :param objects: Objects.
+    :type objects: list
+    :return: Size in bytes.
+    :rtype: int
+    """
+
+    size, visited, stack = 0, set(), list(objects)
+    while stack:
+        object = stack.pop()
+        if id(object) in visited or object is None or isinstance(object, (bool, type)):
+            continue
+
+        visited.add(id(object))
+        size += sys.getsizeof(object)
+        if isinstance(object, dict):
+            stack.extend(object.iterkeys())
+            stack.extend(object.itervalues())
+        elif isinstance(object, (list, tuple, set)):
+            stack.extend(object)
+        elif isinstance(object, DictionaryProfile):
+            stack.append(object.__dict__)
+        elif isinstance(object, StringsTable):
+            stack.append(object.strings)
+        elif isinstance(object, Profile):
+            stack.extend(getattr(object, "_Profile{0}".format(attribute))
+                         for attribute in Profile.__slots__ if attribute not in ("__dict__", "__weakref__"))
+    return size
+
+
+def get_command_line_arguments():
+    """
+    Retrieves command line arguments.
+
+    :return: Namespace.
+    :rtype: Namespace
+    """
+
+    parser = argparse.ArgumentParser(add_help=False)
+
+    parser.add_argument("-h",
+                        "--help",
+                        action="help",
+                        help="'Displays this help message and exit.'")
+
+    parser.add_argument("-c",
+                        "--counts",
+                        type=int,
+                        nargs="+",
+                        dest="counts",
+                        default=[1000, 10000, 100000],
+                        help="'Components profiles counts.'")
+
+    return parser.parse_args(sys.argv[1:])
+
+
+def main():
+    """
+    Starts the benchmark.
+
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    args = get_command_line_arguments()
+
+    for count in args.counts:
+        data = get_profiles_data(count)
+        dictionary_profiles = [DictionaryProfile(profile_data) for profile_data in get_profiles_data(count)]
+
+        profiles, strings_table = [], StringsTable()
+        for profile_data in data:
+            profile = Profile()
+            profile.strings_table = strings_table
+            profile.deserialize_profile(profile_data)
+            profile.category = profile_data["category"]
+            profiles.append(profile)
+
+        dictionary_size, size = get_size(dictionary_profiles), get_size(profiles)
+        sys.stdout.write("{0} Profiles | dictionary layout: {1:.1f}KiB, {2} bytes per Profile | "
+                         "slots layout: {3:.1f}KiB, {4} bytes per Profile | {5:.1f}% saved.\n".format(
+            count, dictionary_size / 1024., dictionary_size // count, size / 1024., size // count,
+            (1 - float(size) / dictionary_size) * 100))
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(not main())